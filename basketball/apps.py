@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class BasketballConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'basketball'
+
+    def ready(self):
+        from django.core import checks
+        from django.db.backends.signals import connection_created
+
+        from basketball.controllers.connection import count_connection
+        from basketball.models import RankingPrueba
+        from basketball.services.cache_respuestas import comprobar_cache, registrar_modelos
+        from basketball.services.rankings import registrar_senales
+        # Los rankings se derivan de PruebaFisica: sus respuestas dependen de ese modelo
+        registrar_modelos(modelo for modelo in self.get_models() if modelo is not RankingPrueba)
+        registrar_senales()
+        connection_created.connect(count_connection, dispatch_uid='basketball-connection-stats')
+        checks.register(comprobar_cache, checks.Tags.caches)
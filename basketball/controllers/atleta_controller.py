@@ -2,11 +2,24 @@
 Controladores para Atleta - Usando DAO Genérico
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 
+from django.db.models import F, QuerySet
+
 from basketball.models import Atleta, GrupoAtleta
-from basketball.dao import AtletaDAO, GrupoAtletaDAO
+from basketball.dao import (
+    AtletaDAO, GrupoAtletaDAO, InscripcionDAO, PruebaAntropometricaDAO, PruebaFisicaDAO
+)
+from basketball.dao.concurrency import run_concurrently
+
+
+# Columnas de la exportación de atletas
+COLUMNAS_EXPORTACION = [
+    'id', 'nombre_atleta', 'apellido_atleta', 'dni', 'fecha_nacimiento', 'edad', 'sexo',
+    'email', 'telefono', 'tipo_sangre', 'grupo_id', 'grupo_nombre', 'estado',
+]
 
 
 class AtletaController:
@@ -15,6 +28,9 @@ class AtletaController:
     def __init__(self):
         self.dao = AtletaDAO()
         self.grupo_dao = GrupoAtletaDAO()
+        self.inscripcion_dao = InscripcionDAO()
+        self.prueba_fisica_dao = PruebaFisicaDAO()
+        self.prueba_antropometrica_dao = PruebaAntropometricaDAO()
     
     def _parse_date(self, date_value):
         """Convertir fecha de string a date si es necesario"""
@@ -46,18 +62,18 @@ class AtletaController:
     
     def obtener_atleta(self, atleta_id: int) -> Optional[Atleta]:
         """Obtener un atleta por ID"""
-        return self.dao.find_by_id(atleta_id)
+        return self.dao.with_profile('detail').find_by_id(atleta_id)
     
     def obtener_atleta_por_dni(self, dni: str) -> Optional[Atleta]:
         """Obtener un atleta por DNI"""
-        return self.dao.find_by_dni(dni)
+        return self.dao.with_profile('detail').find_by_dni(dni)
     
     def listar_atletas(self, activos_solo: bool = True) -> List[Atleta]:
         """Listar todos los atletas"""
-        return self.dao.find_all_as_list(active_only=activos_solo)
+        return self.dao.with_profile('list').find_all_as_list(active_only=activos_solo)
     
-    def actualizar_atleta(self, atleta_id: int, data: dict) -> Optional[Atleta]:
-        """Actualizar un atleta existente"""
+    def actualizar_atleta(self, atleta_id: int, data: dict, version: Optional[int] = None) -> Optional[Atleta]:
+        """Actualizar un atleta existente (si se indica version, solo si la fila sigue en esa versión)"""
         data = data.copy()  # No modificar el original
         
         # Convertir fecha_nacimiento si viene como string
@@ -70,7 +86,7 @@ class AtletaController:
             if grupo_id:
                 data['grupo'] = self.grupo_dao.find_by_id(grupo_id)
         
-        return self.dao.update_from_dict(atleta_id, data)
+        return self.dao.update_from_dict(atleta_id, data, expected_version=version)
     
     def eliminar_atleta(self, atleta_id: int, soft_delete: bool = True) -> bool:
         """Eliminar un atleta (soft delete por defecto)"""
@@ -78,7 +94,20 @@ class AtletaController:
     
     def buscar_atletas(self, criterios: dict) -> List[Atleta]:
         """Buscar atletas por criterios"""
-        return self.dao.search(criterios)
+        return self.dao.with_profile('list').search(criterios)
+    
+    def exportar_atletas(self, criterios: Optional[dict] = None) -> QuerySet:
+        """Filas (en el orden de COLUMNAS_EXPORTACION) de los atletas que cumplen los criterios"""
+        return (
+            self.dao.search_queryset(criterios or {})
+            .annotate(grupo_nombre=F('grupo__nombre'))
+            .order_by('id')
+            .values_list(*COLUMNAS_EXPORTACION)
+        )
+    
+    def buscar_por_texto(self, texto: str, limite: int = 20) -> List[Atleta]:
+        """Buscar atletas por nombre, apellido o DNI ordenados por relevancia"""
+        return self.dao.with_profile('list').search_text(texto, limite)
     
     def asignar_grupo(self, atleta_id: int, grupo_id: int) -> Optional[Atleta]:
         """Asignar un atleta a un grupo"""
@@ -89,21 +118,27 @@ class AtletaController:
     
     def obtener_atletas_por_grupo(self, grupo_id: int) -> List[Atleta]:
         """Obtener atletas de un grupo específico"""
-        return self.dao.find_by_grupo(grupo_id)
+        return self.dao.with_profile('list').find_by_grupo(grupo_id)
     
     def obtener_atletas_sin_grupo(self) -> List[Atleta]:
         """Obtener atletas sin grupo asignado"""
-        return self.dao.find_sin_grupo()
+        return self.dao.with_profile('list').find_sin_grupo()
     
     def obtener_atletas_por_rango_edad(self, edad_min: int, edad_max: int) -> List[Atleta]:
         """Obtener atletas por rango de edad"""
-        return self.dao.find_by_rango_edad(edad_min, edad_max)
+        return self.dao.with_profile('list').find_by_rango_edad(edad_min, edad_max)
     
     def paginar_atletas(
-        self, page: int = 1, page_size: int = 10, activos_solo: bool = True
+        self, page: int = 1, page_size: int = 10, activos_solo: bool = True,
+        criterios: Optional[dict] = None, cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Obtener atletas paginados"""
-        return self.dao.paginate(page, page_size, active_only=activos_solo)
+        """Obtener atletas paginados (por página o por cursor), opcionalmente filtrados"""
+        dao = self.dao.with_profile('list')
+        if criterios:
+            return dao.paginate(
+                page, page_size, queryset=dao.search_queryset(criterios), cursor=cursor
+            )
+        return dao.paginate(page, page_size, active_only=activos_solo, cursor=cursor)
     
     def contar_atletas(self, activos_solo: bool = True) -> int:
         """Contar total de atletas"""
@@ -116,6 +151,98 @@ class AtletaController:
     def restaurar_atleta(self, atleta_id: int) -> Optional[Atleta]:
         """Restaurar un atleta eliminado"""
         return self.dao.restore(atleta_id)
+    
+    def obtener_estadisticas_lote(
+        self, atleta_ids: Optional[List[int]] = None, grupo_id: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Estadísticas físicas y última prueba antropométrica de varios atletas.
+        Si se indica grupo_id se usan los atletas activos del grupo.
+        """
+        if grupo_id is not None:
+            atleta_ids = list(
+                self.dao.find_by_filters({'grupo_id': grupo_id}, active_only=True)
+                .values_list('id', flat=True)
+            )
+        atleta_ids = list(dict.fromkeys(atleta_ids or []))
+        
+        fisicas = self.prueba_fisica_dao.get_estadisticas_by_atletas(atleta_ids)
+        ultimas = self.prueba_antropometrica_dao.find_ultimas_by_atletas(atleta_ids)
+        return self._armar_estadisticas_lote(atleta_ids, fisicas, ultimas)
+    
+    def _armar_estadisticas_lote(self, atleta_ids: List[int], fisicas: dict, ultimas: dict) -> Dict[int, Dict[str, Any]]:
+        """Combinar estadísticas físicas y últimas pruebas antropométricas por atleta"""
+        return {
+            atleta_id: {
+                'estadisticas_fisicas': fisicas.get(atleta_id, {}),
+                'ultima_prueba_antropometrica': ultimas.get(atleta_id),
+            }
+            for atleta_id in atleta_ids
+        }
+    
+    def obtener_perfil(self, atleta_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Perfil completo de un atleta: datos, grupo, inscripciones, última prueba
+        antropométrica y estadísticas físicas.
+        
+        Son cinco consultas independientes (ninguna necesita el resultado de
+        otra) que se ejecutan a la vez. Devuelve None si el atleta no existe.
+        """
+        atleta, grupo, inscripciones, ultima, estadisticas = run_concurrently(
+            lambda: self.dao.with_profile('detail').find_by_id(atleta_id),
+            lambda: self.grupo_dao.with_profile('detail').find_by_atleta(atleta_id),
+            lambda: self.inscripcion_dao.with_profile('list').find_by_atleta(atleta_id),
+            lambda: self.prueba_antropometrica_dao.with_profile('detail').find_ultima_by_atleta(atleta_id),
+            lambda: self.prueba_fisica_dao.get_estadisticas_by_atleta(atleta_id),
+        )
+        if atleta is None:
+            return None
+        return {
+            'atleta': atleta,
+            'grupo': grupo,
+            'inscripciones': inscripciones,
+            'ultima_prueba_antropometrica': ultima,
+            'estadisticas_fisicas': estadisticas,
+        }
+    
+    # ==================== LECTURAS ASÍNCRONAS ====================
+    
+    async def aobtener_atleta(self, atleta_id: int) -> Optional[Atleta]:
+        """Versión asíncrona de obtener_atleta"""
+        return await self.dao.with_profile('detail').afind_by_id(atleta_id)
+    
+    async def apaginar_atletas(
+        self, page: int = 1, page_size: int = 10, activos_solo: bool = True,
+        criterios: Optional[dict] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Versión asíncrona de paginar_atletas"""
+        dao = self.dao.with_profile('list')
+        if criterios:
+            return await dao.apaginate(
+                page, page_size, queryset=dao.search_queryset(criterios), cursor=cursor
+            )
+        return await dao.apaginate(page, page_size, active_only=activos_solo, cursor=cursor)
+    
+    async def aobtener_estadisticas_lote(
+        self, atleta_ids: Optional[List[int]] = None, grupo_id: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Versión asíncrona de obtener_estadisticas_lote.
+        Las estadísticas físicas y las últimas pruebas antropométricas se consultan a la vez.
+        """
+        if grupo_id is not None:
+            atleta_ids = [
+                atleta_id async for atleta_id in
+                self.dao.find_by_filters({'grupo_id': grupo_id}, active_only=True)
+                .values_list('id', flat=True)
+            ]
+        atleta_ids = list(dict.fromkeys(atleta_ids or []))
+        
+        fisicas, ultimas = await asyncio.gather(
+            self.prueba_fisica_dao.aget_estadisticas_by_atletas(atleta_ids),
+            self.prueba_antropometrica_dao.afind_ultimas_by_atletas(atleta_ids),
+        )
+        return self._armar_estadisticas_lote(atleta_ids, fisicas, ultimas)
 
 
 # Instancia singleton para uso directo (compatibilidad con código existente)
@@ -0,0 +1,81 @@
+"""
+Carga masiva de pruebas - resolución de atletas y reporte por fila
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db import transaction
+
+from basketball.dao import AtletaDAO, GenericDAO
+
+
+def columnas_permitidas(dao: GenericDAO) -> set:
+    """Columnas aceptadas en una carga: campos editables del modelo y el DNI del atleta"""
+    columnas = {'atleta_dni', 'atleta_id'}
+    for field in dao.model_class._meta.concrete_fields:
+        if field.editable and not field.primary_key and field.name not in dao.derived_fields:
+            columnas.update({field.name, field.attname})
+    return columnas
+
+
+def importar_pruebas(
+    dao: GenericDAO,
+    atleta_dao: AtletaDAO,
+    filas: List[Dict[str, Any]],
+    normalizar: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Importar pruebas de varios atletas en una sola transacción.
+    
+    Los atletas se identifican por atleta_dni (resueltos en una consulta) o
+    atleta_id. Las filas inválidas se reportan y no impiden cargar el resto.
+    En el reporte, 'fila' es la línea del archivo (el encabezado es la 1) para
+    las filas leídas de un CSV/XLSX (FilaArchivo) y el índice desde 0 en el
+    arreglo para las filas JSON.
+    
+    Returns:
+        {'total', 'creadas', 'errores': [{'fila': número, 'errores': {campo: [mensajes]}}]}
+    
+    Raises:
+        ValueError: Si alguna fila no es un objeto o trae columnas desconocidas
+    """
+    permitidas = columnas_permitidas(dao)
+    for fila in filas:
+        if not isinstance(fila, dict):
+            raise ValueError('Cada fila debe ser un objeto con los campos de la prueba')
+        desconocidas = set(fila) - permitidas
+        if desconocidas:
+            raise ValueError(f"Columnas desconocidas: {', '.join(sorted(desconocidas))}")
+    
+    atletas = atleta_dao.find_ids_by_dnis([
+        str(fila['atleta_dni']).strip() for fila in filas if fila.get('atleta_dni') not in (None, '')
+    ])
+    
+    errores = {}
+    pendientes = []
+    for indice, fila in enumerate(filas):
+        fila = dict(fila)
+        dni = fila.pop('atleta_dni', None)
+        if 'atleta_id' in fila:
+            fila['atleta'] = fila.pop('atleta_id')
+        if dni not in (None, ''):
+            dni = str(dni).strip()
+            if dni not in atletas:
+                errores[indice] = {'atleta_dni': [f'No existe un atleta con DNI {dni}.']}
+                continue
+            fila['atleta'] = atletas[dni]
+        pendientes.append((indice, normalizar(fila) if normalizar else fila))
+    
+    with transaction.atomic():
+        resultado = dao.bulk_ingest([fila for _, fila in pendientes])
+    for error in resultado['errores']:
+        errores[pendientes[error['fila']][0]] = error['errores']
+    
+    return {
+        'total': len(filas),
+        'creadas': resultado['creados'],
+        'errores': [
+            {'fila': getattr(filas[indice], 'numero', indice), 'errores': errores[indice]}
+            for indice in sorted(errores)
+        ],
+    }
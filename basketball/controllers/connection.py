@@ -2,13 +2,297 @@
 Conexión a base de datos y utilidades de conexión
 """
 
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+import logging
+import os
+import threading
+import time
+
 from django.db import connection, connections
 from django.db.utils import OperationalError
-import logging
 
 logger = logging.getLogger(__name__)
 
 
+class PoolTimeoutError(OperationalError):
+    """No se obtuvo una conexión del pool dentro del tiempo de espera"""
+    pass
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones independiente del driver.
+    
+    Reutiliza las conexiones devueltas (la más reciente primero), abre nuevas
+    hasta ``max_size`` y, con el pool lleno, espera hasta ``timeout`` segundos
+    a que se libere una. Antes de entregar una conexión ociosa ejecuta
+    ``check``; si falla, la descarta y abre otra. Las conexiones ociosas más
+    de ``max_idle`` segundos se cierran mientras queden más de ``min_size``, y
+    ninguna se reutiliza después de ``max_lifetime`` segundos.
+    
+    Args:
+        connect: Función que abre una conexión nueva
+        check: Función que verifica una conexión (False o excepción = inválida)
+        reset: Función que limpia una conexión al devolverla (p. ej. rollback)
+        close: Función que cierra una conexión (default: conn.close())
+    """
+    
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 3600.0,
+        check: Optional[Callable[[Any], bool]] = None,
+        reset: Optional[Callable[[Any], None]] = None,
+        close: Optional[Callable[[Any], None]] = None,
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Se requiere 0 <= min_size <= max_size y max_size >= 1")
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check = check
+        self.reset = reset
+        self._close_conn = close or (lambda conn: conn.close())
+        
+        self._cond = threading.Condition()
+        # (conexión, creada, devuelta); la derecha es la más reciente
+        self._idle: deque = deque()
+        self._in_use: Dict[int, float] = {}
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+        self._counters = {
+            'created': 0, 'closed': 0, 'checkouts': 0, 'timeouts': 0, 'failed_checks': 0,
+        }
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+    
+    def getconn(self) -> Any:
+        """
+        Obtener una conexión del pool.
+        
+        Raises:
+            PoolTimeoutError: Si no se libera ninguna conexión a tiempo
+        """
+        inicio = time.monotonic()
+        limite = inicio + self.timeout
+        while True:
+            conn, creada, expiradas = self._reservar(limite)
+            self._cerrar(expiradas)
+            
+            if conn is None:
+                try:
+                    conn = self.connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                creada = time.monotonic()
+                with self._cond:
+                    self._counters['created'] += 1
+            elif not self._verificar(conn):
+                with self._cond:
+                    self._counters['failed_checks'] += 1
+                    self._size -= 1
+                    self._cond.notify()
+                self._cerrar([conn])
+                continue
+            
+            espera = time.monotonic() - inicio
+            with self._cond:
+                self._in_use[id(conn)] = creada
+                self._counters['checkouts'] += 1
+                self._wait_total += espera
+                self._wait_max = max(self._wait_max, espera)
+            return conn
+    
+    def putconn(self, conn: Any, discard: bool = False) -> None:
+        """Devolver una conexión al pool (``discard`` la cierra en lugar de reutilizarla)"""
+        if not discard and self.reset is not None:
+            try:
+                self.reset(conn)
+            except Exception as e:
+                logger.warning(f"Conexión descartada al devolverla al pool: {e}")
+                discard = True
+        
+        ahora = time.monotonic()
+        with self._cond:
+            creada = self._in_use.pop(id(conn), None)
+            if creada is None:
+                cerrar = [conn]
+            elif discard or self._closed or ahora - creada >= self.max_lifetime:
+                self._size -= 1
+                cerrar = [conn]
+            else:
+                self._idle.append((conn, creada, ahora))
+                cerrar = []
+            cerrar.extend(self._expiradas(ahora))
+            self._cond.notify()
+        self._cerrar(cerrar)
+    
+    def reap(self) -> int:
+        """Cerrar las conexiones ociosas expiradas; devuelve cuántas se cerraron"""
+        with self._cond:
+            expiradas = self._expiradas(time.monotonic())
+        self._cerrar(expiradas)
+        return len(expiradas)
+    
+    def close(self) -> None:
+        """Cerrar las conexiones ociosas; las que están en uso se cierran al devolverse"""
+        with self._cond:
+            self._closed = True
+            ociosas = [conn for conn, _, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(ociosas)
+            self._cond.notify_all()
+        self._cerrar(ociosas)
+    
+    def stats(self) -> dict:
+        """Estado y contadores del pool"""
+        with self._cond:
+            checkouts = self._counters['checkouts']
+            return {
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **self._counters,
+                "wait_ms_avg": round(self._wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+            }
+    
+    def _reservar(self, limite: float):
+        """Tomar una conexión ociosa o un lugar para abrir una nueva, esperando si hace falta"""
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise PoolTimeoutError("El pool de conexiones está cerrado")
+                    expiradas = self._expiradas(time.monotonic())
+                    if self._idle:
+                        conn, creada, _ = self._idle.pop()
+                        return conn, creada, expiradas
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None, None, expiradas
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        self._counters['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"No hay conexiones libres en el pool tras {self.timeout}s "
+                            f"({self._size} en uso)"
+                        )
+                    self._cerrar_sin_lock(expiradas)
+                    self._cond.wait(restante)
+            finally:
+                self._waiting -= 1
+    
+    def _expiradas(self, ahora: float) -> list:
+        """Sacar del pool las conexiones ociosas vencidas (requiere el lock)"""
+        expiradas = []
+        conservar = deque()
+        while self._idle:
+            conn, creada, devuelta = self._idle.popleft()
+            vencida = ahora - creada >= self.max_lifetime
+            ociosa = ahora - devuelta >= self.max_idle and self._size > self.min_size
+            if vencida or ociosa:
+                expiradas.append(conn)
+                self._size -= 1
+            else:
+                conservar.append((conn, creada, devuelta))
+        self._idle = conservar
+        return expiradas
+    
+    def _cerrar_sin_lock(self, conexiones: list) -> None:
+        # Las conexiones vencidas se cierran aun si hay que seguir esperando
+        if conexiones:
+            self._cond.release()
+            try:
+                self._cerrar(conexiones)
+            finally:
+                self._cond.acquire()
+    
+    def _cerrar(self, conexiones: list) -> None:
+        for conn in conexiones:
+            try:
+                self._close_conn(conn)
+            except Exception as e:
+                logger.debug(f"Error cerrando conexión del pool: {e}")
+        if conexiones:
+            with self._cond:
+                self._counters['closed'] += len(conexiones)
+    
+    def _verificar(self, conn: Any) -> bool:
+        if self.check is None:
+            return True
+        try:
+            return self.check(conn) is not False
+        except Exception as e:
+            logger.warning(f"Conexión del pool descartada por health check: {e}")
+            return False
+
+
+_pools: Dict[tuple, tuple] = {}
+_pools_lock = threading.Lock()
+
+# Conexiones abiertas por alias desde el arranque del proceso (señal connection_created)
+_created: Dict[str, int] = {}
+
+
+def get_pool(alias: str, factory: Callable[[], ConnectionPool], config: Any = None) -> ConnectionPool:
+    """
+    Obtener el pool de un alias, creándolo con ``factory`` la primera vez.
+    
+    Si ``config`` cambia (por ejemplo, el runner de tests cambia NAME) el
+    pool anterior se cierra y se crea otro. Cada proceso tiene su propio
+    pool: uno heredado de un fork no se reutiliza.
+    """
+    clave = (alias, os.getpid())
+    actual = _pools.get(clave)
+    if actual is not None and actual[0] == config:
+        return actual[1]
+    with _pools_lock:
+        actual = _pools.get(clave)
+        if actual is not None and actual[0] == config:
+            return actual[1]
+        pool = factory()
+        _pools[clave] = (config, pool)
+    if actual is not None:
+        actual[1].close()
+    return pool
+
+
+def _current_pool(alias: str) -> Optional[ConnectionPool]:
+    actual = _pools.get((alias, os.getpid()))
+    return actual[1] if actual is not None else None
+
+
+def close_pools() -> None:
+    """Cerrar y olvidar todos los pools del proceso"""
+    with _pools_lock:
+        pools = [pool for _, pool in _pools.values()]
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def count_connection(sender, connection, **kwargs) -> None:
+    """Receptor de connection_created: cuenta las conexiones nuevas por alias"""
+    _created[connection.alias] = _created.get(connection.alias, 0) + 1
+
+
 class DatabaseConnection:
     """Clase para gestionar la conexión a la base de datos"""
     
@@ -82,3 +366,28 @@ class ConnectionManager:
         except Exception as e:
             logger.error(f"Error probando conexión {alias}: {e}")
             return False
+    
+    @staticmethod
+    def pool_stats() -> dict:
+        """
+        Estado de las conexiones de cada alias.
+        
+        Los alias con pool (OPTIONS['pool']) informan conexiones en uso,
+        ociosas, en espera y el tiempo de espera para obtener una. El resto
+        informa la configuración de conexiones persistentes y cuántas se han
+        abierto desde el arranque.
+        """
+        result = {}
+        for alias in connections:
+            settings_dict = connections.settings[alias]
+            pool = _current_pool(alias)
+            if pool is not None:
+                result[alias] = {"pooled": True, **pool.stats()}
+            else:
+                result[alias] = {
+                    "pooled": bool(settings_dict.get('OPTIONS', {}).get('pool')),
+                    "conn_max_age": settings_dict.get('CONN_MAX_AGE', 0),
+                    "health_checks": settings_dict.get('CONN_HEALTH_CHECKS', False),
+                    "created": _created.get(alias, 0),
+                }
+        return result
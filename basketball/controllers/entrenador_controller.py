@@ -39,15 +39,24 @@ class EntrenadorController:
     
     def obtener_entrenador(self, entrenador_id: int) -> Optional[Entrenador]:
         """Obtener un entrenador por ID"""
-        return self.dao.find_by_id(entrenador_id)
+        return self.dao.with_profile('detail').find_by_id(entrenador_id)
     
     def obtener_entrenador_por_usuario(self, usuario_id: int) -> Optional[Entrenador]:
         """Obtener un entrenador por ID de usuario"""
-        return self.dao.find_by_usuario(usuario_id)
+        return self.dao.with_profile('detail').find_by_usuario(usuario_id)
     
     def listar_entrenadores(self) -> List[Entrenador]:
         """Listar todos los entrenadores"""
-        return list(self.dao.find_all().filter(usuario__estado=True))
+        return list(self.dao.with_profile('list').find_all().filter(usuario__estado=True))
+    
+    def paginar_entrenadores(
+        self, page: int = 1, page_size: int = 10, criterios: Optional[dict] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener entrenadores paginados (por página o por cursor), opcionalmente filtrados"""
+        return self.dao.paginate(
+            page, page_size, queryset=self._buscar_queryset(criterios or {}), cursor=cursor
+        )
     
     def actualizar_entrenador(self, entrenador_id: int, data: dict) -> Optional[Entrenador]:
         """Actualizar un entrenador existente"""
@@ -92,7 +101,11 @@ class EntrenadorController:
     
     def buscar_entrenadores(self, criterios: dict) -> List[Entrenador]:
         """Buscar entrenadores por criterios"""
-        queryset = self.dao.find_all().filter(usuario__estado=True)
+        return list(self._buscar_queryset(criterios))
+    
+    def _buscar_queryset(self, criterios: dict):
+        """QuerySet de entrenadores activos filtrado por criterios"""
+        queryset = self.dao.with_profile('list').find_all().filter(usuario__estado=True)
         
         if criterios.get('especialidad'):
             queryset = queryset.filter(especialidad__icontains=criterios['especialidad'])
@@ -101,15 +114,15 @@ class EntrenadorController:
         if criterios.get('nombre'):
             queryset = queryset.filter(usuario__nombre__icontains=criterios['nombre'])
         
-        return list(queryset)
+        return queryset
     
     def buscar_por_especialidad(self, especialidad: str) -> List[Entrenador]:
         """Buscar entrenadores por especialidad"""
-        return self.dao.find_by_especialidad(especialidad)
+        return self.dao.with_profile('list').find_by_especialidad(especialidad)
     
     def buscar_por_club(self, club: str) -> List[Entrenador]:
         """Buscar entrenadores por club"""
-        return self.dao.find_by_club(club)
+        return self.dao.with_profile('list').find_by_club(club)
 
 
 # Instancia singleton para compatibilidad
@@ -26,15 +26,24 @@ class EstudianteVinculacionController:
     
     def obtener_estudiante(self, estudiante_id: int) -> Optional[EstudianteVinculacion]:
         """Obtener un estudiante por ID"""
-        return self.dao.find_by_id(estudiante_id)
+        return self.dao.with_profile('detail').find_by_id(estudiante_id)
     
     def obtener_estudiante_por_usuario(self, usuario_id: int) -> Optional[EstudianteVinculacion]:
         """Obtener un estudiante por ID de usuario"""
-        return self.dao.find_by_usuario(usuario_id)
+        return self.dao.with_profile('detail').find_by_usuario(usuario_id)
     
     def listar_estudiantes(self) -> List[EstudianteVinculacion]:
         """Listar todos los estudiantes"""
-        return list(self.dao.find_all().filter(usuario__estado=True))
+        return list(self.dao.with_profile('list').find_all().filter(usuario__estado=True))
+    
+    def paginar_estudiantes(
+        self, page: int = 1, page_size: int = 10, criterios: Optional[dict] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener estudiantes paginados (por página o por cursor), opcionalmente filtrados"""
+        return self.dao.paginate(
+            page, page_size, queryset=self._buscar_queryset(criterios or {}), cursor=cursor
+        )
     
     def actualizar_estudiante(self, estudiante_id: int, data: dict) -> Optional[EstudianteVinculacion]:
         """Actualizar un estudiante existente"""
@@ -46,7 +55,11 @@ class EstudianteVinculacionController:
     
     def buscar_estudiantes(self, criterios: dict) -> List[EstudianteVinculacion]:
         """Buscar estudiantes por criterios"""
-        queryset = self.dao.find_all().filter(usuario__estado=True)
+        return list(self._buscar_queryset(criterios))
+    
+    def _buscar_queryset(self, criterios: dict):
+        """QuerySet de estudiantes activos filtrado por criterios"""
+        queryset = self.dao.with_profile('list').find_all().filter(usuario__estado=True)
         
         if criterios.get('carrera'):
             queryset = queryset.filter(carrera__icontains=criterios['carrera'])
@@ -55,15 +68,15 @@ class EstudianteVinculacionController:
         if criterios.get('nombre'):
             queryset = queryset.filter(usuario__nombre__icontains=criterios['nombre'])
         
-        return list(queryset)
+        return queryset
     
     def buscar_por_carrera(self, carrera: str) -> List[EstudianteVinculacion]:
         """Buscar estudiantes por carrera"""
-        return self.dao.find_by_carrera(carrera)
+        return self.dao.with_profile('list').find_by_carrera(carrera)
     
     def buscar_por_semestre(self, semestre: str) -> List[EstudianteVinculacion]:
         """Buscar estudiantes por semestre"""
-        return self.dao.find_by_semestre(semestre)
+        return self.dao.with_profile('list').find_by_semestre(semestre)
 
 
 # Instancia singleton para compatibilidad
@@ -21,15 +21,15 @@ class GrupoAtletaController:
     
     def obtener_grupo(self, grupo_id: int) -> Optional[GrupoAtleta]:
         """Obtener un grupo por ID"""
-        return self.dao.find_by_id(grupo_id)
+        return self.dao.with_profile('detail').find_by_id(grupo_id)
     
     def listar_grupos(self, activos_solo: bool = True) -> List[GrupoAtleta]:
         """Listar todos los grupos"""
-        return self.dao.find_all_as_list(active_only=activos_solo)
+        return self.dao.with_profile('list').find_all_as_list(active_only=activos_solo)
     
-    def actualizar_grupo(self, grupo_id: int, data: dict) -> Optional[GrupoAtleta]:
-        """Actualizar un grupo existente"""
-        return self.dao.update_from_dict(grupo_id, data)
+    def actualizar_grupo(self, grupo_id: int, data: dict, version: Optional[int] = None) -> Optional[GrupoAtleta]:
+        """Actualizar un grupo existente (si se indica version, solo si la fila sigue en esa versión)"""
+        return self.dao.update_from_dict(grupo_id, data, expected_version=version)
     
     def eliminar_grupo(self, grupo_id: int, soft_delete: bool = True) -> bool:
         """Eliminar un grupo (soft delete por defecto)"""
@@ -37,7 +37,7 @@ class GrupoAtletaController:
     
     def obtener_atletas_grupo(self, grupo_id: int) -> List[Atleta]:
         """Obtener todos los atletas de un grupo"""
-        return self.atleta_dao.find_by_grupo(grupo_id)
+        return self.atleta_dao.with_profile('list').find_by_grupo(grupo_id)
     
     def agregar_atleta_grupo(self, grupo_id: int, atleta_id: int) -> bool:
         """Agregar un atleta a un grupo"""
@@ -58,19 +58,26 @@ class GrupoAtletaController:
     
     def buscar_grupos_por_categoria(self, categoria: str) -> List[GrupoAtleta]:
         """Buscar grupos por categoría"""
-        return self.dao.find_by_categoria(categoria)
+        return self.dao.with_profile('list').find_by_categoria(categoria)
     
     def buscar_grupos_por_edad(self, edad: int) -> List[GrupoAtleta]:
         """Buscar grupos que acepten una edad"""
-        return self.dao.find_by_edad(edad)
+        return self.dao.with_profile('list').find_by_edad(edad)
     
     def obtener_grupos_con_conteo(self) -> List[Dict[str, Any]]:
         """Obtener grupos con conteo de atletas"""
         return self.dao.get_grupos_con_atletas()
     
-    def paginar_grupos(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
-        """Obtener grupos paginados"""
-        return self.dao.paginate(page, page_size, active_only=True)
+    def paginar_grupos(
+        self, page: int = 1, page_size: int = 10, activos_solo: bool = True,
+        categoria: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener grupos paginados (por página o por cursor), opcionalmente por categoría"""
+        dao = self.dao.with_profile('list')
+        if categoria:
+            queryset = dao.find_by_filters({'categoria': categoria}, active_only=True)
+            return dao.paginate(page, page_size, queryset=queryset, cursor=cursor)
+        return dao.paginate(page, page_size, active_only=activos_solo, cursor=cursor)
 
 
 # Instancia singleton para compatibilidad
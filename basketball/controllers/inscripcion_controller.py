@@ -5,10 +5,19 @@ Controladores para Inscripción - Usando DAO Genérico
 from typing import List, Optional, Dict, Any
 from datetime import date
 
+from django.db.models import F, QuerySet
+
 from basketball.models import Inscripcion, Atleta, TipoInscripcion
 from basketball.dao import InscripcionDAO, AtletaDAO
 
 
+# Columnas de la exportación de inscripciones
+COLUMNAS_EXPORTACION = [
+    'id', 'atleta_id', 'atleta_dni', 'fecha_inscripcion', 'tipo_inscripcion',
+    'fecha_creacion', 'habilitada',
+]
+
+
 class InscripcionController:
     """Controlador para gestionar operaciones de Inscripción"""
     
@@ -35,23 +44,23 @@ class InscripcionController:
     
     def obtener_inscripcion(self, inscripcion_id: int) -> Optional[Inscripcion]:
         """Obtener una inscripción por ID"""
-        return self.dao.find_by_id(inscripcion_id)
+        return self.dao.with_profile('detail').find_by_id(inscripcion_id)
     
     def listar_inscripciones(self) -> List[Inscripcion]:
         """Listar todas las inscripciones"""
-        return self.dao.find_all_as_list()
+        return self.dao.with_profile('list').find_all_as_list()
     
     def listar_inscripciones_habilitadas(self) -> List[Inscripcion]:
         """Listar inscripciones habilitadas"""
-        return self.dao.find_habilitadas()
+        return self.dao.with_profile('list').find_habilitadas()
     
     def listar_inscripciones_pendientes(self) -> List[Inscripcion]:
         """Listar inscripciones pendientes de habilitación"""
-        return self.dao.find_pendientes()
+        return self.dao.with_profile('list').find_pendientes()
     
-    def actualizar_inscripcion(self, inscripcion_id: int, data: dict) -> Optional[Inscripcion]:
-        """Actualizar una inscripción existente"""
-        return self.dao.update_from_dict(inscripcion_id, data)
+    def actualizar_inscripcion(self, inscripcion_id: int, data: dict, version: Optional[int] = None) -> Optional[Inscripcion]:
+        """Actualizar una inscripción existente (si se indica version, solo si la fila sigue en esa versión)"""
+        return self.dao.update_from_dict(inscripcion_id, data, expected_version=version)
     
     def habilitar_inscripcion(self, inscripcion_id: int) -> Optional[Inscripcion]:
         """Habilitar una inscripción"""
@@ -67,10 +76,23 @@ class InscripcionController:
     
     def obtener_inscripciones_atleta(self, atleta_id: int) -> List[Inscripcion]:
         """Obtener todas las inscripciones de un atleta"""
-        return self.dao.find_by_atleta(atleta_id)
+        return self.dao.with_profile('list').find_by_atleta(atleta_id)
     
     def buscar_inscripciones(self, criterios: dict) -> List[Inscripcion]:
         """Buscar inscripciones por criterios"""
+        return list(self.dao.with_profile('list').find_by_criteria(self._build_filters(criterios)))
+    
+    def exportar_inscripciones(self, criterios: Optional[dict] = None) -> QuerySet:
+        """Filas (en el orden de COLUMNAS_EXPORTACION) de las inscripciones que cumplen los criterios"""
+        return (
+            self.dao.find_by_criteria(self._build_filters(criterios or {}))
+            .annotate(atleta_dni=F('atleta__dni'))
+            .order_by('id')
+            .values_list(*COLUMNAS_EXPORTACION)
+        )
+    
+    def _build_filters(self, criterios: dict) -> Dict[str, Any]:
+        """Convertir criterios de búsqueda en filtros del DAO"""
         filters = {}
         
         if criterios.get('tipo_inscripcion'):
@@ -84,15 +106,25 @@ class InscripcionController:
         if criterios.get('atleta_id'):
             filters['atleta_id'] = criterios['atleta_id']
         
-        return list(self.dao.find_by_criteria(filters))
+        return filters
     
     def tiene_inscripcion_activa(self, atleta_id: int) -> bool:
         """Verificar si un atleta tiene inscripción activa"""
         return self.dao.tiene_inscripcion_activa(atleta_id)
     
-    def paginar_inscripciones(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
-        """Obtener inscripciones paginadas"""
-        return self.dao.paginate(page, page_size)
+    def paginar_inscripciones(
+        self, page: int = 1, page_size: int = 10, criterios: Optional[dict] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener inscripciones paginadas (por página o por cursor), opcionalmente filtradas"""
+        dao = self.dao.with_profile('list')
+        queryset = dao.find_by_criteria(self._build_filters(criterios or {}))
+        return dao.paginate(
+            page, page_size,
+            order_by=['-fecha_inscripcion', '-id'],
+            queryset=queryset,
+            cursor=cursor
+        )
 
 
 # Instancia singleton para compatibilidad
@@ -4,10 +4,20 @@ Controladores para Pruebas Antropométricas - Usando DAO Genérico
 
 from typing import List, Optional, Dict, Any
 
+from django.db.models import F, QuerySet
+
 from basketball.models import PruebaAntropometrica, Atleta
+from basketball.controllers.carga_masiva import importar_pruebas
 from basketball.dao import PruebaAntropometricaDAO, AtletaDAO
 
 
+# Columnas de la exportación (atleta_dni permite volver a cargar el archivo)
+COLUMNAS_EXPORTACION = [
+    'id', 'atleta_id', 'atleta_dni', 'fecha_registro', 'estatura', 'peso', 'altura_sentado',
+    'envergadura', 'indice_masa_corporal', 'indice_cornico', 'observaciones', 'estado',
+]
+
+
 class PruebaAntropometricaController:
     """Controlador para gestionar operaciones de Pruebas Antropométricas"""
     
@@ -24,19 +34,40 @@ class PruebaAntropometricaController:
         
         return self.dao.create_from_dict(data)
     
+    def cargar_pruebas(self, filas: List[dict]) -> Dict[str, Any]:
+        """Cargar varias pruebas en lote; devuelve un reporte por fila"""
+        return importar_pruebas(self.dao, self.atleta_dao, filas)
+    
     def obtener_prueba(self, prueba_id: int) -> Optional[PruebaAntropometrica]:
         """Obtener una prueba por ID"""
-        return self.dao.find_by_id(prueba_id)
+        return self.dao.with_profile('detail').find_by_id(prueba_id)
     
     def listar_pruebas(self, activas_solo: bool = True) -> List[PruebaAntropometrica]:
         """Listar todas las pruebas"""
-        return self.dao.find_all_as_list(active_only=activas_solo)
+        return self.dao.with_profile('list').find_all_as_list(active_only=activas_solo)
     
-    def actualizar_prueba(self, prueba_id: int, data: dict) -> Optional[PruebaAntropometrica]:
-        """Actualizar una prueba existente"""
+    def paginar_pruebas(
+        self, page: int = 1, page_size: int = 10, activas_solo: bool = True,
+        criterios: Optional[dict] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener pruebas paginadas (por página o por cursor), opcionalmente filtradas"""
+        dao = self.dao.with_profile('list')
+        if criterios:
+            queryset = dao.find_by_criteria(self._build_filters(criterios), active_only=True)
+        else:
+            queryset = dao.find_all(active_only=activas_solo)
+        return dao.paginate(
+            page, page_size,
+            order_by=['-fecha_registro', '-id'],
+            queryset=queryset,
+            cursor=cursor
+        )
+    
+    def actualizar_prueba(self, prueba_id: int, data: dict, version: Optional[int] = None) -> Optional[PruebaAntropometrica]:
+        """Actualizar una prueba existente (si se indica version, solo si la fila sigue en esa versión)"""
         # No permitir cambiar atleta_id
         data.pop('atleta_id', None)
-        return self.dao.update_from_dict(prueba_id, data)
+        return self.dao.update_from_dict(prueba_id, data, expected_version=version)
     
     def eliminar_prueba(self, prueba_id: int, soft_delete: bool = True) -> bool:
         """Eliminar una prueba (soft delete por defecto)"""
@@ -44,11 +75,11 @@ class PruebaAntropometricaController:
     
     def obtener_pruebas_atleta(self, atleta_id: int) -> List[PruebaAntropometrica]:
         """Obtener todas las pruebas de un atleta"""
-        return self.dao.find_by_atleta(atleta_id)
+        return self.dao.with_profile('list').find_by_atleta(atleta_id)
     
     def obtener_ultima_prueba_atleta(self, atleta_id: int) -> Optional[PruebaAntropometrica]:
         """Obtener la última prueba de un atleta"""
-        return self.dao.find_ultima_by_atleta(atleta_id)
+        return self.dao.with_profile('detail').find_ultima_by_atleta(atleta_id)
     
     def comparar_pruebas(self, prueba_id_1: int, prueba_id_2: int) -> dict:
         """Comparar dos pruebas antropométricas"""
@@ -82,6 +113,22 @@ class PruebaAntropometricaController:
     
     def buscar_pruebas(self, criterios: dict) -> List[PruebaAntropometrica]:
         """Buscar pruebas por criterios"""
+        return list(
+            self.dao.with_profile('list')
+            .find_by_criteria(self._build_filters(criterios), active_only=True)
+        )
+    
+    def exportar_pruebas(self, criterios: Optional[dict] = None) -> QuerySet:
+        """Filas (en el orden de COLUMNAS_EXPORTACION) de las pruebas que cumplen los criterios"""
+        return (
+            self.dao.find_by_criteria(self._build_filters(criterios or {}), active_only=True)
+            .annotate(atleta_dni=F('atleta__dni'))
+            .order_by('id')
+            .values_list(*COLUMNAS_EXPORTACION)
+        )
+    
+    def _build_filters(self, criterios: dict) -> Dict[str, Any]:
+        """Convertir criterios de búsqueda en filtros del DAO"""
         filters = {}
         
         if criterios.get('atleta_id'):
@@ -95,11 +142,13 @@ class PruebaAntropometricaController:
         if criterios.get('imc_max'):
             filters['indice_masa_corporal__lte'] = criterios['imc_max']
         
-        return list(self.dao.find_by_criteria(filters, active_only=True))
+        return filters
     
-    def obtener_estadisticas_atleta(self, atleta_id: int) -> Dict[str, Any]:
-        """Obtener estadísticas de un atleta"""
-        return self.dao.get_estadisticas_by_atleta(atleta_id)
+    def obtener_estadisticas_atleta(
+        self, atleta_id: int, fecha_desde=None, fecha_hasta=None
+    ) -> Dict[str, Any]:
+        """Obtener estadísticas de un atleta, opcionalmente en una ventana de fechas"""
+        return self.dao.get_estadisticas_by_atleta(atleta_id, fecha_desde, fecha_hasta)
     
     def obtener_promedio_imc_grupo(self, grupo_id: int) -> Optional[float]:
         """Obtener promedio de IMC de un grupo"""
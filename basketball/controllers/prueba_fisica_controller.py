@@ -4,8 +4,18 @@ Controladores para Pruebas Físicas - Usando DAO Genérico
 
 from typing import List, Optional, Dict, Any
 
-from basketball.models import PruebaFisica, Atleta, TipoPrueba
-from basketball.dao import PruebaFisicaDAO, AtletaDAO
+from django.db.models import F, QuerySet
+
+from basketball.models import PruebaFisica, Atleta, TipoPrueba, TIPOS_MENOR_ES_MEJOR
+from basketball.controllers.carga_masiva import importar_pruebas
+from basketball.dao import PruebaFisicaDAO, AtletaDAO, RankingPruebaDAO
+
+
+# Columnas de la exportación (atleta_dni permite volver a cargar el archivo)
+COLUMNAS_EXPORTACION = [
+    'id', 'atleta_id', 'atleta_dni', 'fecha_registro', 'tipo_prueba', 'resultado',
+    'unidad_medida', 'observaciones', 'estado',
+]
 
 
 class PruebaFisicaController:
@@ -14,6 +24,7 @@ class PruebaFisicaController:
     def __init__(self):
         self.dao = PruebaFisicaDAO()
         self.atleta_dao = AtletaDAO()
+        self.ranking_dao = RankingPruebaDAO()
     
     def crear_prueba(self, data: dict) -> PruebaFisica:
         """Crear una nueva prueba física"""
@@ -24,19 +35,46 @@ class PruebaFisicaController:
         
         return self.dao.create_from_dict(data)
     
+    def cargar_pruebas(self, filas: List[dict]) -> Dict[str, Any]:
+        """Cargar varias pruebas en lote; devuelve un reporte por fila"""
+        return importar_pruebas(self.dao, self.atleta_dao, filas, normalizar=self._normalizar_fila)
+    
+    def _normalizar_fila(self, fila: dict) -> dict:
+        """Aceptar el tipo de prueba sin importar mayúsculas (p. ej. 'velocidad')"""
+        if isinstance(fila.get('tipo_prueba'), str):
+            fila['tipo_prueba'] = fila['tipo_prueba'].strip().upper()
+        return fila
+    
     def obtener_prueba(self, prueba_id: int) -> Optional[PruebaFisica]:
         """Obtener una prueba por ID"""
-        return self.dao.find_by_id(prueba_id)
+        return self.dao.with_profile('detail').find_by_id(prueba_id)
     
     def listar_pruebas(self, activas_solo: bool = True) -> List[PruebaFisica]:
         """Listar todas las pruebas"""
-        return self.dao.find_all_as_list(active_only=activas_solo)
+        return self.dao.with_profile('list').find_all_as_list(active_only=activas_solo)
     
-    def actualizar_prueba(self, prueba_id: int, data: dict) -> Optional[PruebaFisica]:
-        """Actualizar una prueba existente"""
+    def paginar_pruebas(
+        self, page: int = 1, page_size: int = 10, activas_solo: bool = True,
+        criterios: Optional[dict] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Obtener pruebas paginadas (por página o por cursor), opcionalmente filtradas"""
+        dao = self.dao.with_profile('list')
+        if criterios:
+            queryset = dao.find_by_criteria(self._build_filters(criterios), active_only=True)
+        else:
+            queryset = dao.find_all(active_only=activas_solo)
+        return dao.paginate(
+            page, page_size,
+            order_by=['-fecha_registro', '-id'],
+            queryset=queryset,
+            cursor=cursor
+        )
+    
+    def actualizar_prueba(self, prueba_id: int, data: dict, version: Optional[int] = None) -> Optional[PruebaFisica]:
+        """Actualizar una prueba existente (si se indica version, solo si la fila sigue en esa versión)"""
         # No permitir cambiar atleta_id
         data.pop('atleta_id', None)
-        return self.dao.update_from_dict(prueba_id, data)
+        return self.dao.update_from_dict(prueba_id, data, expected_version=version)
     
     def eliminar_prueba(self, prueba_id: int, soft_delete: bool = True) -> bool:
         """Eliminar una prueba (soft delete por defecto)"""
@@ -44,15 +82,15 @@ class PruebaFisicaController:
     
     def obtener_pruebas_atleta(self, atleta_id: int) -> List[PruebaFisica]:
         """Obtener todas las pruebas de un atleta"""
-        return self.dao.find_by_atleta(atleta_id)
+        return self.dao.with_profile('list').find_by_atleta(atleta_id)
     
     def obtener_pruebas_por_tipo(self, atleta_id: int, tipo_prueba: str) -> List[PruebaFisica]:
         """Obtener pruebas de un atleta por tipo"""
-        return self.dao.find_by_atleta_y_tipo(atleta_id, tipo_prueba)
+        return self.dao.with_profile('list').find_by_atleta_y_tipo(atleta_id, tipo_prueba)
     
     def obtener_ultima_prueba_por_tipo(self, atleta_id: int, tipo_prueba: str) -> Optional[PruebaFisica]:
         """Obtener la última prueba de un tipo específico"""
-        return self.dao.find_ultima_by_atleta_y_tipo(atleta_id, tipo_prueba)
+        return self.dao.with_profile('detail').find_ultima_by_atleta_y_tipo(atleta_id, tipo_prueba)
     
     def comparar_pruebas(self, prueba_id_1: int, prueba_id_2: int) -> dict:
         """Comparar dos pruebas físicas"""
@@ -66,6 +104,22 @@ class PruebaFisicaController:
     
     def buscar_pruebas(self, criterios: dict) -> List[PruebaFisica]:
         """Buscar pruebas por criterios"""
+        return list(
+            self.dao.with_profile('list')
+            .find_by_criteria(self._build_filters(criterios), active_only=True)
+        )
+    
+    def exportar_pruebas(self, criterios: Optional[dict] = None) -> QuerySet:
+        """Filas (en el orden de COLUMNAS_EXPORTACION) de las pruebas que cumplen los criterios"""
+        return (
+            self.dao.find_by_criteria(self._build_filters(criterios or {}), active_only=True)
+            .annotate(atleta_dni=F('atleta__dni'))
+            .order_by('id')
+            .values_list(*COLUMNAS_EXPORTACION)
+        )
+    
+    def _build_filters(self, criterios: dict) -> Dict[str, Any]:
+        """Convertir criterios de búsqueda en filtros del DAO"""
         filters = {}
         
         if criterios.get('atleta_id'):
@@ -81,7 +135,7 @@ class PruebaFisicaController:
         if criterios.get('resultado_max'):
             filters['resultado__lte'] = criterios['resultado_max']
         
-        return list(self.dao.find_by_criteria(filters, active_only=True))
+        return filters
     
     def obtener_tipos_prueba(self) -> List[dict]:
         """Obtener los tipos de prueba disponibles"""
@@ -94,6 +148,24 @@ class PruebaFisicaController:
     def obtener_promedio_por_tipo(self, tipo_prueba: str) -> Optional[float]:
         """Obtener promedio de resultados por tipo"""
         return self.dao.get_promedio_by_tipo(tipo_prueba)
+    
+    def obtener_ranking(
+        self, tipo_prueba: str, grupo_id: Optional[int] = None, sexo: Optional[str] = None,
+        page: int = 1, page_size: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Ranking paginado de un tipo de prueba (mejor resultado de cada atleta),
+        leído de la tabla precalculada de rankings.
+        
+        Raises:
+            ValueError: Si el tipo de prueba no existe
+        """
+        if tipo_prueba not in TipoPrueba.values:
+            raise ValueError(f"Tipo de prueba no válido: {tipo_prueba}")
+        dao = self.ranking_dao.with_profile('list')
+        resultado = dao.paginate(page, page_size, queryset=dao.leaderboard(tipo_prueba, grupo_id, sexo))
+        resultado['menor_es_mejor'] = tipo_prueba in TIPOS_MENOR_ES_MEJOR
+        return resultado
 
 
 # Instancia singleton para compatibilidad
@@ -3,7 +3,7 @@ Data Access Object (DAO) Package
 Proporciona una capa de abstracción para el acceso a datos
 """
 
-from .generic_dao import GenericDAO, ModelDAO
+from .generic_dao import GenericDAO, ModelDAO, InvalidCursorError, VersionConflictError
 from .model_daos import (
     UsuarioDAO,
     GrupoAtletaDAO,
@@ -11,6 +11,7 @@ from .model_daos import (
     InscripcionDAO,
     PruebaAntropometricaDAO,
     PruebaFisicaDAO,
+    RankingPruebaDAO,
     EntrenadorDAO,
     EstudianteVinculacionDAO,
 )
@@ -18,12 +19,15 @@ from .model_daos import (
 __all__ = [
     'GenericDAO',
     'ModelDAO',
+    'InvalidCursorError',
+    'VersionConflictError',
     'UsuarioDAO',
     'GrupoAtletaDAO',
     'AtletaDAO',
     'InscripcionDAO',
     'PruebaAntropometricaDAO',
     'PruebaFisicaDAO',
+    'RankingPruebaDAO',
     'EntrenadorDAO',
     'EstudianteVinculacionDAO',
 ]
@@ -0,0 +1,185 @@
+"""
+Caché de lectura para los DAOs
+Guarda las instancias leídas por find_by_id/find_by_field y las invalida con
+las señales post_save/post_delete del modelo
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+# Valores por defecto si no se definen en settings
+DEFAULT_CACHE_BACKEND = 'none'
+DEFAULT_CACHE_TTL = 60
+DEFAULT_CACHE_MAX_SIZE = 10000
+DEFAULT_CACHE_ALIAS = 'default'
+
+# Prefijo de todas las claves de la caché de DAOs
+KEY_PREFIX = 'dao'
+
+
+class LRUCacheBackend:
+    """
+    Caché local en memoria del proceso.
+
+    Expira las entradas tras ``ttl`` segundos y, al superar ``max_size``
+    entradas, descarta las menos usadas recientemente. Guarda y devuelve
+    copias para que los cambios de un llamador no afecten a los demás.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.copy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        value = copy.copy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DjangoCacheBackend:
+    """
+    Adaptador sobre el framework de caché de Django (CACHES).
+
+    Permite compartir la caché entre procesos, por ejemplo con
+    django.core.cache.backends.redis.RedisCache. El límite de tamaño y la
+    política de expulsión los define el backend configurado.
+    """
+
+    def __init__(self, alias: str = DEFAULT_CACHE_ALIAS, ttl: float = DEFAULT_CACHE_TTL):
+        from django.core.cache import caches
+        self.cache = caches[alias]
+        self.ttl = ttl
+
+    def get(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self.cache.set(key, value, timeout=self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+_backend_lock = threading.Lock()
+_backend: Optional[Any] = None
+_backend_config: Optional[Tuple] = None
+
+
+def get_cache_backend() -> Optional[Any]:
+    """
+    Obtener el backend de caché configurado en DAO_CACHE_BACKEND.
+
+    Returns:
+        LRUCacheBackend ('lru'), DjangoCacheBackend ('django') o None ('none')
+    """
+    global _backend, _backend_config
+    config = (
+        getattr(settings, 'DAO_CACHE_BACKEND', DEFAULT_CACHE_BACKEND),
+        getattr(settings, 'DAO_CACHE_TTL', DEFAULT_CACHE_TTL),
+        getattr(settings, 'DAO_CACHE_MAX_SIZE', DEFAULT_CACHE_MAX_SIZE),
+        getattr(settings, 'DAO_CACHE_ALIAS', DEFAULT_CACHE_ALIAS),
+    )
+    if config == _backend_config:
+        return _backend
+
+    with _backend_lock:
+        if config != _backend_config:
+            name, ttl, max_size, alias = config
+            if name == 'lru':
+                _backend = LRUCacheBackend(max_size=max_size, ttl=ttl)
+            elif name == 'django':
+                _backend = DjangoCacheBackend(alias=alias, ttl=ttl)
+            elif name in ('none', '', None):
+                _backend = None
+            else:
+                raise ValueError(f"DAO_CACHE_BACKEND desconocido: {name}")
+            _backend_config = config
+    return _backend
+
+
+def reset_cache_backend() -> None:
+    """Descartar el backend actual; el siguiente acceso crea uno nuevo"""
+    global _backend, _backend_config
+    with _backend_lock:
+        _backend = None
+        _backend_config = None
+
+
+def instance_key(model: Type[models.Model], pk: Any) -> str:
+    """Clave de una instancia por su primary key"""
+    return f'{KEY_PREFIX}:{model._meta.label_lower}:pk={pk}'
+
+
+def field_key(model: Type[models.Model], field_name: str, value: Any) -> str:
+    """Clave del índice campo único -> primary key"""
+    return f'{KEY_PREFIX}:{model._meta.label_lower}:{field_name}={value}'
+
+
+def invalidate(model: Type[models.Model], pk: Any, using: Optional[str] = None) -> None:
+    """
+    Invalidar la instancia cacheada de un registro.
+
+    Se invalida de inmediato y otra vez al confirmar la transacción, para
+    descartar lo que otro proceso haya cacheado antes del commit.
+    """
+    backend = get_cache_backend()
+    if backend is None or pk is None:
+        return
+    key = instance_key(model, pk)
+    backend.delete(key)
+    transaction.on_commit(lambda: backend.delete(key), using=using)
+
+
+def _invalidate_instance(sender, instance, using=None, **kwargs) -> None:
+    invalidate(sender, instance.pk, using=using)
+
+
+_connected: Dict[Type[models.Model], bool] = {}
+
+
+def connect_invalidation(model: Type[models.Model]) -> None:
+    """Registrar la invalidación por post_save/post_delete de un modelo (una sola vez)"""
+    if model in _connected:
+        return
+    uid = f'{KEY_PREFIX}-cache:{model._meta.label_lower}'
+    post_save.connect(_invalidate_instance, sender=model, dispatch_uid=uid)
+    post_delete.connect(_invalidate_instance, sender=model, dispatch_uid=uid)
+    _connected[model] = True
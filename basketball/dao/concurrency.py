@@ -0,0 +1,103 @@
+"""
+Consultas independientes en paralelo
+Ejecuta varias lecturas a la vez en un pool de hilos compartido. Cada hilo usa
+su propia conexión a la base de datos y hereda el contexto de quien lo llama
+(por ejemplo, las lecturas fijadas al primario tras una escritura).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from basketball.dao.routing import PRIMARY
+
+# Valor por defecto si no se define en settings
+DEFAULT_WORKERS = 4
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_threads = 0
+
+
+def _workers() -> int:
+    return getattr(settings, 'PARALLEL_QUERY_WORKERS', DEFAULT_WORKERS)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Pool de hilos compartido, creado en el primer uso"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_workers(), thread_name_prefix='basketball-query',
+                initializer=_count_thread
+            )
+        return _executor
+
+
+def _count_thread() -> None:
+    global _threads
+    with _lock:
+        _threads += 1
+
+
+def _close_connections(barrier: threading.Barrier) -> None:
+    """Cerrar las conexiones del hilo (la barrera reparte una tarea por hilo)"""
+    try:
+        barrier.wait(timeout=5)
+    except threading.BrokenBarrierError:
+        pass
+    connections.close_all()
+
+
+def _run_task(func: Callable[[], Any]) -> Any:
+    """Ejecutar una consulta en un hilo del pool, como si fuera una petición"""
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+def in_transaction() -> bool:
+    """
+    Si hay una transacción abierta en el primario.
+
+    Los hilos del pool no la verían (usan otra conexión), así que en ese caso
+    las consultas se ejecutan en el hilo actual.
+    """
+    return connections[PRIMARY].in_atomic_block
+
+
+def run_concurrently(*funcs: Callable[[], Any]) -> List[Any]:
+    """
+    Ejecutar funciones independientes a la vez y devolver sus resultados en orden.
+
+    Se ejecutan una tras otra en el hilo actual si hay una sola, si
+    PARALLEL_QUERY_WORKERS es 1 o menos, o dentro de una transacción.
+    La primera excepción de una función se propaga a quien llama.
+    """
+    if len(funcs) <= 1 or _workers() <= 1 or in_transaction():
+        return [func() for func in funcs]
+    executor = _get_executor()
+    futures = [executor.submit(copy_context().run, _run_task, func) for func in funcs]
+    return [future.result() for future in futures]
+
+
+def shutdown() -> None:
+    """Cerrar el pool de hilos y sus conexiones (se vuelve a crear en el siguiente uso)"""
+    global _executor, _threads
+    with _lock:
+        executor, _executor = _executor, None
+        threads, _threads = _threads, 0
+    if executor is None:
+        return
+    if threads:
+        barrier = threading.Barrier(threads)
+        for _ in range(threads):
+            executor.submit(_close_connections, barrier)
+    executor.shutdown(wait=True)
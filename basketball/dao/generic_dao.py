@@ -3,14 +3,91 @@ DAO Genérico para operaciones CRUD
 Proporciona una capa de abstracción reutilizable para el acceso a datos
 """
 
-from typing import TypeVar, Generic, List, Optional, Dict, Any, Type
-from django.db import models, transaction
-from django.db.models import QuerySet, Q
-from django.core.exceptions import ObjectDoesNotExist
+import asyncio
+import base64
+import copy
+import csv
+import io
+import json
+from itertools import islice
+from typing import TypeVar, Generic, List, Optional, Dict, Any, Type, Sequence, Union, Iterable
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.models import F, QuerySet, Q
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .cache import connect_invalidation, field_key, get_cache_backend, instance_key, invalidate
+from .routing import PRIMARY
+from .signals import bulk_changed
 
 # TypeVar para el modelo genérico
 T = TypeVar('T', bound=models.Model)
 
+# Tamaño máximo de página si no se define API_MAX_PAGE_SIZE en settings
+DEFAULT_MAX_PAGE_SIZE = 100
+
+# Filas por lote en bulk_ingest
+DEFAULT_INGEST_BATCH_SIZE = 5000
+
+# Marcador de NULL en el CSV enviado a COPY
+COPY_NULL = '\\N'
+
+
+def get_max_page_size() -> int:
+    """Obtener el tamaño máximo de página configurado"""
+    return getattr(settings, 'API_MAX_PAGE_SIZE', DEFAULT_MAX_PAGE_SIZE)
+
+
+class InvalidCursorError(ValueError):
+    """Cursor de paginación inválido, manipulado o de otro ordenamiento"""
+    pass
+
+
+class VersionConflictError(Exception):
+    """La versión de la fila no coincide con la esperada (actualización concurrente)"""
+    pass
+
+
+def copy_rows(connection, model: Type[models.Model], columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Insertar filas con COPY FROM STDIN (solo PostgreSQL).
+    
+    Args:
+        connection: Conexión PostgreSQL
+        model: Modelo destino
+        columns: Nombres de columna en el orden de cada fila
+        rows: Filas con valores ya preparados para la base de datos
+        
+    Returns:
+        Número de filas enviadas
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow([COPY_NULL if value is None else value for value in row])
+        count += 1
+    if not count:
+        return 0
+    buffer.seek(0)
+    quote = connection.ops.quote_name
+    sql = (
+        f"COPY {quote(model._meta.db_table)} ({', '.join(quote(column) for column in columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    )
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            # psycopg2
+            raw_cursor.copy_expert(sql, buffer)
+        else:
+            # psycopg 3
+            with raw_cursor.copy(sql) as copy_stream:
+                copy_stream.write(buffer.getvalue())
+    return count
+
 
 class GenericDAO(Generic[T]):
     """
@@ -24,8 +101,50 @@ class GenericDAO(Generic[T]):
         # O directamente:
         dao = GenericDAO(Atleta)
         atletas = dao.find_all()
+    
+    Carga masiva:
+        ``bulk_ingest`` valida cada fila, calcula los campos derivados del lote
+        con ``prepare_instances`` (lo que haría save()) e inserta las filas
+        válidas con COPY en PostgreSQL o bulk_create por lotes en otros motores.
+        Las filas inválidas se reportan sin abortar el lote.
+    
+    Caché de lectura:
+        Con ``cache_enabled = True``, ``find_by_id`` y ``find_by_field`` (sobre
+        campos únicos) leen primero del backend de DAO_CACHE_BACKEND. Solo se
+        cachean las lecturas sin perfil de carga, cuyas anotaciones y
+        relaciones dependen de otros modelos. Las señales post_save/post_delete
+        y los métodos de actualización masiva del DAO invalidan las entradas.
+    
+    Perfiles de carga:
+        Cada DAO puede declarar en ``loading_profiles`` qué relaciones cargar
+        (select_related / prefetch_related), qué columnas leer (only) y qué
+        valores calcular en SQL (annotate) para cada caso de lectura. ``dao.with_profile('list')`` devuelve un DAO cuyas
+        lecturas aplican ese perfil, evitando consultas N+1 al serializar.
+    
+    Réplicas de lectura:
+        Con ReplicaRouter activo las lecturas van a las réplicas y las
+        escrituras al primario. ``dao.using('default')`` fija el alias de las
+        lecturas. Las lecturas previas a una escritura (update, delete,
+        restore) y las que llenan la caché se hacen siempre en el primario.
     """
     
+    # Perfiles de carga: nombre -> {'select_related': [...], 'prefetch_related': [...],
+    #                              'only': [...], 'annotate': {alias: expresión}}
+    loading_profiles: Dict[str, Dict[str, Any]] = {
+        'list': {},
+        'detail': {},
+    }
+    
+    # Campos que calcula prepare_instances y que no se validan en la entrada
+    derived_fields: Sequence[str] = ()
+    
+    # Activa la caché de lectura de find_by_id/find_by_field para este DAO
+    cache_enabled: bool = False
+    
+    # Columnas cuyos valores en las filas afectadas viajan con bulk_changed
+    # (p. ej. 'atleta_id' para recalcular solo esos atletas)
+    change_keys: Sequence[str] = ()
+    
     def __init__(self, model_class: Type[T]):
         """
         Inicializa el DAO con la clase del modelo.
@@ -35,6 +154,137 @@ class GenericDAO(Generic[T]):
         """
         self.model_class = model_class
         self._soft_delete_field = 'estado'  # Campo para soft delete
+        self._profile: Optional[str] = None
+        self._profiled_daos: Dict[str, 'GenericDAO[T]'] = {}
+        self._using: Optional[str] = None
+        self._alias_daos: Dict[str, 'GenericDAO[T]'] = {}
+        if self.cache_enabled:
+            connect_invalidation(model_class)
+    
+    # ==================== PERFILES DE CARGA ====================
+    
+    def with_profile(self, name: str) -> 'GenericDAO[T]':
+        """
+        Obtener una vista de este DAO cuyas lecturas aplican un perfil de carga.
+        
+        Args:
+            name: Nombre del perfil declarado en loading_profiles
+            
+        Returns:
+            DAO con el perfil aplicado (se reutiliza entre llamadas)
+        """
+        if name not in self.loading_profiles:
+            raise ValueError(f"Perfil de carga desconocido para {self.model_class.__name__}: {name}")
+        if name not in self._profiled_daos:
+            dao = copy.copy(self)
+            dao._profile = name
+            dao._profiled_daos = {}
+            dao._alias_daos = {}
+            self._profiled_daos[name] = dao
+        return self._profiled_daos[name]
+    
+    def apply_profile(self, queryset: QuerySet[T], name: Optional[str] = None) -> QuerySet[T]:
+        """
+        Aplicar un perfil de carga a un QuerySet.
+        
+        Args:
+            queryset: QuerySet base
+            name: Perfil a aplicar (por defecto el perfil activo del DAO)
+            
+        Returns:
+            QuerySet con select_related/prefetch_related/only/annotate aplicados
+        """
+        name = name or self._profile
+        if not name:
+            return queryset
+        profile = self.loading_profiles[name]
+        if profile.get('select_related'):
+            queryset = queryset.select_related(*profile['select_related'])
+        if profile.get('prefetch_related'):
+            queryset = queryset.prefetch_related(*profile['prefetch_related'])
+        if profile.get('only'):
+            queryset = queryset.only(*profile['only'])
+        if profile.get('annotate'):
+            queryset = queryset.annotate(**profile['annotate'])
+        return queryset
+    
+    def get_queryset(self) -> QuerySet[T]:
+        """QuerySet base para las lecturas, con el perfil de carga activo"""
+        return self.apply_profile(self._reader.all())
+    
+    # ==================== RÉPLICAS ====================
+    
+    def using(self, alias: str) -> 'GenericDAO[T]':
+        """
+        Obtener una vista de este DAO cuyas lecturas usan un alias de base de datos.
+        
+        Args:
+            alias: Alias de DATABASES (p. ej. 'default' para leer del primario)
+            
+        Returns:
+            DAO con el alias fijado (se reutiliza entre llamadas)
+        """
+        if alias not in self._alias_daos:
+            dao = copy.copy(self)
+            dao._using = alias
+            dao._profiled_daos = {}
+            dao._alias_daos = {}
+            self._alias_daos[alias] = dao
+        return self._alias_daos[alias]
+    
+    @property
+    def _reader(self) -> models.Manager:
+        """Manager para las lecturas: el alias fijado con using() o el que elija el router"""
+        return self.model_class.objects.db_manager(self._using)
+    
+    # ==================== VERSIONES ====================
+    
+    @property
+    def _versioned(self) -> bool:
+        """Si el modelo tiene columna version (ModeloVersionado)"""
+        return any(field.name == 'version' for field in self.model_class._meta.concrete_fields)
+    
+    def _with_version_bump(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Agregar version = version + 1 a un QuerySet.update, que no pasa por save()"""
+        if not self._versioned or 'version' in updates:
+            return updates
+        return {**updates, 'version': F('version') + 1}
+    
+    # ==================== CACHÉ ====================
+    
+    def get_cache(self):
+        """Backend de caché para las lecturas de este DAO, o None si no aplica"""
+        if not self.cache_enabled or self._profile:
+            return None
+        return get_cache_backend()
+    
+    def invalidate_cache(self, pks: Iterable[Any]) -> None:
+        """Invalidar las instancias cacheadas de los registros indicados"""
+        if not self.cache_enabled:
+            return
+        using = router.db_for_write(self.model_class)
+        for pk in pks:
+            invalidate(self.model_class, pk, using=using)
+    
+    def _cacheable_field(self, field_name: str) -> Optional[models.Field]:
+        """Campo único y no relacional por el que se puede cachear find_by_field"""
+        try:
+            field = self.model_class._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.is_relation or not field.unique:
+            return None
+        return field
+    
+    def _get_by_pk(self, pk: Any, primary: bool = False) -> Optional[T]:
+        """Leer un registro desde la base de datos (o del primario), sin pasar por la caché"""
+        queryset = self.get_queryset()
+        if primary:
+            queryset = queryset.using(PRIMARY)
+        try:
+            return queryset.get(pk=pk)
+        except ObjectDoesNotExist:
+            return None
     
     # ==================== CREATE ====================
     
@@ -75,8 +325,191 @@ class GenericDAO(Generic[T]):
             Lista de instancias creadas
         """
         with transaction.atomic():
-            objects = [self.model_class(**data) for data in instances]
-            return self.model_class.objects.bulk_create(objects)
+            objects = self.prepare_instances([self.model_class(**data) for data in instances])
+            created = self.model_class.objects.bulk_create(objects)
+            bulk_changed.send(sender=self.model_class, keys=self._changed_keys(created))
+            return created
+    
+    def prepare_instances(self, instances: List[T]) -> List[T]:
+        """
+        Calcular los campos derivados de un lote antes de insertarlo.
+        
+        bulk_create y COPY no llaman a save(); los DAOs cuyos modelos calculan
+        campos en save() lo sobrescriben para hacer ese cálculo en una pasada.
+        
+        Args:
+            instances: Instancias sin guardar
+            
+        Returns:
+            Las mismas instancias con los campos derivados asignados
+        """
+        return instances
+    
+    def _changed_keys(self, instances: Iterable[T] = (), queryset: Optional[QuerySet] = None) -> Dict[str, set]:
+        """
+        Valores de change_keys en las filas afectadas por una escritura masiva.
+        
+        Args:
+            instances: Instancias escritas (se leen sus atributos)
+            queryset: Filas afectadas, leídas de la base de datos
+            
+        Returns:
+            {columna: conjunto de valores}
+        """
+        keys: Dict[str, set] = {key: set() for key in self.change_keys}
+        if not keys:
+            return keys
+        for instance in instances:
+            for key, values in keys.items():
+                values.add(getattr(instance, key))
+        if queryset is not None:
+            for row in queryset.values_list(*self.change_keys):
+                for values, value in zip(keys.values(), row):
+                    values.add(value)
+        for values in keys.values():
+            values.discard(None)
+        return keys
+    
+    def _touches_change_keys(self, fields: Iterable[str]) -> bool:
+        """Si una escritura sobre estos campos puede cambiar los valores de change_keys"""
+        opts = self.model_class._meta
+        for name in fields:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if getattr(field, 'attname', None) in self.change_keys:
+                return True
+        return False
+    
+    def bulk_ingest(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Carga masiva validada, por lotes.
+        
+        Cada lote se valida fila a fila (campos, claves foráneas y valores
+        únicos con una consulta por lote), se calculan los campos derivados y
+        las filas válidas se insertan con COPY FROM STDIN en PostgreSQL o con
+        bulk_create en otros motores. Las filas inválidas no abortan el lote.
+        
+        Args:
+            rows: Diccionarios con los datos de cada fila
+            batch_size: Filas por lote
+            
+        Returns:
+            {'creados': int, 'errores': [{'fila': índice, 'errores': {campo: [mensajes]}}]}
+        """
+        rows = iter(rows)
+        created = 0
+        errors: List[Dict[str, Any]] = []
+        keys = self._changed_keys()
+        offset = 0
+        while True:
+            batch = list(islice(rows, max(batch_size, 1)))
+            if not batch:
+                break
+            instances, batch_errors = self._validate_batch(batch, offset)
+            errors.extend(batch_errors)
+            if instances:
+                instances = self.prepare_instances(instances)
+                with transaction.atomic(using=router.db_for_write(self.model_class)):
+                    created += self._insert_batch(instances)
+                for key, values in self._changed_keys(instances).items():
+                    keys[key] |= values
+            offset += len(batch)
+        if created:
+            bulk_changed.send(sender=self.model_class, keys=keys)
+        return {'creados': created, 'errores': errors}
+    
+    def _validate_batch(self, batch: List[Dict[str, Any]], offset: int) -> tuple[List[T], List[Dict[str, Any]]]:
+        """Validar un lote; devuelve las instancias válidas y los errores por fila"""
+        opts = self.model_class._meta
+        foreign_keys = [field for field in opts.concrete_fields if field.is_relation]
+        exclude = list(self.derived_fields) + [field.name for field in foreign_keys]
+        field_map = {field.name: field for field in foreign_keys}
+        candidates: List[tuple[int, T]] = []
+        errors: Dict[int, Dict[str, List[str]]] = {}
+        
+        for index, data in enumerate(batch, start=offset):
+            # Las relaciones pueden venir como id (p. ej. desde un CSV): {'atleta': 5}
+            data = {
+                (field_map[key].attname if key in field_map and not isinstance(value, models.Model) else key): value
+                for key, value in data.items()
+            }
+            try:
+                instance = self.model_class(**data)
+                instance.clean_fields(exclude=exclude)
+                for field in foreign_keys:
+                    value = getattr(instance, field.attname)
+                    if value is None:
+                        if not field.null:
+                            raise ValidationError({field.name: [field.error_messages['null']]})
+                        continue
+                    try:
+                        setattr(instance, field.attname, field.target_field.to_python(value))
+                    except ValidationError as e:
+                        raise ValidationError({field.name: e.messages})
+            except ValidationError as e:
+                errors[index] = e.message_dict
+            except (TypeError, ValueError) as e:
+                errors[index] = {'__all__': [str(e)]}
+            else:
+                candidates.append((index, instance))
+        
+        # Claves foráneas inexistentes: una consulta por relación
+        for field in foreign_keys:
+            ids = {getattr(instance, field.attname) for _, instance in candidates} - {None}
+            if not ids:
+                continue
+            existing = set(
+                field.related_model._base_manager.filter(**{f'{field.target_field.attname}__in': ids})
+                .values_list(field.target_field.attname, flat=True)
+            )
+            for index, instance in candidates:
+                value = getattr(instance, field.attname)
+                if value is not None and value not in existing:
+                    errors.setdefault(index, {}).setdefault(field.name, []).append(
+                        f'No existe {field.related_model._meta.verbose_name} con id {value}.'
+                    )
+        
+        # Valores únicos repetidos en la base de datos o dentro del lote
+        for field in opts.concrete_fields:
+            if not field.unique or field.primary_key:
+                continue
+            values = [getattr(instance, field.attname) for _, instance in candidates]
+            existing = set(
+                self.model_class._base_manager.filter(**{f'{field.attname}__in': set(values) - {None}})
+                .values_list(field.attname, flat=True)
+            )
+            seen = set()
+            for (index, _), value in zip(candidates, values):
+                if value is None:
+                    continue
+                if value in existing or value in seen:
+                    errors.setdefault(index, {}).setdefault(field.name, []).append(
+                        f'Ya existe un registro con {field.verbose_name} {value}.'
+                    )
+                seen.add(value)
+        
+        valid = [instance for index, instance in candidates if index not in errors]
+        return valid, [{'fila': index, 'errores': errors[index]} for index in sorted(errors)]
+    
+    def _insert_batch(self, instances: List[T]) -> int:
+        """Insertar un lote ya validado: COPY en PostgreSQL, bulk_create en otros motores"""
+        connection = connections[router.db_for_write(self.model_class)]
+        if connection.vendor != 'postgresql':
+            self.model_class.objects.bulk_create(instances)
+            return len(instances)
+        
+        fields = [field for field in self.model_class._meta.concrete_fields if not field.primary_key]
+        rows = (
+            [field.get_db_prep_save(field.pre_save(instance, True), connection) for field in fields]
+            for instance in instances
+        )
+        return copy_rows(connection, self.model_class, [field.column for field in fields], rows)
     
     # ==================== READ ====================
     
@@ -90,10 +523,22 @@ class GenericDAO(Generic[T]):
         Returns:
             Instancia del modelo o None si no existe
         """
+        cache = self.get_cache()
+        if cache is None:
+            return self._get_by_pk(pk)
         try:
-            return self.model_class.objects.get(pk=pk)
-        except ObjectDoesNotExist:
-            return None
+            pk = self.model_class._meta.pk.to_python(pk)
+        except ValidationError:
+            return self._get_by_pk(pk)
+        
+        key = instance_key(self.model_class, pk)
+        instance = cache.get(key)
+        if instance is None:
+            # Desde el primario: una réplica atrasada dejaría en caché datos viejos
+            instance = self._get_by_pk(pk, primary=True)
+            if instance is not None:
+                cache.set(key, instance)
+        return instance
     
     def find_by_field(self, field_name: str, value: Any) -> Optional[T]:
         """
@@ -106,12 +551,33 @@ class GenericDAO(Generic[T]):
         Returns:
             Primera instancia encontrada o None
         """
+        cache = self.get_cache()
+        field = self._cacheable_field(field_name) if cache is not None else None
+        if field is not None:
+            try:
+                value = field.to_python(value)
+            except ValidationError:
+                field = None
+        if field is not None:
+            key = field_key(self.model_class, field.name, value)
+            pk = cache.get(key)
+            if pk is not None:
+                instance = self.find_by_id(pk)
+                # El índice puede apuntar a un registro cuyo valor ya cambió
+                if instance is not None and getattr(instance, field.attname) == value:
+                    return instance
+            instance = self.get_queryset().using(PRIMARY).filter(**{field.name: value}).first()
+            if instance is not None:
+                cache.set(key, instance.pk)
+                cache.set(instance_key(self.model_class, instance.pk), instance)
+            return instance
+        
         try:
-            return self.model_class.objects.get(**{field_name: value})
+            return self.get_queryset().get(**{field_name: value})
         except ObjectDoesNotExist:
             return None
         except self.model_class.MultipleObjectsReturned:
-            return self.model_class.objects.filter(**{field_name: value}).first()
+            return self.get_queryset().filter(**{field_name: value}).first()
     
     def find_all(self, active_only: bool = False) -> QuerySet[T]:
         """
@@ -123,7 +589,7 @@ class GenericDAO(Generic[T]):
         Returns:
             QuerySet con todos los registros
         """
-        queryset = self.model_class.objects.all()
+        queryset = self.get_queryset()
         if active_only and hasattr(self.model_class, self._soft_delete_field):
             queryset = queryset.filter(**{self._soft_delete_field: True})
         return queryset
@@ -196,7 +662,7 @@ class GenericDAO(Generic[T]):
         Returns:
             True si existe, False si no
         """
-        return self.model_class.objects.filter(pk=pk).exists()
+        return self._reader.filter(pk=pk).exists()
     
     def exists_by_field(self, field_name: str, value: Any) -> bool:
         """
@@ -209,7 +675,7 @@ class GenericDAO(Generic[T]):
         Returns:
             True si existe, False si no
         """
-        return self.model_class.objects.filter(**{field_name: value}).exists()
+        return self._reader.filter(**{field_name: value}).exists()
     
     def count(self, active_only: bool = False) -> int:
         """
@@ -235,20 +701,119 @@ class GenericDAO(Generic[T]):
         """
         return self.find_by_filters(filters).count()
     
+    # ==================== ASYNC READ ====================
+    
+    async def afind_by_id(self, pk: int) -> Optional[T]:
+        """
+        Versión asíncrona de find_by_id (ORM asíncrono de Django).
+        
+        Args:
+            pk: Primary key
+            
+        Returns:
+            Instancia del modelo o None si no existe
+        """
+        if self.get_cache() is not None:
+            # La caché y su invalidación son síncronas
+            return await sync_to_async(self.find_by_id)(pk)
+        try:
+            return await self.get_queryset().aget(pk=pk)
+        except ObjectDoesNotExist:
+            return None
+    
+    async def alist(self, queryset: QuerySet[T]) -> List[T]:
+        """
+        Evaluar un QuerySet sin bloquear el event loop.
+        
+        Django 4.2 no admite prefetch_related en la iteración asíncrona: esos
+        QuerySets se evalúan con sync_to_async.
+        """
+        if queryset._prefetch_related_lookups:
+            return await sync_to_async(list)(queryset)
+        return [instance async for instance in queryset]
+    
+    async def acount(self, active_only: bool = False) -> int:
+        """Versión asíncrona de count"""
+        return await self.find_all(active_only).acount()
+    
+    async def aexists(self, pk: int) -> bool:
+        """Versión asíncrona de exists"""
+        return await self._reader.filter(pk=pk).aexists()
+    
+    async def apaginate(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        active_only: bool = False,
+        order_by: Union[str, Sequence[str], None] = None,
+        queryset: Optional[QuerySet[T]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Versión asíncrona de paginate: el COUNT y la página se piden a la vez.
+        
+        Returns:
+            El mismo diccionario que paginate
+        """
+        if cursor is not None:
+            return await self.apaginate_cursor(
+                cursor, page_size, active_only=active_only,
+                order_by=order_by, queryset=queryset
+            )
+        
+        queryset, page, page_size = self._offset_page(queryset, active_only, order_by, page, page_size)
+        start = (page - 1) * page_size
+        total, rows = await asyncio.gather(
+            queryset.acount(), self.alist(queryset[start:start + page_size])
+        )
+        return self._offset_result(rows, total, page, page_size)
+    
+    async def apaginate_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        active_only: bool = False,
+        order_by: Union[str, Sequence[str], None] = None,
+        queryset: Optional[QuerySet[T]] = None,
+        with_count: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Versión asíncrona de paginate_cursor.
+        
+        Raises:
+            InvalidCursorError: Si el cursor no es válido para este ordenamiento
+        """
+        base_queryset, page_queryset, ordering, page_size = self._cursor_page(
+            cursor, page_size, active_only, order_by, queryset
+        )
+        rows = await self.alist(page_queryset[:page_size + 1])
+        result = self._cursor_result(rows, ordering, page_size)
+        if with_count:
+            result['total'] = await base_queryset.acount()
+        return result
+    
     # ==================== UPDATE ====================
     
-    def update(self, pk: int, **kwargs) -> Optional[T]:
+    def update(self, pk: int, expected_version: Optional[int] = None, **kwargs) -> Optional[T]:
         """
         Actualizar un registro por ID.
         
         Args:
             pk: Primary key
+            expected_version: Si se indica, la fila se bloquea y solo se actualiza
+                              si su versión coincide (concurrencia optimista)
             **kwargs: Campos a actualizar
             
         Returns:
             Instancia actualizada o None si no existe
+            
+        Raises:
+            VersionConflictError: Si la versión de la fila no es expected_version
         """
-        instance = self.find_by_id(pk)
+        if expected_version is not None:
+            return self._update_versioned(pk, expected_version, kwargs)
+        
+        instance = self._get_by_pk(pk, primary=True)
         if instance is None:
             return None
         
@@ -259,18 +824,38 @@ class GenericDAO(Generic[T]):
             instance.save()
             return instance
     
-    def update_from_dict(self, pk: int, data: Dict[str, Any]) -> Optional[T]:
+    def _update_versioned(self, pk: int, expected_version: int, data: Dict[str, Any]) -> Optional[T]:
+        """Actualizar bajo SELECT FOR UPDATE comprobando la versión de la fila"""
+        with transaction.atomic():
+            instance = self.model_class.objects.select_for_update().filter(pk=pk).first()
+            if instance is None:
+                return None
+            if instance.version != expected_version:
+                raise VersionConflictError(
+                    f'{self.model_class._meta.verbose_name} {pk} fue modificado '
+                    f'(versión {instance.version}, se esperaba {expected_version})'
+                )
+            for field, value in data.items():
+                if hasattr(instance, field):
+                    setattr(instance, field, value)
+            instance.save()
+            return instance
+    
+    def update_from_dict(
+        self, pk: int, data: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Optional[T]:
         """
         Actualizar un registro desde un diccionario.
         
         Args:
             pk: Primary key
             data: Diccionario con los campos a actualizar
+            expected_version: Versión esperada de la fila (ver update)
             
         Returns:
             Instancia actualizada o None si no existe
         """
-        return self.update(pk, **data)
+        return self.update(pk, expected_version=expected_version, **data)
     
     def update_field(self, pk: int, field_name: str, value: Any) -> Optional[T]:
         """
@@ -297,8 +882,21 @@ class GenericDAO(Generic[T]):
         Returns:
             Número de registros actualizados
         """
+        if self._versioned:
+            for instance in instances:
+                instance.version += 1
+            fields = [*fields, 'version'] if 'version' not in fields else fields
         with transaction.atomic():
-            return self.model_class.objects.bulk_update(instances, fields)
+            # Valores anteriores si la actualización puede cambiarlos
+            previous = (
+                self.model_class.objects.filter(pk__in=[instance.pk for instance in instances])
+                if self._touches_change_keys(fields) else None
+            )
+            keys = self._changed_keys(instances, previous)
+            count = self.model_class.objects.bulk_update(instances, fields)
+            self.invalidate_cache(instance.pk for instance in instances)
+            bulk_changed.send(sender=self.model_class, keys=keys)
+            return count
     
     def update_by_filters(self, filters: Dict[str, Any], updates: Dict[str, Any]) -> int:
         """
@@ -312,7 +910,19 @@ class GenericDAO(Generic[T]):
             Número de registros actualizados
         """
         with transaction.atomic():
-            return self.model_class.objects.filter(**filters).update(**updates)
+            queryset = self.model_class.objects.filter(**filters)
+            touched = self._touches_change_keys(updates)
+            # QuerySet.update no emite post_save: invalidar explícitamente
+            pks = list(queryset.values_list('pk', flat=True)) if self.cache_enabled or touched else []
+            keys = self._changed_keys(queryset=queryset)
+            count = queryset.update(**self._with_version_bump(updates))
+            self.invalidate_cache(pks)
+            if touched:
+                # Valores nuevos de las mismas filas
+                for key, values in self._changed_keys(queryset=self.model_class.objects.filter(pk__in=pks)).items():
+                    keys[key] |= values
+            bulk_changed.send(sender=self.model_class, keys=keys)
+            return count
     
     # ==================== DELETE ====================
     
@@ -327,7 +937,7 @@ class GenericDAO(Generic[T]):
         Returns:
             True si se eliminó, False si no existe
         """
-        instance = self.find_by_id(pk)
+        instance = self._get_by_pk(pk, primary=True)
         if instance is None:
             return False
         
@@ -364,12 +974,16 @@ class GenericDAO(Generic[T]):
         """
         with transaction.atomic():
             queryset = self.model_class.objects.filter(**filters)
+            keys = self._changed_keys(queryset=queryset)
             if soft and hasattr(self.model_class, self._soft_delete_field):
-                return queryset.update(**{self._soft_delete_field: False})
+                pks = list(queryset.values_list('pk', flat=True)) if self.cache_enabled else []
+                count = queryset.update(**self._with_version_bump({self._soft_delete_field: False}))
+                self.invalidate_cache(pks)
             else:
                 count = queryset.count()
                 queryset.delete()
-                return count
+            bulk_changed.send(sender=self.model_class, keys=keys)
+            return count
     
     def restore(self, pk: int) -> Optional[T]:
         """
@@ -384,7 +998,7 @@ class GenericDAO(Generic[T]):
         if not hasattr(self.model_class, self._soft_delete_field):
             return None
         
-        instance = self.find_by_id(pk)
+        instance = self._get_by_pk(pk, primary=True)
         if instance is None:
             return None
         
@@ -449,33 +1063,58 @@ class GenericDAO(Generic[T]):
         page: int = 1, 
         page_size: int = 10, 
         active_only: bool = False,
-        order_by: str = None
+        order_by: Union[str, Sequence[str], None] = None,
+        queryset: Optional[QuerySet[T]] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Obtener registros paginados.
         
         Args:
             page: Número de página (1-indexed)
-            page_size: Tamaño de página
+            page_size: Tamaño de página (limitado por API_MAX_PAGE_SIZE)
             active_only: Si es True, solo considera registros activos
-            order_by: Campo para ordenar (prefijo '-' para descendente)
+            order_by: Campo o campos para ordenar (prefijo '-' para descendente)
+            queryset: QuerySet base ya filtrado (por defecto find_all)
+            cursor: Si no es None, usa paginación por cursor (ver paginate_cursor);
+                    cadena vacía para la primera página
             
         Returns:
             Diccionario con datos de paginación
         """
-        queryset = self.find_all(active_only)
-        
-        if order_by:
-            queryset = queryset.order_by(order_by)
+        if cursor is not None:
+            return self.paginate_cursor(
+                cursor, page_size, active_only=active_only,
+                order_by=order_by, queryset=queryset
+            )
         
+        queryset, page, page_size = self._offset_page(queryset, active_only, order_by, page, page_size)
+        start = (page - 1) * page_size
         total = queryset.count()
-        total_pages = (total + page_size - 1) // page_size
+        return self._offset_result(list(queryset[start:start + page_size]), total, page, page_size)
+    
+    def _offset_page(self, queryset, active_only, order_by, page, page_size) -> tuple:
+        """QuerySet ordenado, página y tamaño de página normalizados para paginate"""
+        if queryset is None:
+            queryset = self.find_all(active_only)
         
-        start = (page - 1) * page_size
-        end = start + page_size
+        if order_by:
+            if isinstance(order_by, str):
+                order_by = [order_by]
+            queryset = queryset.order_by(*order_by)
+        elif not queryset.ordered:
+            # Un orden estable evita filas repetidas u omitidas entre páginas
+            queryset = queryset.order_by('pk')
         
+        page = max(int(page), 1)
+        page_size = min(max(int(page_size), 1), get_max_page_size())
+        return queryset, page, page_size
+    
+    def _offset_result(self, rows: List[T], total: int, page: int, page_size: int) -> Dict[str, Any]:
+        """Diccionario de paginación por página"""
+        total_pages = (total + page_size - 1) // page_size
         return {
-            'data': list(queryset[start:end]),
+            'data': rows,
             'page': page,
             'page_size': page_size,
             'total': total,
@@ -484,6 +1123,128 @@ class GenericDAO(Generic[T]):
             'has_previous': page > 1,
         }
     
+    def paginate_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        active_only: bool = False,
+        order_by: Union[str, Sequence[str], None] = None,
+        queryset: Optional[QuerySet[T]] = None,
+        with_count: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Obtener registros paginados por cursor (keyset pagination).
+        
+        En lugar de OFFSET filtra por los valores de ordenamiento de la última
+        fila entregada, por lo que el costo de cada página no depende de su
+        profundidad. El primary key se agrega al ordenamiento como desempate.
+        
+        Args:
+            cursor: Cursor opaco devuelto como next_cursor (None o '' para la primera página)
+            page_size: Tamaño de página (limitado por API_MAX_PAGE_SIZE)
+            active_only: Si es True, solo considera registros activos
+            order_by: Campo o campos de ordenamiento (no nulos, del propio modelo)
+            queryset: QuerySet base ya filtrado (por defecto find_all)
+            with_count: Si es True, incluye el total (ejecuta un COUNT adicional)
+            
+        Returns:
+            Diccionario con data, page_size, next_cursor y has_next
+            
+        Raises:
+            InvalidCursorError: Si el cursor no es válido para este ordenamiento
+        """
+        base_queryset, page_queryset, ordering, page_size = self._cursor_page(
+            cursor, page_size, active_only, order_by, queryset
+        )
+        # Se pide una fila extra para saber si existe una página siguiente
+        result = self._cursor_result(list(page_queryset[:page_size + 1]), ordering, page_size)
+        if with_count:
+            result['total'] = base_queryset.count()
+        return result
+    
+    def _cursor_page(self, cursor, page_size, active_only, order_by, queryset) -> tuple:
+        """QuerySets base y de la página, ordenamiento y tamaño de página para paginate_cursor"""
+        if queryset is None:
+            queryset = self.find_all(active_only)
+        
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        ordering = self._keyset_ordering(order_by or queryset.query.order_by)
+        page_size = min(max(int(page_size), 1), get_max_page_size())
+        
+        base_queryset = queryset.order_by(*ordering)
+        page_queryset = base_queryset
+        if cursor:
+            values = self._decode_cursor(cursor, ordering)
+            page_queryset = base_queryset.filter(self._keyset_filter(ordering, values))
+        return base_queryset, page_queryset, ordering, page_size
+    
+    def _cursor_result(self, rows: List[T], ordering: List[str], page_size: int) -> Dict[str, Any]:
+        """Diccionario de paginación por cursor a partir de page_size + 1 filas"""
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        return {
+            'data': rows,
+            'page_size': page_size,
+            'next_cursor': self._encode_cursor(rows[-1], ordering) if has_next else None,
+            'has_next': has_next,
+        }
+    
+    def _keyset_ordering(self, order_by: Sequence[str]) -> List[str]:
+        """Normalizar el ordenamiento agregando el primary key como desempate"""
+        ordering = [str(field) for field in order_by if str(field).lstrip('-') != '?']
+        pk_name = self.model_class._meta.pk.name
+        if not any(field.lstrip('-') in ('pk', pk_name) for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith('-')
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+    
+    def _ordering_field(self, name: str) -> models.Field:
+        """Obtener el campo del modelo correspondiente a un elemento de ordenamiento"""
+        name = name.lstrip('-')
+        if name == 'pk':
+            return self.model_class._meta.pk
+        return self.model_class._meta.get_field(name)
+    
+    def _encode_cursor(self, instance: T, ordering: List[str]) -> str:
+        """Codificar los valores de ordenamiento de una fila como cursor opaco"""
+        values = [
+            getattr(instance, self._ordering_field(field).attname) for field in ordering
+        ]
+        payload = json.dumps({'o': ordering, 'v': values}, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    
+    def _decode_cursor(self, cursor: str, ordering: List[str]) -> List[Any]:
+        """Decodificar un cursor validando que corresponda al ordenamiento"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if payload['o'] != ordering or len(payload['v']) != len(ordering):
+                raise InvalidCursorError("El cursor no corresponde a este listado")
+            return [
+                self._ordering_field(field).to_python(value)
+                for field, value in zip(ordering, payload['v'])
+            ]
+        except InvalidCursorError:
+            raise
+        except (ValueError, TypeError, KeyError, ValidationError) as e:
+            raise InvalidCursorError("Cursor de paginación inválido") from e
+    
+    def _keyset_filter(self, ordering: List[str], values: List[Any]) -> Q:
+        """
+        Construir el filtro "posterior a" la fila del cursor.
+        
+        Para (a DESC, b ASC) genera: a < va OR (a = va AND b > vb)
+        """
+        condition = Q()
+        for index, field in enumerate(ordering):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            clause = Q(**{f"{field.lstrip('-')}__{lookup}": values[index]})
+            for previous, value in zip(ordering[:index], values[:index]):
+                clause &= Q(**{previous.lstrip('-'): value})
+            condition |= clause
+        return condition
+    
     def select_related(self, *fields) -> QuerySet[T]:
         """
         Obtener registros con relaciones cargadas (optimización).
@@ -494,7 +1255,7 @@ class GenericDAO(Generic[T]):
         Returns:
             QuerySet con select_related
         """
-        return self.model_class.objects.select_related(*fields)
+        return self._reader.select_related(*fields)
     
     def prefetch_related(self, *fields) -> QuerySet[T]:
         """
@@ -506,7 +1267,7 @@ class GenericDAO(Generic[T]):
         Returns:
             QuerySet con prefetch_related
         """
-        return self.model_class.objects.prefetch_related(*fields)
+        return self._reader.prefetch_related(*fields)
     
     def raw_query(self, query: str, params: List[Any] = None) -> QuerySet[T]:
         """
@@ -519,7 +1280,7 @@ class GenericDAO(Generic[T]):
         Returns:
             QuerySet con resultados
         """
-        return self.model_class.objects.raw(query, params or [])
+        return self._reader.raw(query, params or [])
     
     def aggregate(self, **kwargs) -> Dict[str, Any]:
         """
@@ -531,7 +1292,7 @@ class GenericDAO(Generic[T]):
         Returns:
             Diccionario con resultados de agregación
         """
-        return self.model_class.objects.aggregate(**kwargs)
+        return self._reader.aggregate(**kwargs)
     
     def values(self, *fields, active_only: bool = False) -> QuerySet:
         """
@@ -571,8 +1332,8 @@ class GenericDAO(Generic[T]):
             QuerySet con distinct
         """
         if fields:
-            return self.model_class.objects.distinct(*fields)
-        return self.model_class.objects.distinct()
+            return self._reader.distinct(*fields)
+        return self._reader.distinct()
 
 
 # ==================== DAOs Específicos ====================
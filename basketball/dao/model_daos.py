@@ -2,13 +2,39 @@
 DAOs específicos para los modelos del módulo Basketball
 """
 
-from django.db.models import Q, Avg, Count
-from typing import List, Optional, Dict, Any
+from datetime import date
+from itertools import islice
+from django.db import IntegrityError, connections, transaction
+from django.db.models import (
+    F, Q, Avg, Case, Count, FloatField, IntegerField, Max, Min, OuterRef, Prefetch,
+    QuerySet, Subquery, Value, When, Window
+)
+from django.db.models.functions import Coalesce, Concat, Greatest, Rank, RowNumber
+from typing import List, Optional, Dict, Any, Iterable
 
 from .generic_dao import GenericDAO, ModelDAO
+from .routing import PRIMARY
 from basketball.models import (
-    Usuario, Atleta, GrupoAtleta, Inscripcion,
-    PruebaAntropometrica, PruebaFisica, Entrenador, EstudianteVinculacion
+    Usuario, Atleta, GrupoAtleta, Inscripcion, PruebaAntropometrica, PruebaFisica,
+    RankingPrueba, Entrenador, EstudianteVinculacion, TIPOS_MENOR_ES_MEJOR
+)
+
+
+def own_fields(model) -> List[str]:
+    """Nombres de las columnas propias de un modelo (para perfiles con only())"""
+    return [field.name for field in model._meta.concrete_fields]
+
+
+# Columnas del atleta que necesitan los serializers de registros dependientes
+ATLETA_NOMBRE_FIELDS = ['atleta__nombre_atleta', 'atleta__apellido_atleta']
+
+# Atletas activos por grupo, calculado en SQL (lo lee GrupoAtletaSerializer)
+CANTIDAD_ATLETAS_ACTIVOS = Count('atletas', filter=Q(atletas__estado=True))
+
+# Grupos de un entrenador con su cantidad de atletas ya anotada
+GRUPOS_CON_CANTIDAD = Prefetch(
+    'grupos',
+    queryset=GrupoAtleta.objects.annotate(cantidad_atletas=CANTIDAD_ATLETAS_ACTIVOS)
 )
 
 
@@ -42,6 +68,13 @@ class UsuarioDAO(ModelDAO[Usuario]):
 class GrupoAtletaDAO(ModelDAO[GrupoAtleta]):
     """DAO específico para GrupoAtleta"""
     
+    loading_profiles = {
+        'list': {'annotate': {'cantidad_atletas': CANTIDAD_ATLETAS_ACTIVOS}},
+        'detail': {'annotate': {'cantidad_atletas': CANTIDAD_ATLETAS_ACTIVOS}},
+    }
+    
+    cache_enabled = True
+    
     def __init__(self):
         super().__init__(GrupoAtleta)
     
@@ -49,6 +82,11 @@ class GrupoAtletaDAO(ModelDAO[GrupoAtleta]):
         """Buscar grupo por nombre"""
         return self.find_by_field('nombre', nombre)
     
+    def find_by_atleta(self, atleta_id: int) -> Optional[GrupoAtleta]:
+        """Obtener el grupo de un atleta sin leer antes el atleta (una sola consulta)"""
+        grupo_id = Atleta.objects.filter(pk=atleta_id).values('grupo_id')[:1]
+        return self.find_all().filter(pk=Subquery(grupo_id)).first()
+    
     def find_by_categoria(self, categoria: str) -> List[GrupoAtleta]:
         """Buscar grupos por categoría"""
         return list(self.find_by_filters({'categoria': categoria}, active_only=True))
@@ -72,13 +110,41 @@ class GrupoAtletaDAO(ModelDAO[GrupoAtleta]):
 class AtletaDAO(ModelDAO[Atleta]):
     """DAO específico para Atleta"""
     
+    loading_profiles = {
+        'list': {'select_related': ['grupo']},
+        'detail': {'select_related': ['grupo']},
+    }
+    
+    derived_fields = ('edad',)
+    
+    cache_enabled = True
+    
+    # Los rankings copian el grupo y el sexo de estos atletas
+    change_keys = ('id',)
+    
     def __init__(self):
         super().__init__(Atleta)
     
+    def prepare_instances(self, instances: List[Atleta]) -> List[Atleta]:
+        """Calcular la edad de todo el lote con una única fecha de referencia"""
+        hoy = date.today()
+        for atleta in instances:
+            nacimiento = atleta.fecha_nacimiento
+            atleta.edad = hoy.year - nacimiento.year - (
+                (hoy.month, hoy.day) < (nacimiento.month, nacimiento.day)
+            )
+        return instances
+    
     def find_by_dni(self, dni: str) -> Optional[Atleta]:
         """Buscar atleta por DNI"""
         return self.find_by_field('dni', dni)
     
+    def find_ids_by_dnis(self, dnis: List[str]) -> Dict[str, int]:
+        """Resolver varios DNI a IDs de atleta en una sola consulta"""
+        return dict(
+            self.model_class.objects.filter(dni__in=set(dnis)).values_list('dni', 'id')
+        )
+    
     def find_by_grupo(self, grupo_id: int) -> List[Atleta]:
         """Buscar atletas por grupo"""
         return list(self.find_by_filters({'grupo_id': grupo_id}, active_only=True))
@@ -96,6 +162,10 @@ class AtletaDAO(ModelDAO[Atleta]):
     
     def search(self, criterios: Dict[str, Any]) -> List[Atleta]:
         """Buscar atletas con criterios avanzados"""
+        return list(self.search_queryset(criterios))
+    
+    def search_queryset(self, criterios: Dict[str, Any]) -> QuerySet:
+        """QuerySet de atletas filtrado por criterios avanzados"""
         queryset = self.find_all(active_only=True)
         
         if criterios.get('nombre'):
@@ -111,7 +181,60 @@ class AtletaDAO(ModelDAO[Atleta]):
         if criterios.get('edad_max'):
             queryset = queryset.filter(edad__lte=criterios['edad_max'])
         
-        return list(queryset)
+        return queryset
+    
+    def search_text(self, texto: str, limit: int = 20) -> List[Atleta]:
+        """
+        Búsqueda por texto libre sobre nombre, apellido y DNI, ordenada por relevancia.
+        
+        Cada palabra debe aparecer en alguno de los tres campos. En PostgreSQL los
+        filtros usan los índices trigram (pg_trgm) de la migración 0003 y el orden
+        se basa en la similitud; en otros motores se priorizan las coincidencias por
+        prefijo.
+        
+        Args:
+            texto: Texto ingresado por el usuario
+            limit: Máximo de resultados
+            
+        Returns:
+            Lista de atletas activos más relevantes
+        """
+        terminos = texto.split()
+        if not terminos:
+            return []
+        
+        queryset = self.find_all(active_only=True)
+        for termino in terminos:
+            queryset = queryset.filter(
+                Q(nombre_atleta__icontains=termino) |
+                Q(apellido_atleta__icontains=termino) |
+                Q(dni__contains=termino)
+            )
+        
+        if connections[queryset.db].vendor == 'postgresql':
+            from django.contrib.postgres.search import TrigramSimilarity
+            
+            relevancia = Greatest(
+                TrigramSimilarity(
+                    Concat('nombre_atleta', Value(' '), 'apellido_atleta'), texto
+                ),
+                TrigramSimilarity('dni', texto),
+            )
+            queryset = queryset.annotate(relevancia=relevancia).order_by('-relevancia', 'id')
+        else:
+            primero = terminos[0]
+            relevancia = Case(
+                When(dni__startswith=primero, then=Value(0)),
+                When(nombre_atleta__istartswith=primero, then=Value(1)),
+                When(apellido_atleta__istartswith=primero, then=Value(2)),
+                default=Value(3),
+                output_field=IntegerField(),
+            )
+            queryset = queryset.annotate(relevancia=relevancia).order_by(
+                'relevancia', 'apellido_atleta', 'nombre_atleta', 'id'
+            )
+        
+        return list(queryset[:limit])
     
     def find_sin_grupo(self) -> List[Atleta]:
         """Obtener atletas sin grupo asignado"""
@@ -125,6 +248,14 @@ class AtletaDAO(ModelDAO[Atleta]):
 class InscripcionDAO(ModelDAO[Inscripcion]):
     """DAO específico para Inscripcion"""
     
+    loading_profiles = {
+        'list': {
+            'select_related': ['atleta'],
+            'only': own_fields(Inscripcion) + ATLETA_NOMBRE_FIELDS,
+        },
+        'detail': {'select_related': ['atleta']},
+    }
+    
     def __init__(self):
         super().__init__(Inscripcion)
         self._soft_delete_field = 'habilitada'  # Usar habilitada como soft delete
@@ -164,9 +295,26 @@ class InscripcionDAO(ModelDAO[Inscripcion]):
 class PruebaAntropometricaDAO(ModelDAO[PruebaAntropometrica]):
     """DAO específico para PruebaAntropometrica"""
     
+    loading_profiles = {
+        'list': {
+            'select_related': ['atleta'],
+            'only': own_fields(PruebaAntropometrica) + ATLETA_NOMBRE_FIELDS,
+        },
+        'detail': {'select_related': ['atleta']},
+    }
+    
+    derived_fields = ('indice_masa_corporal', 'indice_cornico')
+    
     def __init__(self):
         super().__init__(PruebaAntropometrica)
     
+    def prepare_instances(self, instances: List[PruebaAntropometrica]) -> List[PruebaAntropometrica]:
+        """Calcular IMC e índice córnico del lote (lo que haría save())"""
+        for prueba in instances:
+            prueba.calcular_imc()
+            prueba.calcular_indice_cornico()
+        return instances
+    
     def find_by_atleta(self, atleta_id: int) -> List[PruebaAntropometrica]:
         """Buscar pruebas de un atleta"""
         return list(
@@ -183,6 +331,30 @@ class PruebaAntropometricaDAO(ModelDAO[PruebaAntropometrica]):
             .first()
         )
     
+    def find_ultimas_by_atletas(self, atleta_ids: List[int]) -> Dict[int, PruebaAntropometrica]:
+        """Obtener la última prueba de varios atletas en una sola consulta"""
+        return {prueba.atleta_id: prueba for prueba in self._ultimas_by_atletas_queryset(atleta_ids)}
+    
+    async def afind_ultimas_by_atletas(self, atleta_ids: List[int]) -> Dict[int, PruebaAntropometrica]:
+        """Versión asíncrona de find_ultimas_by_atletas"""
+        return {
+            prueba.atleta_id: prueba
+            async for prueba in self._ultimas_by_atletas_queryset(atleta_ids)
+        }
+    
+    def _ultimas_by_atletas_queryset(self, atleta_ids: List[int]) -> QuerySet:
+        """Última prueba activa de cada atleta, con el perfil de detalle"""
+        ultima = (
+            self.find_all(active_only=True)
+            .filter(atleta_id=OuterRef('atleta_id'))
+            .order_by('-fecha_registro', '-id')
+            .values('id')[:1]
+        )
+        return (
+            self.with_profile('detail').find_all(active_only=True)
+            .filter(atleta_id__in=atleta_ids, id=Subquery(ultima))
+        )
+    
     def get_promedio_imc_by_grupo(self, grupo_id: int) -> Optional[float]:
         """Obtener promedio de IMC de un grupo"""
         result = (
@@ -192,24 +364,61 @@ class PruebaAntropometricaDAO(ModelDAO[PruebaAntropometrica]):
         )
         return result.get('promedio')
     
-    def get_estadisticas_by_atleta(self, atleta_id: int) -> Dict[str, Any]:
-        """Obtener estadísticas antropométricas de un atleta"""
-        pruebas = self.find_by_atleta(atleta_id)
-        if not pruebas:
+    def get_estadisticas_by_atleta(
+        self,
+        atleta_id: int,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtener estadísticas antropométricas de un atleta, calculadas en la base de datos.
+        
+        Args:
+            atleta_id: ID del atleta
+            fecha_desde: Considerar solo pruebas registradas desde esta fecha (inclusive)
+            fecha_hasta: Considerar solo pruebas registradas hasta esta fecha (inclusive)
+            
+        Returns:
+            Diccionario con totales y promedios, vacío si no hay pruebas en la ventana
+        """
+        pruebas = self.find_by_filters({'atleta_id': atleta_id}, active_only=True)
+        if fecha_desde:
+            pruebas = pruebas.filter(fecha_registro__gte=fecha_desde)
+        if fecha_hasta:
+            pruebas = pruebas.filter(fecha_registro__lte=fecha_hasta)
+        
+        resumen = pruebas.aggregate(
+            total_pruebas=Count('id'),
+            promedio_imc=Avg(Coalesce('indice_masa_corporal', 0.0, output_field=FloatField())),
+            promedio_peso=Avg('peso'),
+            promedio_estatura=Avg('estatura'),
+        )
+        if not resumen['total_pruebas']:
             return {}
         
         return {
-            'total_pruebas': len(pruebas),
-            'ultima_prueba': pruebas[0] if pruebas else None,
-            'promedio_imc': sum(p.indice_masa_corporal or 0 for p in pruebas) / len(pruebas),
-            'promedio_peso': sum(p.peso for p in pruebas) / len(pruebas),
-            'promedio_estatura': sum(p.estatura for p in pruebas) / len(pruebas),
+            'total_pruebas': resumen['total_pruebas'],
+            'ultima_prueba': pruebas.order_by('-fecha_registro', '-id').first(),
+            'promedio_imc': resumen['promedio_imc'],
+            'promedio_peso': resumen['promedio_peso'],
+            'promedio_estatura': resumen['promedio_estatura'],
         }
 
 
 class PruebaFisicaDAO(ModelDAO[PruebaFisica]):
     """DAO específico para PruebaFisica"""
     
+    loading_profiles = {
+        'list': {
+            'select_related': ['atleta'],
+            'only': own_fields(PruebaFisica) + ATLETA_NOMBRE_FIELDS,
+        },
+        'detail': {'select_related': ['atleta']},
+    }
+    
+    # Los rankings se recalculan solo para estos atletas
+    change_keys = ('atleta_id',)
+    
     def __init__(self):
         super().__init__(PruebaFisica)
     
@@ -250,27 +459,266 @@ class PruebaFisicaDAO(ModelDAO[PruebaFisica]):
         return result.get('promedio')
     
     def get_estadisticas_by_atleta(self, atleta_id: int) -> Dict[str, Any]:
-        """Obtener estadísticas físicas de un atleta"""
+        """Obtener estadísticas físicas de un atleta (una sola consulta agrupada por tipo)"""
+        return self.get_estadisticas_by_atletas([atleta_id]).get(atleta_id, {})
+    
+    def get_estadisticas_by_atletas(self, atleta_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Obtener estadísticas físicas de varios atletas en una sola consulta agrupada"""
+        filas = list(self._estadisticas_by_atletas_queryset(atleta_ids))
+        return self._group_estadisticas(filas, atleta_ids)
+    
+    async def aget_estadisticas_by_atletas(self, atleta_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Versión asíncrona de get_estadisticas_by_atletas"""
+        filas = [fila async for fila in self._estadisticas_by_atletas_queryset(atleta_ids)]
+        return self._group_estadisticas(filas, atleta_ids)
+    
+    def _estadisticas_by_atletas_queryset(self, atleta_ids: List[int]) -> QuerySet:
+        """Una fila por (atleta, tipo de prueba) con total, último, mejor resultado y promedio"""
+        ultimo_resultado = (
+            self.find_all(active_only=True)
+            .filter(atleta_id=OuterRef('atleta_id'), tipo_prueba=OuterRef('tipo_prueba'))
+            .order_by('-fecha_registro', '-id')
+            .values('resultado')[:1]
+        )
+        return (
+            self.find_all(active_only=True)
+            .filter(atleta_id__in=atleta_ids)
+            .order_by()
+            .values('atleta_id', 'tipo_prueba')
+            .annotate(
+                total_pruebas=Count('id'),
+                ultimo_resultado=Subquery(ultimo_resultado),
+                # En los tipos de tiempo gana el menor resultado, como en el ranking
+                mejor_resultado=Case(
+                    When(tipo_prueba__in=list(TIPOS_MENOR_ES_MEJOR), then=Min('resultado')),
+                    default=Max('resultado'),
+                    output_field=FloatField(),
+                ),
+                promedio=Avg('resultado'),
+            )
+        )
+    
+    def _group_estadisticas(self, filas: List[Dict[str, Any]], atleta_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Agrupar las filas de _estadisticas_by_atletas_queryset por atleta y tipo de prueba"""
         from basketball.models import TipoPrueba
         
+        filas = {(fila['atleta_id'], fila['tipo_prueba']): fila for fila in filas}
         estadisticas = {}
-        for tipo_choice in TipoPrueba.choices:
-            tipo = tipo_choice[0]
-            pruebas = self.find_by_atleta_y_tipo(atleta_id, tipo)
-            if pruebas:
-                estadisticas[tipo] = {
-                    'total_pruebas': len(pruebas),
-                    'ultimo_resultado': pruebas[0].resultado,
-                    'mejor_resultado': max(p.resultado for p in pruebas),
-                    'promedio': sum(p.resultado for p in pruebas) / len(pruebas),
-                }
+        for atleta_id in atleta_ids:
+            por_tipo = {}
+            for tipo, _ in TipoPrueba.choices:
+                fila = filas.get((atleta_id, tipo))
+                if fila:
+                    por_tipo[tipo] = {
+                        'total_pruebas': fila['total_pruebas'],
+                        'ultimo_resultado': fila['ultimo_resultado'],
+                        'mejor_resultado': fila['mejor_resultado'],
+                        'promedio': fila['promedio'],
+                    }
+            if por_tipo:
+                estadisticas[atleta_id] = por_tipo
         
         return estadisticas
 
 
+class RankingPruebaDAO(ModelDAO[RankingPrueba]):
+    """
+    DAO para la tabla resumen de rankings (mejor resultado por atleta y tipo de prueba).
+    
+    Las filas se recalculan desde PruebaFisica solo para los atletas afectados
+    por cada escritura (refresh_atletas); rebuild reconstruye la tabla completa.
+    """
+    
+    loading_profiles = {
+        'list': {
+            'select_related': ['atleta', 'grupo'],
+            'only': own_fields(RankingPrueba) + ATLETA_NOMBRE_FIELDS + ['grupo__nombre'],
+        },
+        'detail': {'select_related': ['atleta', 'grupo']},
+    }
+    
+    # Filas por INSERT al reconstruir la tabla y atletas por consulta al recalcular
+    batch_size = 1000
+    
+    def __init__(self):
+        super().__init__(RankingPrueba)
+        self._soft_delete_field = None  # No tiene campo de estado
+    
+    def leaderboard(
+        self, tipo_prueba: str, grupo_id: Optional[int] = None, sexo: Optional[str] = None
+    ) -> QuerySet:
+        """
+        Ranking de un tipo de prueba, del mejor al peor resultado.
+        
+        Solo incluye atletas activos. ``posicion`` se anota con RANK(): los
+        empates comparten posición y se ordenan por quién lo logró primero.
+        """
+        filtros = {'tipo_prueba': tipo_prueba, 'atleta__estado': True}
+        if grupo_id is not None:
+            filtros['grupo_id'] = grupo_id
+        if sexo:
+            filtros['sexo'] = sexo
+        return (
+            self.find_all()
+            .filter(**filtros)
+            .annotate(posicion=Window(Rank(), order_by=F('puntaje').asc()))
+            .order_by('puntaje', 'fecha_registro', 'atleta_id')
+        )
+    
+    def add_prueba(self, prueba: PruebaFisica) -> None:
+        """Sumar una prueba nueva a la fila de su atleta y tipo (sin recalcular)"""
+        if not prueba.estado:
+            return
+        puntaje = RankingPrueba.calcular_puntaje(prueba.tipo_prueba, prueba.resultado)
+        with transaction.atomic(using=PRIMARY):
+            fila = (
+                self.model_class.objects.select_for_update()
+                .filter(atleta_id=prueba.atleta_id, tipo_prueba=prueba.tipo_prueba)
+                .first()
+            )
+            if fila is None:
+                atleta = prueba.atleta
+                try:
+                    # Sin fila no hay nada que bloquear: otra prueba simultánea del
+                    # mismo atleta y tipo puede crearla primero
+                    with transaction.atomic(using=PRIMARY):
+                        self.model_class.objects.create(
+                            atleta_id=prueba.atleta_id, tipo_prueba=prueba.tipo_prueba,
+                            grupo_id=atleta.grupo_id, sexo=atleta.sexo, total_pruebas=1,
+                            **self._best_fields(prueba, puntaje)
+                        )
+                except IntegrityError:
+                    self.refresh_atletas([prueba.atleta_id])
+                return
+            fila.total_pruebas += 1
+            campos = ['total_pruebas']
+            # En empate se conserva la prueba anterior (la primera en lograrlo)
+            if puntaje < fila.puntaje:
+                for campo, valor in self._best_fields(prueba, puntaje).items():
+                    setattr(fila, campo, valor)
+                campos += ['prueba', 'mejor_resultado', 'puntaje', 'unidad_medida', 'fecha_registro']
+            fila.save(update_fields=campos)
+    
+    def remove_prueba(self, prueba: PruebaFisica) -> None:
+        """Descontar una prueba eliminada; si era la mejor se recalcula la fila"""
+        if not prueba.estado:
+            return
+        descontadas = (
+            self.model_class.objects
+            .filter(atleta_id=prueba.atleta_id, tipo_prueba=prueba.tipo_prueba)
+            .exclude(prueba_id=prueba.pk)
+            .update(total_pruebas=F('total_pruebas') - 1)
+        )
+        # Sin fila: era la mejor (su fila se eliminó en cascada)
+        if not descontadas:
+            self.refresh_atletas([prueba.atleta_id])
+    
+    def _best_fields(self, prueba: PruebaFisica, puntaje: float) -> Dict[str, Any]:
+        return {
+            'prueba_id': prueba.pk,
+            'mejor_resultado': prueba.resultado,
+            'puntaje': puntaje,
+            'unidad_medida': prueba.unidad_medida,
+            'fecha_registro': prueba.fecha_registro,
+        }
+    
+    def refresh_atletas(self, atleta_ids: Iterable[int]) -> int:
+        """Recalcular las filas de algunos atletas (todas sus pruebas de todos los tipos)"""
+        atleta_ids = sorted(set(atleta_ids))
+        filas = 0
+        with transaction.atomic(using=PRIMARY):
+            for inicio in range(0, len(atleta_ids), self.batch_size):
+                lote = atleta_ids[inicio:inicio + self.batch_size]
+                self.model_class.objects.filter(atleta_id__in=lote).delete()
+                filas += self._insert_rows(self._best_rows(lote))
+        return filas
+    
+    def rebuild(self) -> int:
+        """Reconstruir la tabla completa; devuelve la cantidad de filas"""
+        with transaction.atomic(using=PRIMARY):
+            self.model_class.objects.all().delete()
+            return self._insert_rows(self._best_rows().iterator(chunk_size=self.batch_size))
+    
+    def sync_atletas(self, atleta_ids: Optional[Iterable[int]] = None) -> int:
+        """Copiar grupo y sexo de los atletas a sus filas (None = todas)"""
+        atleta = Atleta.objects.filter(pk=OuterRef('atleta_id'))
+        valores = {
+            'grupo_id': Subquery(atleta.values('grupo_id')[:1]),
+            'sexo': Subquery(atleta.values('sexo')[:1]),
+        }
+        if atleta_ids is None:
+            return self.model_class.objects.update(**valores)
+        atleta_ids = sorted(set(atleta_ids))
+        return sum(
+            self.model_class.objects
+            .filter(atleta_id__in=atleta_ids[inicio:inicio + self.batch_size])
+            .update(**valores)
+            for inicio in range(0, len(atleta_ids), self.batch_size)
+        )
+    
+    def _best_rows(self, atleta_ids: Optional[List[int]] = None) -> QuerySet:
+        """Mejor prueba activa de cada (atleta, tipo) y su total de pruebas, leídas del primario"""
+        pruebas = PruebaFisica.objects.db_manager(PRIMARY).filter(estado=True)
+        if atleta_ids is not None:
+            pruebas = pruebas.filter(atleta_id__in=atleta_ids)
+        particion = [F('atleta_id'), F('tipo_prueba')]
+        return (
+            pruebas
+            .annotate(
+                puntaje=Case(
+                    When(tipo_prueba__in=list(TIPOS_MENOR_ES_MEJOR), then=F('resultado')),
+                    default=-F('resultado'),
+                    output_field=FloatField(),
+                ),
+                total=Window(Count('id'), partition_by=particion),
+            )
+            .annotate(
+                orden=Window(
+                    RowNumber(), partition_by=particion,
+                    order_by=[F('puntaje').asc(), F('fecha_registro').asc(), F('id').asc()],
+                ),
+            )
+            .filter(orden=1)
+            .values(
+                'id', 'atleta_id', 'tipo_prueba', 'resultado', 'puntaje', 'unidad_medida',
+                'fecha_registro', 'total', 'atleta__grupo_id', 'atleta__sexo',
+            )
+        )
+    
+    def _insert_rows(self, filas: Iterable[Dict[str, Any]]) -> int:
+        """Insertar por lotes las filas de _best_rows"""
+        filas = iter(filas)
+        total = 0
+        while True:
+            lote = [
+                self.model_class(
+                    atleta_id=fila['atleta_id'],
+                    tipo_prueba=fila['tipo_prueba'],
+                    grupo_id=fila['atleta__grupo_id'],
+                    sexo=fila['atleta__sexo'],
+                    prueba_id=fila['id'],
+                    mejor_resultado=fila['resultado'],
+                    puntaje=fila['puntaje'],
+                    unidad_medida=fila['unidad_medida'],
+                    fecha_registro=fila['fecha_registro'],
+                    total_pruebas=fila['total'],
+                )
+                for fila in islice(filas, self.batch_size)
+            ]
+            if not lote:
+                return total
+            self.model_class.objects.bulk_create(lote)
+            total += len(lote)
+
+
 class EntrenadorDAO(ModelDAO[Entrenador]):
     """DAO específico para Entrenador"""
     
+    loading_profiles = {
+        'list': {'select_related': ['usuario'], 'prefetch_related': [GRUPOS_CON_CANTIDAD]},
+        'detail': {'select_related': ['usuario'], 'prefetch_related': [GRUPOS_CON_CANTIDAD]},
+    }
+    
     def __init__(self):
         super().__init__(Entrenador)
         self._soft_delete_field = None  # No tiene campo de estado
@@ -311,16 +759,21 @@ class EntrenadorDAO(ModelDAO[Entrenador]):
         return None
     
     def get_grupos(self, entrenador_id: int) -> List:
-        """Obtener grupos de un entrenador"""
+        """Obtener grupos de un entrenador (con cantidad_atletas anotada)"""
         entrenador = self.find_by_id(entrenador_id)
         if entrenador:
-            return list(entrenador.grupos.all())
+            return list(entrenador.grupos.annotate(cantidad_atletas=CANTIDAD_ATLETAS_ACTIVOS))
         return []
 
 
 class EstudianteVinculacionDAO(ModelDAO[EstudianteVinculacion]):
     """DAO específico para EstudianteVinculacion"""
     
+    loading_profiles = {
+        'list': {'select_related': ['usuario']},
+        'detail': {'select_related': ['usuario']},
+    }
+    
     def __init__(self):
         super().__init__(EstudianteVinculacion)
         self._soft_delete_field = None  # No tiene campo de estado
@@ -0,0 +1,192 @@
+"""
+Enrutamiento de lecturas a réplicas
+Envía las lecturas a los alias de DATABASE_REPLICAS (round-robin, saltando las
+réplicas atrasadas o caídas) y las escrituras al primario. Tras la primera
+escritura de una petición, sus lecturas también van al primario.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = DEFAULT_DB_ALIAS
+
+# Valores por defecto si no se definen en settings
+DEFAULT_MAX_LAG = 5.0
+DEFAULT_LAG_CHECK_INTERVAL = 5.0
+
+# Retraso de una réplica PostgreSQL en segundos (0 si ya aplicó todo lo recibido)
+PG_LAG_SQL = (
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+# Lecturas fijadas al primario en el contexto actual (petición, hilo o tarea)
+_pinned: ContextVar[bool] = ContextVar('basketball_primary_pinned', default=False)
+
+
+def replica_aliases() -> List[str]:
+    """Alias de las réplicas configuradas en DATABASE_REPLICAS"""
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def pin_primary() -> None:
+    """Enviar al primario las lecturas restantes del contexto actual"""
+    _pinned.set(True)
+
+
+def is_pinned() -> bool:
+    """
+    Si las lecturas deben ir al primario.
+
+    Es así tras una escritura en el contexto actual o dentro de una
+    transacción abierta en el primario (las de TestCase no cuentan).
+    """
+    if _pinned.get():
+        return True
+    primary = connections[PRIMARY]
+    return any(not getattr(block, '_from_testcase', False) for block in primary.atomic_blocks)
+
+
+@contextmanager
+def primary_reads():
+    """Leer del primario dentro del bloque"""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+@contextmanager
+def request_scope():
+    """Ámbito de una petición: empieza leyendo de réplicas y olvida las escrituras al salir"""
+    token = _pinned.set(False)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+class ReplicaMonitor:
+    """
+    Retraso de replicación de cada réplica.
+
+    El retraso se mide como mucho cada REPLICA_LAG_CHECK_INTERVAL segundos por
+    alias. Una réplica con más de REPLICA_MAX_LAG segundos de retraso, o que
+    no responde, no recibe lecturas hasta la siguiente medición.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lags: Dict[str, Optional[float]] = {}
+        self._checked: Dict[str, float] = {}
+
+    def measure(self, alias: str) -> float:
+        """Consultar el retraso actual de una réplica (0 en motores sin replicación)"""
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            return 0.0
+        with connection.cursor() as cursor:
+            cursor.execute(PG_LAG_SQL)
+            return float(cursor.fetchone()[0])
+
+    def lag(self, alias: str) -> Optional[float]:
+        """Retraso en segundos de la última medición vigente, o None si la réplica falló"""
+        interval = getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', DEFAULT_LAG_CHECK_INTERVAL)
+        now = time.monotonic()
+        with self._lock:
+            if alias in self._checked and now - self._checked[alias] < interval:
+                return self._lags.get(alias)
+            # Los demás hilos usan el valor anterior mientras este mide
+            self._checked[alias] = now
+        try:
+            lag = self.measure(alias)
+        except DatabaseError as e:
+            logger.warning(f"Réplica {alias} no disponible: {e}")
+            lag = None
+        with self._lock:
+            self._lags[alias] = lag
+        return lag
+
+    def available(self, alias: str) -> bool:
+        """Si la réplica responde y su retraso está dentro de REPLICA_MAX_LAG"""
+        lag = self.lag(alias)
+        return lag is not None and lag <= getattr(settings, 'REPLICA_MAX_LAG', DEFAULT_MAX_LAG)
+
+    def stats(self) -> Dict[str, dict]:
+        """Última medición de cada réplica"""
+        max_lag = getattr(settings, 'REPLICA_MAX_LAG', DEFAULT_MAX_LAG)
+        with self._lock:
+            lags = {alias: self._lags.get(alias) for alias in replica_aliases() if alias in self._checked}
+        return {
+            alias: {"lag_seconds": lag, "available": lag is not None and lag <= max_lag}
+            for alias, lag in lags.items()
+        }
+
+    def reset(self) -> None:
+        """Olvidar las mediciones (la siguiente lectura vuelve a medir)"""
+        with self._lock:
+            self._lags.clear()
+            self._checked.clear()
+
+
+monitor = ReplicaMonitor()
+_turns = itertools.count()
+
+
+def read_alias() -> str:
+    """Alias para la próxima lectura: una réplica disponible por turnos, o el primario"""
+    replicas = replica_aliases()
+    if not replicas or is_pinned():
+        return PRIMARY
+    start = next(_turns)
+    for offset in range(len(replicas)):
+        alias = replicas[(start + offset) % len(replicas)]
+        if monitor.available(alias):
+            return alias
+    return PRIMARY
+
+
+class ReplicaRouter:
+    """
+    Router de Django para primario + réplicas de lectura.
+
+    Se activa con DATABASE_ROUTERS = ['basketball.dao.routing.ReplicaRouter'].
+    Las réplicas no se migran: reciben el esquema por replicación.
+    """
+
+    def db_for_read(self, model, **hints):
+        if is_pinned():
+            return PRIMARY
+        # Las relaciones de una instancia se leen de la base de la que vino
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        # Read-your-writes: el resto de la petición lee del primario
+        pin_primary()
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {PRIMARY, *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_aliases():
+            return False
+        return None
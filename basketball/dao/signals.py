@@ -0,0 +1,11 @@
+"""
+Señales de los DAOs
+"""
+
+from django.dispatch import Signal
+
+# Escritura masiva que no emite post_save/post_delete (bulk_create, bulk_ingest,
+# bulk_update, update_by_filters, delete_by_filters). sender: clase del modelo;
+# keys: {columna: valores} de las filas afectadas para cada columna de
+# GenericDAO.change_keys (antes y después de la escritura)
+bulk_changed = Signal()
@@ -0,0 +1,237 @@
+"""
+Benchmark de los caminos críticos de DAOs y API
+Ejecutar con: python manage.py bench [--atletas 10000] [--pruebas 1000000]
+              [--salida bench.json] [--baseline bench_base.json] [--umbral 20]
+
+Siembra el volumen indicado, mide cada operación y escribe los resultados en
+JSON. Con --baseline compara contra una ejecución anterior y falla si alguna
+operación es más lenta que el umbral permitido. Todo se ejecuta dentro de una
+transacción que se revierte al terminar (salvo con --conservar). La caché de
+respuestas se desactiva para medir siempre el camino ViewSet -> DAO.
+"""
+
+import json
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from basketball.dao import AtletaDAO, PruebaFisicaDAO
+from basketball.models import Atleta, GrupoAtleta, PruebaFisica, TipoPrueba
+from basketball.views import AtletaViewSet, GrupoAtletaViewSet, PruebaFisicaViewSet
+
+
+NOMBRES = ['Juan', 'María', 'Carlos', 'Ana', 'Luis', 'Sofía', 'Pedro', 'Lucía', 'Diego', 'Valeria']
+APELLIDOS = ['Pérez', 'González', 'López', 'Martínez', 'Rodríguez', 'Sánchez', 'Torres', 'Vega']
+TIPOS_PRUEBA = [tipo for tipo, _ in TipoPrueba.choices]
+
+TAMANO_LOTE = 5000
+TAMANO_BULK_CREATE = 1000
+
+
+class Command(BaseCommand):
+    help = 'Mide los caminos críticos de DAOs y API y los compara con una línea base'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--atletas', type=int, default=10000,
+                            help='Atletas a sembrar (default: 10000)')
+        parser.add_argument('--pruebas', type=int, default=1000000,
+                            help='Pruebas físicas a sembrar (default: 1000000)')
+        parser.add_argument('--repeticiones', type=int, default=5,
+                            help='Ejecuciones por operación (default: 5)')
+        parser.add_argument('--semilla', type=int, default=42,
+                            help='Semilla para los datos generados (default: 42)')
+        parser.add_argument('--salida', default='bench.json',
+                            help='Archivo JSON donde guardar los resultados (default: bench.json)')
+        parser.add_argument('--baseline',
+                            help='Archivo JSON de una ejecución anterior para comparar')
+        parser.add_argument('--umbral', type=float, default=20.0,
+                            help='Porcentaje de lentitud tolerado frente a la línea base (default: 20)')
+        parser.add_argument('--conservar', action='store_true',
+                            help='Conservar los datos sembrados en lugar de revertirlos')
+
+    def handle(self, *args, **options):
+        if options['atletas'] < 1 or options['pruebas'] < 0:
+            raise CommandError('Se necesita al menos un atleta y una cantidad de pruebas no negativa')
+        baseline = self.cargar_baseline(options['baseline'])
+
+        with transaction.atomic():
+            self.stdout.write(self.style.HTTP_INFO(
+                f"Sembrando {options['atletas']} atletas y {options['pruebas']} pruebas físicas..."
+            ))
+            inicio = time.perf_counter()
+            atleta_ids = self.sembrar(options['atletas'], options['pruebas'], options['semilla'])
+            self.stdout.write(f'  Sembrado en {time.perf_counter() - inicio:.1f} s')
+
+            resultados = self.medir(atleta_ids, max(options['repeticiones'], 1), options['semilla'])
+
+            if not options['conservar']:
+                transaction.set_rollback(True)
+
+        reporte = {
+            'meta': {
+                'fecha': timezone.now().isoformat(),
+                'motor': connection.vendor,
+                'atletas': options['atletas'],
+                'pruebas': options['pruebas'],
+                'repeticiones': options['repeticiones'],
+            },
+            'resultados': resultados,
+        }
+        with open(options['salida'], 'w', encoding='utf-8') as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['salida']}"))
+
+        regresiones = self.comparar(resultados, baseline, options['umbral'])
+        if regresiones:
+            raise CommandError(
+                f"{len(regresiones)} operaciones superan el umbral de {options['umbral']}%: "
+                + ', '.join(regresiones)
+            )
+
+    def cargar_baseline(self, ruta):
+        """Leer los resultados de una ejecución anterior"""
+        if not ruta:
+            return None
+        try:
+            with open(ruta, encoding='utf-8') as archivo:
+                return json.load(archivo)['resultados']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'No se pudo leer la línea base {ruta}: {e}')
+
+    def sembrar(self, cantidad_atletas, cantidad_pruebas, semilla):
+        """Crear grupos, atletas y pruebas físicas en lotes; devuelve los IDs de los atletas"""
+        aleatorio = random.Random(semilla)
+        hoy = date.today()
+
+        grupos = GrupoAtleta.objects.bulk_create([
+            GrupoAtleta(nombre=f'Bench Sub-{edad}', rango_edad_minima=edad - 1,
+                        rango_edad_maxima=edad, categoria='Bench')
+            for edad in range(9, 20, 2)
+        ])
+
+        primer_id = (Atleta.objects.order_by('-id').values_list('id', flat=True).first() or 0)
+        atletas = []
+        for i in range(cantidad_atletas):
+            edad = aleatorio.randint(8, 19)
+            atletas.append(Atleta(
+                nombre_atleta=aleatorio.choice(NOMBRES),
+                apellido_atleta=aleatorio.choice(APELLIDOS),
+                dni=f'B{semilla:03d}{i:09d}',
+                fecha_nacimiento=hoy - timedelta(days=edad * 365 + aleatorio.randint(0, 364)),
+                edad=edad,
+                sexo=aleatorio.choice(['Masculino', 'Femenino']),
+                grupo=grupos[(edad - 8) // 2],
+            ))
+        Atleta.objects.bulk_create(atletas, batch_size=TAMANO_LOTE)
+        atleta_ids = list(
+            Atleta.objects.filter(id__gt=primer_id, dni__startswith=f'B{semilla:03d}')
+            .values_list('id', flat=True)
+        )
+
+        lote = []
+        for _ in range(cantidad_pruebas):
+            lote.append(PruebaFisica(
+                atleta_id=aleatorio.choice(atleta_ids),
+                tipo_prueba=aleatorio.choice(TIPOS_PRUEBA),
+                resultado=round(aleatorio.uniform(1, 100), 2),
+                unidad_medida='unidades',
+            ))
+            if len(lote) == TAMANO_LOTE:
+                PruebaFisica.objects.bulk_create(lote)
+                lote = []
+        if lote:
+            PruebaFisica.objects.bulk_create(lote)
+
+        return atleta_ids
+
+    def medir(self, atleta_ids, repeticiones, semilla):
+        """Medir cada operación crítica; devuelve estadísticas en milisegundos"""
+        aleatorio = random.Random(semilla)
+        factory = APIRequestFactory()
+        listar_atletas = AtletaViewSet.as_view({'get': 'list'})
+        listar_grupos = GrupoAtletaViewSet.as_view({'get': 'list'})
+        listar_pruebas = PruebaFisicaViewSet.as_view({'get': 'list'})
+        atleta_dao = AtletaDAO()
+        prueba_dao = PruebaFisicaDAO()
+
+        def bulk_create():
+            prueba_dao.bulk_create([
+                {
+                    'atleta_id': aleatorio.choice(atleta_ids),
+                    'tipo_prueba': aleatorio.choice(TIPOS_PRUEBA),
+                    'resultado': 50.0,
+                    'unidad_medida': 'unidades',
+                }
+                for _ in range(TAMANO_BULK_CREATE)
+            ])
+
+        operaciones = {
+            'AtletaDAO.search': lambda: atleta_dao.search(
+                {'apellido': 'Pérez', 'edad_min': 12, 'edad_max': 15}
+            ),
+            'PruebaFisicaDAO.get_estadisticas_by_atleta': lambda: (
+                prueba_dao.get_estadisticas_by_atleta(aleatorio.choice(atleta_ids))
+            ),
+            'GET /atletas/': lambda: listar_atletas(
+                factory.get('/api/v1/atletas/', {'page_size': 50})
+            ).render(),
+            'GET /grupos/': lambda: listar_grupos(
+                factory.get('/api/v1/grupos/')
+            ).render(),
+            'GET /pruebas-fisicas/': lambda: listar_pruebas(
+                factory.get('/api/v1/pruebas-fisicas/', {'page_size': 50})
+            ).render(),
+            'GET /pruebas-fisicas/ (página 100)': lambda: listar_pruebas(
+                factory.get('/api/v1/pruebas-fisicas/', {'page_size': 50, 'page': 100})
+            ).render(),
+            'GET /pruebas-fisicas/ (cursor)': lambda: listar_pruebas(
+                factory.get('/api/v1/pruebas-fisicas/', {'page_size': 50, 'cursor': ''})
+            ).render(),
+            f'GenericDAO.bulk_create ({TAMANO_BULK_CREATE})': bulk_create,
+        }
+
+        resultados = {}
+        for nombre, operacion in operaciones.items():
+            tiempos = []
+            for _ in range(repeticiones):
+                # Sin caché de respuestas: las repeticiones no deben medir una lectura de caché
+                with override_settings(RESPONSE_CACHE_TIMEOUT=0):
+                    inicio = time.perf_counter()
+                    operacion()
+                    tiempos.append((time.perf_counter() - inicio) * 1000)
+            resultados[nombre] = {
+                'media_ms': round(statistics.mean(tiempos), 3),
+                'min_ms': round(min(tiempos), 3),
+                'max_ms': round(max(tiempos), 3),
+            }
+            self.stdout.write(f"  {nombre:<50}{resultados[nombre]['media_ms']:>12.3f} ms")
+        return resultados
+
+    def comparar(self, resultados, baseline, umbral):
+        """Comparar contra la línea base; devuelve las operaciones con regresión"""
+        if baseline is None:
+            return []
+        regresiones = []
+        self.stdout.write(self.style.SUCCESS('=' * 90))
+        self.stdout.write(f'{"Operación":<50}{"base":>12}{"actual":>12}{"cambio":>12}')
+        self.stdout.write(self.style.SUCCESS('=' * 90))
+        for nombre, actual in resultados.items():
+            base = baseline.get(nombre)
+            if not base or not base.get('media_ms'):
+                self.stdout.write(f'{nombre:<50}{"-":>12}{actual["media_ms"]:>12.3f}{"nuevo":>12}')
+                continue
+            cambio = (actual['media_ms'] / base['media_ms'] - 1) * 100
+            linea = f'{nombre:<50}{base["media_ms"]:>12.3f}{actual["media_ms"]:>12.3f}{cambio:>+11.1f}%'
+            if cambio > umbral:
+                regresiones.append(nombre)
+                self.stdout.write(self.style.ERROR(linea))
+            else:
+                self.stdout.write(linea)
+        return regresiones
@@ -0,0 +1,144 @@
+"""
+Benchmark de los índices compuestos sobre las consultas frecuentes de los DAOs
+Ejecutar con: python manage.py bench_indexes [--repeticiones 20]
+
+Muestra el plan de ejecución y el tiempo medio de cada consulta con los índices
+de la migración 0002 y sin ellos (se eliminan dentro de una transacción que se
+revierte al terminar, por lo que la base de datos no queda modificada).
+"""
+
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from basketball.dao import (
+    AtletaDAO, InscripcionDAO, PruebaAntropometricaDAO, PruebaFisicaDAO
+)
+from basketball.models import (
+    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica
+)
+
+
+MODELOS_INDEXADOS = [Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica]
+
+
+class Command(BaseCommand):
+    help = 'Compara planes y tiempos de las consultas frecuentes con y sin índices compuestos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeticiones',
+            type=int,
+            default=20,
+            help='Ejecuciones por consulta para calcular el tiempo medio (default: 20)',
+        )
+        parser.add_argument(
+            '--planes',
+            action='store_true',
+            help='Mostrar el plan de ejecución completo de cada consulta',
+        )
+
+    def handle(self, *args, **options):
+        muestra = (
+            PruebaFisica.objects.filter(estado=True, atleta__grupo__isnull=False)
+            .values('atleta_id', 'atleta__grupo_id', 'tipo_prueba')
+            .first()
+        )
+        if not muestra:
+            raise CommandError(
+                'No hay pruebas físicas de atletas con grupo. Ejecute primero: python manage.py seed_data'
+            )
+
+        consultas = self.get_consultas(muestra)
+        repeticiones = max(options['repeticiones'], 1)
+
+        with transaction.atomic():
+            self.eliminar_indices()
+            sin_indices = self.medir(consultas, repeticiones)
+            transaction.set_rollback(True)
+        # Nueva conexión: evita reutilizar sentencias preparadas con el esquema sin índices
+        connection.close()
+        con_indices = self.medir(consultas, repeticiones)
+
+        self.stdout.write(self.style.SUCCESS('=' * 90))
+        self.stdout.write(f'{"Consulta":<45}{"sin índices":>15}{"con índices":>15}{"índice":>15}')
+        self.stdout.write(self.style.SUCCESS('=' * 90))
+        for nombre in consultas:
+            antes, despues = sin_indices[nombre], con_indices[nombre]
+            self.stdout.write(
+                f'{nombre:<45}{antes["ms"]:>12.3f} ms{despues["ms"]:>12.3f} ms'
+                f'{"sí" if despues["usa_indice"] else "no":>15}'
+            )
+            if options['planes']:
+                self.stdout.write(self.style.HTTP_INFO('  Plan sin índices:'))
+                self.stdout.write(self.indentar(antes['plan']))
+                self.stdout.write(self.style.HTTP_INFO('  Plan con índices:'))
+                self.stdout.write(self.indentar(despues['plan']))
+
+    def get_consultas(self, muestra):
+        """QuerySets equivalentes a los métodos de los DAOs que cubren los índices"""
+        atleta_id = muestra['atleta_id']
+        hace_un_mes = date.today() - timedelta(days=30)
+        return {
+            'AtletaDAO.find_by_grupo': lambda: (
+                AtletaDAO().find_by_filters({'grupo_id': muestra['atleta__grupo_id']}, active_only=True)
+                .order_by('pk')
+            ),
+            'InscripcionDAO.find_habilitadas': lambda: (
+                InscripcionDAO().find_by_filters({'habilitada': True})
+                .order_by('-fecha_inscripcion', '-id')[:10]
+            ),
+            'InscripcionDAO.tiene_inscripcion_activa': lambda: (
+                InscripcionDAO().find_by_filters({'atleta_id': atleta_id, 'habilitada': True})
+            ),
+            'PruebaAntropometricaDAO.find_by_atleta': lambda: (
+                PruebaAntropometricaDAO().find_by_filters({'atleta_id': atleta_id}, active_only=True)
+                .order_by('-fecha_registro')
+            ),
+            'PruebaFisicaDAO.find_by_atleta_y_tipo': lambda: (
+                PruebaFisicaDAO().find_by_filters(
+                    {'atleta_id': atleta_id, 'tipo_prueba': muestra['tipo_prueba']},
+                    active_only=True
+                ).order_by('-fecha_registro')
+            ),
+            'PruebaFisicaDAO.find_by_tipo': lambda: (
+                PruebaFisicaDAO().find_by_filters({'tipo_prueba': muestra['tipo_prueba']}, active_only=True)
+                .order_by('-fecha_registro')[:10]
+            ),
+            'buscar_pruebas (rango de fechas)': lambda: (
+                PruebaFisicaDAO().find_by_criteria({'fecha_registro__gte': hace_un_mes}, active_only=True)
+                .order_by('-fecha_registro', '-id')[:10]
+            ),
+        }
+
+    def medir(self, consultas, repeticiones):
+        """Plan y tiempo medio (ms) de cada consulta"""
+        nombres_indices = [
+            index.name for model in MODELOS_INDEXADOS for index in model._meta.indexes
+        ]
+        resultados = {}
+        for nombre, consulta in consultas.items():
+            plan = consulta().explain()
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                list(consulta())
+            resultados[nombre] = {
+                'ms': (time.perf_counter() - inicio) * 1000 / repeticiones,
+                'plan': plan,
+                'usa_indice': any(indice in plan for indice in nombres_indices),
+            }
+        return resultados
+
+    def eliminar_indices(self):
+        """Eliminar los índices compuestos (debe llamarse dentro de una transacción)"""
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for model in MODELOS_INDEXADOS:
+                for index in model._meta.indexes:
+                    cursor.execute(str(index.remove_sql(model, editor)))
+
+    def indentar(self, texto):
+        """Indentar un plan de ejecución para mostrarlo bajo su consulta"""
+        return '\n'.join(f'    {linea}' for linea in texto.splitlines())
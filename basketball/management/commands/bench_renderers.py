@@ -0,0 +1,104 @@
+"""
+Benchmark del renderer JSON de la API frente al JSONRenderer de DRF
+Ejecutar con: python manage.py bench_renderers [--limite 20000] [--repeticiones 5]
+
+Arma las respuestas de los listados más grandes (atletas, inscripciones y
+pruebas) con los serializers de la API y mide cuánto tarda cada renderer en
+codificarlas, y cada parser en leerlas. Verifica además que ambos renderers
+producen el mismo JSON.
+"""
+
+import io
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from basketball.dao import AtletaDAO, InscripcionDAO, PruebaAntropometricaDAO, PruebaFisicaDAO
+from basketball.serializers import (
+    AtletaSerializer, InscripcionSerializer, PruebaAntropometricaSerializer, PruebaFisicaSerializer
+)
+from basketball.services.api_response import APIResponse
+from basketball_project import renderers
+from basketball_project.renderers import FastJSONParser, FastJSONRenderer
+
+
+LISTADOS = [
+    ('GET /atletas/', AtletaDAO, AtletaSerializer),
+    ('GET /inscripciones/', InscripcionDAO, InscripcionSerializer),
+    ('GET /pruebas-antropometricas/', PruebaAntropometricaDAO, PruebaAntropometricaSerializer),
+    ('GET /pruebas-fisicas/', PruebaFisicaDAO, PruebaFisicaSerializer),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compara el renderer/parser JSON de la API con los de DRF en los listados más grandes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limite', type=int, default=20000,
+                            help='Registros por listado (default: 20000)')
+        parser.add_argument('--repeticiones', type=int, default=5,
+                            help='Ejecuciones por medición (default: 5)')
+
+    def handle(self, *args, **options):
+        if options['limite'] < 1:
+            raise CommandError('--limite debe ser mayor que cero')
+        repeticiones = max(options['repeticiones'], 1)
+        motor = 'orjson' if renderers.orjson is not None else 'json (orjson no instalado)'
+
+        cargas = self.armar_cargas(options['limite'])
+        if not cargas:
+            raise CommandError(
+                'No hay datos para medir. Ejecute primero: python manage.py seed_data --scale 20000'
+            )
+
+        stock, rapido = JSONRenderer(), FastJSONRenderer()
+        self.stdout.write(self.style.SUCCESS('=' * 100))
+        self.stdout.write(f'Renderer rápido con {motor}')
+        self.stdout.write(
+            f'{"Listado":<34}{"filas":>8}{"KB":>9}{"DRF ms":>11}{"rápido ms":>11}'
+            f'{"parse DRF":>11}{"parse ráp.":>11}{"x":>6}'
+        )
+        self.stdout.write(self.style.SUCCESS('=' * 100))
+
+        for nombre, filas, data in cargas:
+            salida_stock = stock.render(data)
+            salida_rapida = rapido.render(data)
+            if json.loads(salida_stock) != json.loads(salida_rapida):
+                self.stdout.write(self.style.ERROR(f'{nombre}: los renderers producen JSON distinto'))
+
+            render_stock = self.medir(lambda: stock.render(data), repeticiones)
+            render_rapido = self.medir(lambda: rapido.render(data), repeticiones)
+            parse_stock = self.medir(lambda: JSONParser().parse(io.BytesIO(salida_stock)), repeticiones)
+            parse_rapido = self.medir(lambda: FastJSONParser().parse(io.BytesIO(salida_stock)), repeticiones)
+
+            self.stdout.write(
+                f'{nombre:<34}{filas:>8}{len(salida_stock) / 1024:>9.0f}'
+                f'{render_stock:>11.2f}{render_rapido:>11.2f}'
+                f'{parse_stock:>11.2f}{parse_rapido:>11.2f}'
+                f'{render_stock / render_rapido:>6.1f}'
+            )
+
+    def armar_cargas(self, limite):
+        """Respuesta completa (APIResponse) de cada listado, ya serializada a datos Python"""
+        cargas = []
+        for nombre, dao_class, serializer_class in LISTADOS:
+            registros = list(dao_class().with_profile('list').find_all().order_by('id')[:limite])
+            if not registros:
+                continue
+            data = serializer_class(registros, many=True).data
+            response = APIResponse.success(data=data, message=f'Se encontraron {len(data)} registros')
+            cargas.append((nombre, len(registros), response.data))
+        return cargas
+
+    def medir(self, operacion, repeticiones):
+        """Tiempo medio en milisegundos"""
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            operacion()
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        return statistics.mean(tiempos)
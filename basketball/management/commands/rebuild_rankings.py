@@ -0,0 +1,25 @@
+"""
+Reconstrucción de la tabla de rankings de pruebas físicas
+Ejecutar con: python manage.py rebuild_rankings
+
+La tabla se mantiene sola con las escrituras de la API y de los DAOs; este
+comando sirve tras cargar pruebas por fuera de ellos (SQL directo, COPY,
+restauración de un respaldo).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from basketball.dao import RankingPruebaDAO
+
+
+class Command(BaseCommand):
+    help = 'Recalcula el mejor resultado de cada atleta por tipo de prueba'
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        filas = RankingPruebaDAO().rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rankings reconstruidos: {filas} filas en {time.perf_counter() - inicio:.1f} s'
+        ))
@@ -1,10 +1,18 @@
 """
 Script para poblar la base de datos con datos de ejemplo
 Ejecutar con: python manage.py seed_data
+Datos para pruebas de carga: python manage.py seed_data --scale 200000
 """
 
-from django.core.management.base import BaseCommand
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.utils import timezone
+from basketball.dao import RankingPruebaDAO
+from basketball.management.generador import (
+    CONFIG_PRUEBAS_FISICAS, TAMANO_LOTE, GeneradorDatos, prefijo_dni
+)
 from basketball.models import (
     Usuario, GrupoAtleta, Entrenador, EstudianteVinculacion,
     Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica,
@@ -23,8 +31,41 @@ class Command(BaseCommand):
             action='store_true',
             help='Eliminar datos existentes antes de crear nuevos',
         )
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=0,
+            help='Generar esta cantidad de atletas sintéticos para pruebas de carga',
+        )
+        parser.add_argument(
+            '--pruebas-por-atleta',
+            type=int,
+            default=10,
+            help='Media de pruebas físicas por atleta con --scale (default: 10)',
+        )
+        parser.add_argument(
+            '--antropometricas-por-atleta',
+            type=int,
+            default=3,
+            help='Media de pruebas antropométricas por atleta con --scale (default: 3)',
+        )
+        parser.add_argument(
+            '--semilla',
+            type=int,
+            default=42,
+            help='Semilla de los datos generados con --scale (default: 42)',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=TAMANO_LOTE,
+            help=f'Registros por bulk_create con --scale (default: {TAMANO_LOTE})',
+        )
 
     def handle(self, *args, **options):
+        # Antes de cualquier paso destructivo
+        self.validar_opciones(options)
+
         if options['clear']:
             self.stdout.write(self.style.WARNING('Eliminando datos existentes...'))
             self.clear_data()
@@ -36,6 +77,11 @@ class Command(BaseCommand):
         grupos = self.create_grupos()
         entrenadores = self.create_entrenadores(usuarios, grupos)
         estudiantes = self.create_estudiantes_vinculacion(usuarios)
+
+        if options['scale']:
+            self.create_datos_escala(grupos, options)
+            return
+
         atletas = self.create_atletas(grupos)
         inscripciones = self.create_inscripciones(atletas)
         pruebas_antropometricas = self.create_pruebas_antropometricas(atletas)
@@ -53,6 +99,58 @@ class Command(BaseCommand):
         self.stdout.write(f'  - Pruebas Físicas: {len(pruebas_fisicas)}')
         self.stdout.write(self.style.SUCCESS('=' * 50))
 
+    def validar_opciones(self, options):
+        """Rechazar opciones inválidas sin modificar la base de datos"""
+        if options['scale'] < 0:
+            raise CommandError('--scale debe ser un número positivo')
+        if options['lote'] < 1:
+            raise CommandError('--lote debe ser mayor que cero')
+        for opcion in ('pruebas_por_atleta', 'antropometricas_por_atleta'):
+            if options[opcion] < 0:
+                raise CommandError(f"--{opcion.replace('_', '-')} no puede ser negativo")
+        if (
+            options['scale'] and not options['clear']
+            and Atleta.objects.filter(dni__startswith=prefijo_dni(options['semilla'])).exists()
+        ):
+            raise CommandError(
+                f"Ya existen atletas generados con la semilla {options['semilla']}. "
+                'Use --clear o una --semilla distinta'
+            )
+
+    def create_datos_escala(self, grupos, options):
+        """Generar el volumen de pruebas de carga en lotes con bulk_create"""
+        self.stdout.write(self.style.HTTP_INFO(
+            f"Generando {options['scale']} atletas (semilla {options['semilla']})..."
+        ))
+        generador = GeneradorDatos(
+            semilla=options['semilla'],
+            tamano_lote=options['lote'],
+            salida=self.stdout,
+        )
+        inicio = time.perf_counter()
+        with transaction.atomic():
+            totales = generador.generar(
+                grupos,
+                options['scale'],
+                pruebas_por_atleta=options['pruebas_por_atleta'],
+                antropometricas_por_atleta=options['antropometricas_por_atleta'],
+            )
+            # Las pruebas se insertan sin señales: los rankings de los atletas
+            # generados se calculan al final
+            RankingPruebaDAO().refresh_atletas(
+                Atleta.objects.filter(dni__startswith=prefijo_dni(options['semilla']))
+                .values_list('id', flat=True)
+            )
+        duracion = time.perf_counter() - inicio
+
+        self.stdout.write(self.style.SUCCESS('=' * 50))
+        self.stdout.write(self.style.SUCCESS(f'Datos de carga creados en {duracion:.1f} s:'))
+        self.stdout.write(f"  - Atletas: {totales['atletas']}")
+        self.stdout.write(f"  - Inscripciones: {totales['inscripciones']}")
+        self.stdout.write(f"  - Pruebas Antropométricas: {totales['pruebas_antropometricas']}")
+        self.stdout.write(f"  - Pruebas Físicas: {totales['pruebas_fisicas']}")
+        self.stdout.write(self.style.SUCCESS('=' * 50))
+
     def clear_data(self):
         """Eliminar todos los datos existentes"""
         PruebaFisica.objects.all().delete()
@@ -451,39 +549,7 @@ class Command(BaseCommand):
         
         pruebas = []
         
-        # Definir rangos de resultados por tipo de prueba
-        pruebas_config = {
-            TipoPrueba.RESISTENCIA: {
-                'unidad': 'minutos',
-                'rango': (5, 15),  # Test de Cooper (tiempo en 2km)
-                'descripcion': 'Test de resistencia aeróbica',
-            },
-            TipoPrueba.VELOCIDAD: {
-                'unidad': 'segundos',
-                'rango': (3, 8),  # Sprint 30 metros
-                'descripcion': 'Sprint de velocidad 30m',
-            },
-            TipoPrueba.FUERZA: {
-                'unidad': 'repeticiones',
-                'rango': (5, 30),  # Flexiones o sentadillas
-                'descripcion': 'Test de fuerza muscular',
-            },
-            TipoPrueba.FLEXIBILIDAD: {
-                'unidad': 'centímetros',
-                'rango': (-5, 20),  # Sit and reach
-                'descripcion': 'Test de flexibilidad sit and reach',
-            },
-            TipoPrueba.AGILIDAD: {
-                'unidad': 'segundos',
-                'rango': (8, 18),  # Test de Illinois
-                'descripcion': 'Test de agilidad Illinois',
-            },
-            TipoPrueba.COORDINACION: {
-                'unidad': 'puntos',
-                'rango': (5, 20),  # Test de coordinación
-                'descripcion': 'Test de coordinación óculo-manual',
-            },
-        }
+        pruebas_config = CONFIG_PRUEBAS_FISICAS
         
         for atleta in atletas:
             # Cada atleta tiene entre 3 y 6 tipos de pruebas
@@ -0,0 +1,322 @@
+"""
+Generador de datos sintéticos a gran escala para pruebas de carga
+
+Crea atletas, inscripciones y pruebas con distribuciones realistas por rango
+de edad de cada GrupoAtleta. Los registros se construyen como tuplas y se
+insertan por lotes con COPY en PostgreSQL o con executemany en otros motores,
+sin instanciar modelos: los campos derivados que normalmente calcula save() (edad, IMC e
+índice córnico) y fecha_registro se calculan aquí antes de insertar.
+"""
+
+import random
+from datetime import date, timedelta
+from itertools import islice
+
+from django.db import connection
+
+from basketball.dao.generic_dao import copy_rows
+
+from basketball.models import (
+    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica,
+    TipoInscripcion, TipoPrueba
+)
+
+
+NOMBRES_MASCULINOS = ['Diego', 'Andrés', 'Sebastián', 'Mateo', 'Santiago', 'Daniel', 'Nicolás', 'Gabriel', 'Lucas', 'Emilio']
+NOMBRES_FEMENINOS = ['Valentina', 'Camila', 'Isabella', 'Mariana', 'Luciana', 'Gabriela', 'Paula', 'Andrea', 'Carolina', 'Daniela']
+APELLIDOS = ['González', 'Rodríguez', 'Martínez', 'López', 'García', 'Hernández', 'Pérez', 'Sánchez', 'Ramírez', 'Torres', 'Flores', 'Rivera', 'Gómez', 'Díaz', 'Reyes']
+TIPOS_SANGRE = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+# Frecuencia aproximada de cada tipo de sangre en la población
+PESOS_TIPOS_SANGRE = [30, 6, 9, 2, 3, 1, 42, 7]
+
+# Rangos de resultados por tipo de prueba (el extremo "mejor" se alcanza con la edad)
+CONFIG_PRUEBAS_FISICAS = {
+    TipoPrueba.RESISTENCIA: {
+        'unidad': 'minutos',
+        'rango': (5, 15),  # Test de Cooper (tiempo en 2km)
+        'descripcion': 'Test de resistencia aeróbica',
+    },
+    TipoPrueba.VELOCIDAD: {
+        'unidad': 'segundos',
+        'rango': (3, 8),  # Sprint 30 metros
+        'descripcion': 'Sprint de velocidad 30m',
+    },
+    TipoPrueba.FUERZA: {
+        'unidad': 'repeticiones',
+        'rango': (5, 30),  # Flexiones o sentadillas
+        'descripcion': 'Test de fuerza muscular',
+    },
+    TipoPrueba.FLEXIBILIDAD: {
+        'unidad': 'centímetros',
+        'rango': (-5, 20),  # Sit and reach
+        'descripcion': 'Test de flexibilidad sit and reach',
+    },
+    TipoPrueba.AGILIDAD: {
+        'unidad': 'segundos',
+        'rango': (8, 18),  # Test de Illinois
+        'descripcion': 'Test de agilidad Illinois',
+    },
+    TipoPrueba.COORDINACION: {
+        'unidad': 'puntos',
+        'rango': (5, 20),  # Test de coordinación
+        'descripcion': 'Test de coordinación óculo-manual',
+    },
+}
+
+PREFIJO_DNI = 'S'
+TAMANO_LOTE = 5000
+
+
+def estatura_por_edad(edad: int) -> float:
+    """Estatura media aproximada (cm) para una edad"""
+    if edad <= 8:
+        return 120 + (edad - 6) * 5
+    if edad <= 12:
+        return 130 + (edad - 8) * 6
+    if edad <= 15:
+        return 154 + (edad - 12) * 7
+    return 175 + (edad - 15) * 2
+
+
+def prefijo_dni(semilla: int) -> str:
+    """Prefijo de DNI de los atletas generados con una semilla"""
+    return f'{PREFIJO_DNI}{semilla:03d}'
+
+
+class BarraProgreso:
+    """Barra de progreso de texto que se redibuja en la misma línea"""
+
+    ANCHO = 30
+
+    def __init__(self, salida, etiqueta: str, total: int):
+        self.salida = salida
+        self.etiqueta = etiqueta
+        self.total = max(total, 1)
+        self.actual = 0
+        self.porcentaje = -1
+
+    def avanzar(self, cantidad: int):
+        self.actual = min(self.actual + cantidad, self.total)
+        porcentaje = self.actual * 100 // self.total
+        if porcentaje == self.porcentaje:
+            return
+        self.porcentaje = porcentaje
+        llenos = self.ANCHO * self.actual // self.total
+        self.salida.write(
+            f'\r  {self.etiqueta:<26}[{"#" * llenos}{"." * (self.ANCHO - llenos)}] '
+            f'{porcentaje:>3}% {self.actual}/{self.total}',
+            ending='',
+        )
+        self.salida.flush()
+
+    def terminar(self):
+        self.avanzar(self.total - self.actual)
+        self.salida.write('')
+
+
+class GeneradorDatos:
+    """
+    Genera datos sintéticos de forma determinista a partir de una semilla.
+
+    Los atletas se reparten entre los grupos en proporción al ancho de su
+    rango de edad y cada uno recibe una edad dentro de ese rango; estatura,
+    peso y resultados físicos dependen de la edad y el sexo con ruido normal.
+    """
+
+    def __init__(self, semilla: int = 42, tamano_lote: int = TAMANO_LOTE, salida=None):
+        self.semilla = semilla
+        self.aleatorio = random.Random(semilla)
+        self.tamano_lote = max(tamano_lote, 1)
+        self.salida = salida
+        self.hoy = date.today()
+        self.fechas = {}
+
+    def generar(self, grupos, cantidad_atletas: int, pruebas_por_atleta: int = 10,
+                antropometricas_por_atleta: int = 3) -> dict:
+        """Generar el conjunto completo; devuelve la cantidad de registros por modelo"""
+        atletas = self.generar_atletas(grupos, cantidad_atletas)
+        return {
+            'atletas': len(atletas),
+            'inscripciones': self.generar_inscripciones(atletas),
+            'pruebas_antropometricas': self.generar_pruebas_antropometricas(
+                atletas, antropometricas_por_atleta
+            ),
+            'pruebas_fisicas': self.generar_pruebas_fisicas(atletas, pruebas_por_atleta),
+        }
+
+    def generar_atletas(self, grupos, cantidad: int) -> list:
+        """Crear atletas repartidos por rango de edad; devuelve tuplas (id, edad, sexo)"""
+        aleatorio = self.aleatorio
+        pesos = [grupo.rango_edad_maxima - grupo.rango_edad_minima + 1 for grupo in grupos]
+        prefijo = prefijo_dni(self.semilla)
+        campos = [
+            'nombre_atleta', 'apellido_atleta', 'dni', 'fecha_nacimiento', 'edad', 'sexo',
+            'email', 'telefono', 'tipo_sangre', 'datos_representante', 'grupo', 'estado',
+        ]
+
+        def construir():
+            for i, grupo in enumerate(aleatorio.choices(grupos, weights=pesos, k=cantidad)):
+                edad = aleatorio.randint(grupo.rango_edad_minima, grupo.rango_edad_maxima)
+                sexo = 'Masculino' if aleatorio.random() < 0.6 else 'Femenino'
+                nombre = aleatorio.choice(NOMBRES_MASCULINOS if sexo == 'Masculino' else NOMBRES_FEMENINOS)
+                # Cumpleaños ya pasado este año: la edad coincide con calcular_edad()
+                fecha_nacimiento = self.hoy - timedelta(days=edad * 365 + edad // 4 + aleatorio.randint(3, 360))
+                yield (
+                    nombre,
+                    f'{aleatorio.choice(APELLIDOS)} {aleatorio.choice(APELLIDOS)}',
+                    f'{prefijo}{i:09d}',
+                    connection.ops.adapt_datefield_value(fecha_nacimiento),
+                    edad,
+                    sexo,
+                    f'{nombre.lower()}.{prefijo.lower()}{i}@email.com',
+                    f'09{aleatorio.randint(10000000, 99999999)}',
+                    aleatorio.choices(TIPOS_SANGRE, weights=PESOS_TIPOS_SANGRE)[0],
+                    f'Representante de {nombre}' if edad < 18 else None,
+                    grupo.id,
+                    True,
+                )
+
+        self.insertar(Atleta, campos, 'Atletas', cantidad, construir())
+        return list(
+            Atleta.objects.filter(dni__startswith=prefijo)
+            .order_by('id').values_list('id', 'edad', 'sexo')
+        )
+
+    def generar_inscripciones(self, atletas: list) -> int:
+        """Una inscripción por atleta, 80% habilitadas"""
+        aleatorio = self.aleatorio
+        tipos = [TipoInscripcion.NUEVO, TipoInscripcion.RENOVACION]
+        campos = ['atleta', 'fecha_inscripcion', 'tipo_inscripcion', 'fecha_creacion', 'habilitada']
+        hoy = self.fecha(0)
+
+        def construir():
+            for atleta_id, _, _ in atletas:
+                yield (
+                    atleta_id,
+                    self.fecha(aleatorio.randint(0, 365)),
+                    aleatorio.choice(tipos),
+                    hoy,
+                    aleatorio.random() < 0.8,
+                )
+
+        return self.insertar(Inscripcion, campos, 'Inscripciones', len(atletas), construir())
+
+    def generar_pruebas_antropometricas(self, atletas: list, por_atleta: int) -> int:
+        """Mediciones espaciadas en el tiempo con IMC e índice córnico precalculados"""
+        aleatorio = self.aleatorio
+        cantidades = self.repartir(atletas, por_atleta)
+        campos = [
+            'atleta', 'fecha_registro', 'estatura', 'peso', 'altura_sentado', 'envergadura',
+            'indice_masa_corporal', 'indice_cornico', 'observaciones', 'estado',
+        ]
+
+        def construir():
+            for (atleta_id, edad, sexo), cantidad in zip(atletas, cantidades):
+                media = estatura_por_edad(edad) - (4 if sexo == 'Femenino' else 0)
+                for numero in range(cantidad):
+                    estatura = round(aleatorio.gauss(media, 6), 1)
+                    peso = round(max(aleatorio.gauss((estatura - 100) * 0.9, 5), 15), 1)
+                    altura_sentado = round(estatura * aleatorio.gauss(0.52, 0.01), 1)
+                    yield (
+                        atleta_id,
+                        self.fecha(numero * 120 + aleatorio.randint(0, 90)),
+                        estatura,
+                        peso,
+                        altura_sentado,
+                        round(estatura * aleatorio.uniform(0.98, 1.05), 1),
+                        round(peso / ((estatura / 100) ** 2), 2),
+                        round(altura_sentado / estatura * 100, 2),
+                        f'Medición #{numero + 1} del atleta',
+                        True,
+                    )
+
+        return self.insertar(
+            PruebaAntropometrica, campos, 'Pruebas antropométricas', sum(cantidades), construir()
+        )
+
+    def generar_pruebas_fisicas(self, atletas: list, por_atleta: int) -> int:
+        """Resultados por tipo de prueba que mejoran con la edad del atleta"""
+        aleatorio = self.aleatorio
+        tipos = list(CONFIG_PRUEBAS_FISICAS)
+        cantidades = self.repartir(atletas, por_atleta)
+        campos = ['atleta', 'fecha_registro', 'tipo_prueba', 'resultado', 'unidad_medida', 'observaciones', 'estado']
+
+        def construir():
+            for (atleta_id, edad, _), cantidad in zip(atletas, cantidades):
+                factor_edad = min(edad / 18, 1)
+                for _ in range(cantidad):
+                    tipo = aleatorio.choice(tipos)
+                    config = CONFIG_PRUEBAS_FISICAS[tipo]
+                    rango_min, rango_max = config['rango']
+                    mejora = (rango_max - rango_min) * factor_edad * min(max(aleatorio.gauss(0.85, 0.1), 0), 1)
+                    # Para tiempo (menor es mejor) el resultado baja con la mejora
+                    if config['unidad'] in ['segundos', 'minutos']:
+                        resultado = rango_max - mejora
+                    else:
+                        resultado = rango_min + mejora
+                    yield (
+                        atleta_id,
+                        self.fecha(aleatorio.randint(0, 365)),
+                        tipo,
+                        round(resultado, 2),
+                        config['unidad'],
+                        config['descripcion'],
+                        True,
+                    )
+
+        return self.insertar(PruebaFisica, campos, 'Pruebas físicas', sum(cantidades), construir())
+
+    def repartir(self, atletas: list, por_atleta: int) -> list:
+        """Cantidad de registros de cada atleta, variable alrededor de la media por_atleta"""
+        if por_atleta <= 0:
+            return [0] * len(atletas)
+        minimo, maximo = max(por_atleta // 2, 1), por_atleta + por_atleta // 2
+        return [self.aleatorio.randint(minimo, maximo) for _ in atletas]
+
+    def fecha(self, dias_atras: int):
+        """Fecha de hace dias_atras días, ya adaptada al motor de base de datos"""
+        if dias_atras not in self.fechas:
+            self.fechas[dias_atras] = connection.ops.adapt_datefield_value(
+                self.hoy - timedelta(days=dias_atras)
+            )
+        return self.fechas[dias_atras]
+
+    def insertar(self, modelo, campos: list, etiqueta: str, total: int, filas) -> int:
+        """
+        Insertar las filas (tuplas en el orden de campos) en lotes de tamano_lote.
+
+        Los campos omitidos que tienen default en el modelo (como version) se
+        completan con ese valor, ya que el INSERT directo no pasa por el ORM.
+        """
+        opts = modelo._meta
+        omitidos = [
+            campo for campo in opts.concrete_fields
+            if not campo.primary_key and campo.name not in campos and campo.has_default()
+        ]
+        if omitidos:
+            defaults = tuple(campo.get_default() for campo in omitidos)
+            campos = list(campos) + [campo.name for campo in omitidos]
+            filas = (fila + defaults for fila in filas)
+        columnas = [opts.get_field(campo).column for campo in campos]
+        sql = (
+            f'INSERT INTO {connection.ops.quote_name(opts.db_table)} '
+            f'({", ".join(connection.ops.quote_name(columna) for columna in columnas)}) '
+            f'VALUES ({", ".join(["%s"] * len(campos))})'
+        )
+        barra = BarraProgreso(self.salida, etiqueta, total) if self.salida else None
+        insertados = 0
+        with connection.cursor() as cursor:
+            while True:
+                lote = list(islice(filas, self.tamano_lote))
+                if not lote:
+                    break
+                if connection.vendor == 'postgresql':
+                    copy_rows(connection, modelo, columnas, lote)
+                else:
+                    cursor.executemany(sql, lote)
+                insertados += len(lote)
+                if barra:
+                    barra.avanzar(len(lote))
+        if barra:
+            barra.terminar()
+        return insertados
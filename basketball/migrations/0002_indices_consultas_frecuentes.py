@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basketball', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='atleta',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['grupo', 'id'], name='atleta_grupo_activo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inscripcion',
+            index=models.Index(fields=['habilitada', '-fecha_inscripcion', '-id'], name='inscripcion_habilitada_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inscripcion',
+            index=models.Index(condition=models.Q(('habilitada', True)), fields=['atleta'], name='inscripcion_atleta_activa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pruebaantropometrica',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['atleta', '-fecha_registro', '-id'], name='pa_atleta_fecha_activa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pruebaantropometrica',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['-fecha_registro', '-id'], name='pa_fecha_activa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pruebafisica',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['atleta', 'tipo_prueba', '-fecha_registro', '-id'], name='pf_atleta_tipo_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pruebafisica',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['tipo_prueba', '-fecha_registro'], name='pf_tipo_fecha_activa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pruebafisica',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['-fecha_registro', '-id'], name='pf_fecha_activa_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Índices trigram (pg_trgm) para la búsqueda de atletas por nombre, apellido y DNI.
+
+Solo se aplican en PostgreSQL; en otros motores (SQLite en tests) la migración
+no hace nada y AtletaDAO.search_text usa su ruta sin índices.
+"""
+
+from django.db import migrations
+
+
+INDICES = [
+    ('atleta_nombre_trgm_idx', '(UPPER("nombre_atleta"::text)) gin_trgm_ops'),
+    ('atleta_apellido_trgm_idx', '(UPPER("apellido_atleta"::text)) gin_trgm_ops'),
+    ('atleta_dni_trgm_idx', '"dni" gin_trgm_ops'),
+]
+
+
+def crear_indices_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for nombre, expresion in INDICES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{nombre}" ON "atleta" USING gin ({expresion})'
+        )
+
+
+def eliminar_indices_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for nombre, _ in INDICES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{nombre}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basketball', '0002_indices_consultas_frecuentes'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices_trigram, eliminar_indices_trigram),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basketball', '0003_atleta_busqueda_trigram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='atleta',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='grupoatleta',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='inscripcion',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pruebaantropometrica',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pruebafisica',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
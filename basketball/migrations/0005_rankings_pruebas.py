@@ -0,0 +1,83 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Tipos de prueba en los que el menor resultado es el mejor (models.TIPOS_MENOR_ES_MEJOR)
+TIPOS_MENOR_ES_MEJOR = {'RESISTENCIA', 'VELOCIDAD', 'AGILIDAD'}
+
+
+def poblar_rankings(apps, schema_editor):
+    """Calcular el mejor resultado de cada atleta por tipo con las pruebas existentes"""
+    PruebaFisica = apps.get_model('basketball', 'PruebaFisica')
+    RankingPrueba = apps.get_model('basketball', 'RankingPrueba')
+    alias = schema_editor.connection.alias
+
+    mejores = {}
+    pruebas = (
+        PruebaFisica.objects.using(alias).filter(estado=True)
+        .order_by('fecha_registro', 'id')
+        .values('id', 'atleta_id', 'tipo_prueba', 'resultado', 'unidad_medida',
+                'fecha_registro', 'atleta__grupo_id', 'atleta__sexo')
+    )
+    for prueba in pruebas.iterator(chunk_size=2000):
+        signo = 1 if prueba['tipo_prueba'] in TIPOS_MENOR_ES_MEJOR else -1
+        puntaje = signo * prueba['resultado']
+        clave = (prueba['atleta_id'], prueba['tipo_prueba'])
+        actual = mejores.get(clave)
+        if actual is None:
+            mejores[clave] = RankingPrueba(
+                atleta_id=prueba['atleta_id'], tipo_prueba=prueba['tipo_prueba'],
+                grupo_id=prueba['atleta__grupo_id'], sexo=prueba['atleta__sexo'],
+                prueba_id=prueba['id'], mejor_resultado=prueba['resultado'], puntaje=puntaje,
+                unidad_medida=prueba['unidad_medida'], fecha_registro=prueba['fecha_registro'],
+                total_pruebas=1,
+            )
+            continue
+        actual.total_pruebas += 1
+        # En empate se conserva la primera (pruebas ordenadas por fecha)
+        if puntaje < actual.puntaje:
+            actual.prueba_id = prueba['id']
+            actual.mejor_resultado = prueba['resultado']
+            actual.puntaje = puntaje
+            actual.unidad_medida = prueba['unidad_medida']
+            actual.fecha_registro = prueba['fecha_registro']
+    RankingPrueba.objects.using(alias).bulk_create(mejores.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basketball', '0004_version_filas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingPrueba',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo_prueba', models.CharField(choices=[('RESISTENCIA', 'Resistencia'), ('VELOCIDAD', 'Velocidad'), ('FUERZA', 'Fuerza'), ('FLEXIBILIDAD', 'Flexibilidad'), ('AGILIDAD', 'Agilidad'), ('COORDINACION', 'Coordinación')], max_length=20)),
+                ('sexo', models.CharField(max_length=20)),
+                ('mejor_resultado', models.FloatField()),
+                ('puntaje', models.FloatField()),
+                ('unidad_medida', models.CharField(max_length=50)),
+                ('fecha_registro', models.DateField()),
+                ('total_pruebas', models.PositiveIntegerField()),
+                ('atleta', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='basketball.atleta')),
+                ('grupo', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='basketball.grupoatleta')),
+                ('prueba', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='basketball.pruebafisica')),
+            ],
+            options={
+                'verbose_name': 'Ranking de Prueba',
+                'verbose_name_plural': 'Rankings de Pruebas',
+                'db_table': 'ranking_prueba',
+                'indexes': [models.Index(fields=['tipo_prueba', 'puntaje'], name='ranking_tipo_puntaje_idx'), models.Index(fields=['tipo_prueba', 'grupo', 'sexo', 'puntaje'], name='ranking_grupo_sexo_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rankingprueba',
+            constraint=models.UniqueConstraint(fields=('atleta', 'tipo_prueba'), name='ranking_atleta_tipo_uniq'),
+        ),
+        migrations.RunPython(poblar_rankings, migrations.RunPython.noop),
+    ]
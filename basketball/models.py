@@ -25,6 +25,33 @@ class TipoPrueba(models.TextChoices):
     COORDINACION = 'COORDINACION', 'Coordinación'
 
 
+# Pruebas medidas en tiempo: el menor resultado es el mejor (en las demás, el mayor)
+TIPOS_MENOR_ES_MEJOR = frozenset({TipoPrueba.RESISTENCIA, TipoPrueba.VELOCIDAD, TipoPrueba.AGILIDAD})
+
+
+class ModeloVersionado(models.Model):
+    """
+    Base abstracta con un número de versión por fila.
+
+    save() incrementa la versión en cada actualización; las actualizaciones
+    masivas de los DAOs la incrementan con F('version') + 1. Los endpoints de
+    detalle la usan para emitir ETags y validar If-Match.
+    """
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        """Incrementar la versión al actualizar una fila existente"""
+        if not self._state.adding:
+            self.version = (self.version or 0) + 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'version' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'version']
+        super().save(*args, **kwargs)
+
+
 class Usuario(models.Model):
     """
     Modelo Usuario - Este modelo representa al usuario del sistema
@@ -103,7 +130,7 @@ class Usuario(models.Model):
         return self.rol == 'ADMINISTRADOR'
 
 
-class GrupoAtleta(models.Model):
+class GrupoAtleta(ModeloVersionado):
     """Modelo para grupos de atletas"""
     nombre = models.CharField(max_length=100)
     rango_edad_minima = models.IntegerField(
@@ -260,7 +287,7 @@ class EstudianteVinculacion(models.Model):
         pass
 
 
-class Atleta(models.Model):
+class Atleta(ModeloVersionado):
     """Modelo Atleta"""
     nombre_atleta = models.CharField(max_length=100)
     apellido_atleta = models.CharField(max_length=100)
@@ -286,6 +313,14 @@ class Atleta(models.Model):
         db_table = 'atleta'
         verbose_name = 'Atleta'
         verbose_name_plural = 'Atletas'
+        indexes = [
+            # AtletaDAO.find_by_grupo y listado por grupo (orden por id, solo activos)
+            models.Index(
+                fields=['grupo', 'id'],
+                name='atleta_grupo_activo_idx',
+                condition=models.Q(estado=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.nombre_atleta} {self.apellido_atleta}"
@@ -311,7 +346,7 @@ class Atleta(models.Model):
         super().save(*args, **kwargs)
 
 
-class Inscripcion(models.Model):
+class Inscripcion(ModeloVersionado):
     """Modelo Inscripción"""
     atleta = models.ForeignKey(
         Atleta,
@@ -331,6 +366,19 @@ class Inscripcion(models.Model):
         db_table = 'inscripcion'
         verbose_name = 'Inscripción'
         verbose_name_plural = 'Inscripciones'
+        indexes = [
+            # find_habilitadas / find_pendientes y el listado (-fecha_inscripcion, -id)
+            models.Index(
+                fields=['habilitada', '-fecha_inscripcion', '-id'],
+                name='inscripcion_habilitada_idx',
+            ),
+            # InscripcionDAO.tiene_inscripcion_activa
+            models.Index(
+                fields=['atleta'],
+                name='inscripcion_atleta_activa_idx',
+                condition=models.Q(habilitada=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Inscripción {self.id} - {self.atleta}"
@@ -351,7 +399,7 @@ class Inscripcion(models.Model):
         return True
 
 
-class PruebaAntropometrica(models.Model):
+class PruebaAntropometrica(ModeloVersionado):
     """Modelo Prueba Antropométrica"""
     atleta = models.ForeignKey(
         Atleta,
@@ -388,6 +436,20 @@ class PruebaAntropometrica(models.Model):
         db_table = 'prueba_antropometrica'
         verbose_name = 'Prueba Antropométrica'
         verbose_name_plural = 'Pruebas Antropométricas'
+        indexes = [
+            # find_by_atleta / find_ultima_by_atleta / estadísticas por atleta
+            models.Index(
+                fields=['atleta', '-fecha_registro', '-id'],
+                name='pa_atleta_fecha_activa_idx',
+                condition=models.Q(estado=True),
+            ),
+            # Listado paginado y búsquedas por rango de fechas
+            models.Index(
+                fields=['-fecha_registro', '-id'],
+                name='pa_fecha_activa_idx',
+                condition=models.Q(estado=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Prueba Antropométrica - {self.atleta} ({self.fecha_registro})"
@@ -418,7 +480,7 @@ class PruebaAntropometrica(models.Model):
         super().save(*args, **kwargs)
 
 
-class PruebaFisica(models.Model):
+class PruebaFisica(ModeloVersionado):
     """Modelo Prueba Física"""
     atleta = models.ForeignKey(
         Atleta,
@@ -439,6 +501,26 @@ class PruebaFisica(models.Model):
         db_table = 'prueba_fisica'
         verbose_name = 'Prueba Física'
         verbose_name_plural = 'Pruebas Físicas'
+        indexes = [
+            # find_by_atleta_y_tipo / estadísticas por atleta y tipo
+            models.Index(
+                fields=['atleta', 'tipo_prueba', '-fecha_registro', '-id'],
+                name='pf_atleta_tipo_fecha_idx',
+                condition=models.Q(estado=True),
+            ),
+            # get_promedio_by_tipo y búsquedas por tipo
+            models.Index(
+                fields=['tipo_prueba', '-fecha_registro'],
+                name='pf_tipo_fecha_activa_idx',
+                condition=models.Q(estado=True),
+            ),
+            # Listado paginado y búsquedas por rango de fechas
+            models.Index(
+                fields=['-fecha_registro', '-id'],
+                name='pf_fecha_activa_idx',
+                condition=models.Q(estado=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Prueba {self.tipo_prueba} - {self.atleta} ({self.fecha_registro})"
@@ -461,3 +543,63 @@ class PruebaFisica(models.Model):
             "diferencia": round(diferencia, 2),
             "porcentaje_cambio": round(porcentaje, 2)
         }
+
+
+class RankingPrueba(models.Model):
+    """
+    Mejor resultado de cada atleta por tipo de prueba (tabla resumen de los rankings).
+
+    Se mantiene desde las señales de PruebaFisica y Atleta (ver
+    basketball.services.rankings); grupo y sexo se copian del atleta para
+    filtrar y ordenar los rankings sin joins. ``puntaje`` es el resultado con
+    signo: ordenar por él de menor a mayor va siempre del mejor al peor.
+    """
+    atleta = models.ForeignKey(
+        Atleta,
+        on_delete=models.CASCADE,
+        related_name='rankings'
+    )
+    tipo_prueba = models.CharField(
+        max_length=20,
+        choices=TipoPrueba.choices
+    )
+    grupo = models.ForeignKey(
+        GrupoAtleta,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    sexo = models.CharField(max_length=20)
+    prueba = models.ForeignKey(
+        PruebaFisica,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    mejor_resultado = models.FloatField()
+    puntaje = models.FloatField()
+    unidad_medida = models.CharField(max_length=50)
+    fecha_registro = models.DateField()
+    total_pruebas = models.PositiveIntegerField()
+
+    class Meta:
+        db_table = 'ranking_prueba'
+        verbose_name = 'Ranking de Prueba'
+        verbose_name_plural = 'Rankings de Pruebas'
+        constraints = [
+            models.UniqueConstraint(fields=['atleta', 'tipo_prueba'], name='ranking_atleta_tipo_uniq'),
+        ]
+        indexes = [
+            # Ranking general de un tipo de prueba (y filtrado por sexo)
+            models.Index(fields=['tipo_prueba', 'puntaje'], name='ranking_tipo_puntaje_idx'),
+            # Ranking de un grupo, con o sin filtro por sexo
+            models.Index(fields=['tipo_prueba', 'grupo', 'sexo', 'puntaje'], name='ranking_grupo_sexo_idx'),
+        ]
+
+    def __str__(self):
+        return f"Ranking {self.tipo_prueba} - {self.atleta} ({self.mejor_resultado})"
+
+    @staticmethod
+    def calcular_puntaje(tipo_prueba: str, resultado: float) -> float:
+        """Puntaje de un resultado: menor es mejor en todos los tipos de prueba"""
+        return resultado if tipo_prueba in TIPOS_MENOR_ES_MEJOR else -resultado
@@ -5,7 +5,7 @@ Serializers del módulo Basketball
 from rest_framework import serializers
 from basketball.models import (
     Usuario, GrupoAtleta, Entrenador, EstudianteVinculacion,
-    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica
+    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica, RankingPrueba
 )
 
 
@@ -37,6 +37,10 @@ class GrupoAtletaSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'fecha_creacion']
     
     def get_cantidad_atletas(self, obj):
+        # Los DAOs anotan el conteo en la consulta; solo se consulta si falta
+        cantidad = getattr(obj, 'cantidad_atletas', None)
+        if cantidad is not None:
+            return cantidad
         return obj.atletas.filter(estado=True).count()
 
 
@@ -119,6 +123,24 @@ class PruebaFisicaSerializer(serializers.ModelSerializer):
         return f"{obj.atleta.nombre_atleta} {obj.atleta.apellido_atleta}"
 
 
+class RankingPruebaSerializer(serializers.ModelSerializer):
+    """Serializer para una fila de ranking (posicion viene anotada por RankingPruebaDAO.leaderboard)"""
+    posicion = serializers.IntegerField(read_only=True)
+    atleta_nombre = serializers.SerializerMethodField()
+    grupo_nombre = serializers.CharField(source='grupo.nombre', read_only=True, default=None)
+    
+    class Meta:
+        model = RankingPrueba
+        fields = [
+            'posicion', 'atleta', 'atleta_nombre', 'grupo', 'grupo_nombre', 'sexo',
+            'tipo_prueba', 'mejor_resultado', 'unidad_medida', 'fecha_registro',
+            'total_pruebas', 'prueba'
+        ]
+    
+    def get_atleta_nombre(self, obj):
+        return f"{obj.atleta.nombre_atleta} {obj.atleta.apellido_atleta}"
+
+
 class EntrenadorSerializer(serializers.ModelSerializer):
     """Serializer para Entrenador"""
     usuario_nombre = serializers.SerializerMethodField()
@@ -3,10 +3,12 @@ Clase base para respuestas de API
 Maneja códigos de estado, mensajes y data
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
 from rest_framework import status
 from rest_framework.response import Response
 
+from .cache_respuestas import respuesta_cacheada, respuesta_condicional
+
 
 class APIResponse:
     """Clase para estandarizar las respuestas de la API"""
@@ -100,6 +102,17 @@ class APIResponse:
             "errors": errors
         }, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
     
+    @staticmethod
+    def precondition_failed(
+        message: str = "El recurso fue modificado por otra petición"
+    ) -> Response:
+        """Respuesta de precondición fallida (If-Match desactualizado)"""
+        return Response({
+            "status": "error",
+            "code": status.HTTP_412_PRECONDITION_FAILED,
+            "message": message
+        }, status=status.HTTP_412_PRECONDITION_FAILED)
+    
     @staticmethod
     def server_error(
         message: str = "Error interno del servidor",
@@ -130,17 +143,103 @@ class APIResponse:
         page: int,
         total_pages: int,
         total_items: int,
-        message: str = "Lista obtenida exitosamente"
+        message: str = "Lista obtenida exitosamente",
+        page_size: Optional[int] = None
     ) -> Response:
         """Respuesta paginada"""
+        pagination = {
+            "current_page": page,
+            "total_pages": total_pages,
+            "total_items": total_items
+        }
+        if page_size is not None:
+            pagination["page_size"] = page_size
+            pagination["has_next"] = page < total_pages
+            pagination["has_previous"] = page > 1
         return Response({
             "status": "success",
             "code": status.HTTP_200_OK,
             "message": message,
             "data": data,
-            "pagination": {
-                "current_page": page,
-                "total_pages": total_pages,
-                "total_items": total_items
-            }
+            "pagination": pagination
         }, status=status.HTTP_200_OK)
+    
+    @staticmethod
+    def cursor_paginated(
+        data: Any,
+        next_cursor: Optional[str],
+        page_size: int,
+        total_items: Optional[int] = None,
+        message: str = "Lista obtenida exitosamente"
+    ) -> Response:
+        """Respuesta paginada por cursor"""
+        pagination = {
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None
+        }
+        if total_items is not None:
+            pagination["total_items"] = total_items
+        return Response({
+            "status": "success",
+            "code": status.HTTP_200_OK,
+            "message": message,
+            "data": data,
+            "pagination": pagination
+        }, status=status.HTTP_200_OK)
+    
+    @classmethod
+    def from_page(
+        cls,
+        resultado: dict,
+        data: Any,
+        message: str = "Lista obtenida exitosamente"
+    ) -> Response:
+        """Respuesta paginada a partir del diccionario de GenericDAO.paginate"""
+        if 'next_cursor' in resultado:
+            return cls.cursor_paginated(
+                data=data,
+                next_cursor=resultado['next_cursor'],
+                page_size=resultado['page_size'],
+                total_items=resultado.get('total'),
+                message=message
+            )
+        return cls.paginated(
+            data=data,
+            page=resultado['page'],
+            total_pages=resultado['total_pages'],
+            total_items=resultado['total'],
+            message=message,
+            page_size=resultado['page_size']
+        )
+    
+    @staticmethod
+    def cached(
+        request,
+        build: Callable[[], Response],
+        depends_on: Sequence[Any] = (),
+        max_age: Optional[int] = None
+    ) -> Response:
+        """
+        Respuesta cacheada por endpoint y parámetros, con ETag/Last-Modified/Cache-Control.
+        
+        ``build`` solo se ejecuta si no hay una copia vigente; las escrituras en
+        los modelos de ``depends_on`` la invalidan. Responde 304 a If-None-Match.
+        Ver cache_respuestas.respuesta_cacheada.
+        """
+        return respuesta_cacheada(request, build, depende_de=depends_on, max_age=max_age)
+    
+    @staticmethod
+    def conditional(
+        request,
+        instance: Any,
+        build: Callable[[], Response],
+        extra_fields: Sequence[str] = ()
+    ) -> Response:
+        """
+        Respuesta de detalle con ETag fuerte derivado de la versión de la fila.
+        
+        Responde 304 a un If-None-Match vigente sin llamar a ``build``.
+        Ver cache_respuestas.respuesta_condicional.
+        """
+        return respuesta_condicional(request, instance, build, campos_extra=extra_fields)
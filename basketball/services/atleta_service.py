@@ -2,9 +2,14 @@
 Servicio API para Atletas - Usando DAO
 """
 
-from basketball.controllers.atleta_controller import AtletaController
+from basketball.controllers.atleta_controller import AtletaController, COLUMNAS_EXPORTACION
+from basketball.dao import InvalidCursorError, VersionConflictError
 from basketball.services.api_response import APIResponse
-from basketball.serializers import AtletaSerializer
+from basketball.services.cache_respuestas import version_if_match
+from basketball.services.exportacion import respuesta_exportacion
+from basketball.serializers import (
+    AtletaSerializer, GrupoAtletaSerializer, InscripcionSerializer, PruebaAntropometricaSerializer
+)
 
 
 class AtletaService:
@@ -29,20 +34,55 @@ class AtletaService:
             )
     
     @classmethod
-    def obtener_atleta(cls, atleta_id: int):
-        """Obtener un atleta por ID"""
-        atleta = cls._controller.obtener_atleta(atleta_id)
+    def obtener_atleta(cls, atleta_id: int, request=None):
+        """Obtener un atleta por ID (304 si el If-None-Match coincide con su versión)"""
+        return cls._respuesta_atleta(cls._controller.obtener_atleta(atleta_id), atleta_id, request)
+    
+    @classmethod
+    async def aobtener_atleta(cls, atleta_id: int, request=None):
+        """Versión asíncrona de obtener_atleta"""
+        return cls._respuesta_atleta(await cls._controller.aobtener_atleta(atleta_id), atleta_id, request)
+    
+    @classmethod
+    def _respuesta_atleta(cls, atleta, atleta_id: int, request=None):
+        """Respuesta del detalle de un atleta"""
         if atleta:
-            serializer = AtletaSerializer(atleta)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Atleta encontrado"
+            return APIResponse.conditional(
+                request, atleta,
+                lambda: APIResponse.success(
+                    data=AtletaSerializer(atleta).data,
+                    message="Atleta encontrado"
+                )
             )
         return APIResponse.not_found(
             message="Atleta no encontrado",
             resource=f"Atleta con ID {atleta_id}"
         )
     
+    @classmethod
+    def obtener_perfil_atleta(cls, atleta_id: int):
+        """Obtener el perfil completo de un atleta en una sola respuesta"""
+        perfil = cls._controller.obtener_perfil(atleta_id)
+        if perfil is None:
+            return APIResponse.not_found(
+                message="Atleta no encontrado",
+                resource=f"Atleta con ID {atleta_id}"
+            )
+        grupo = perfil['grupo']
+        ultima = perfil['ultima_prueba_antropometrica']
+        return APIResponse.success(
+            data={
+                'atleta': AtletaSerializer(perfil['atleta']).data,
+                'grupo': GrupoAtletaSerializer(grupo).data if grupo else None,
+                'inscripciones': InscripcionSerializer(perfil['inscripciones'], many=True).data,
+                'ultima_prueba_antropometrica': (
+                    PruebaAntropometricaSerializer(ultima).data if ultima else None
+                ),
+                'estadisticas_fisicas': perfil['estadisticas_fisicas'],
+            },
+            message="Perfil del atleta"
+        )
+    
     @classmethod
     def obtener_atleta_por_dni(cls, dni: str):
         """Obtener un atleta por DNI"""
@@ -69,9 +109,51 @@ class AtletaService:
         )
     
     @classmethod
-    def actualizar_atleta(cls, atleta_id: int, data: dict):
-        """Actualizar un atleta"""
-        atleta = cls._controller.actualizar_atleta(atleta_id, data)
+    def paginar_atletas(
+        cls, page: int = 1, page_size: int = 10,
+        activos_solo: bool = True, criterios: dict = None, cursor: str = None
+    ):
+        """Listar atletas paginados con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_atletas(
+                page, page_size, activos_solo, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        return cls._respuesta_pagina(resultado)
+    
+    @classmethod
+    async def apaginar_atletas(
+        cls, page: int = 1, page_size: int = 10,
+        activos_solo: bool = True, criterios: dict = None, cursor: str = None
+    ):
+        """Versión asíncrona de paginar_atletas"""
+        try:
+            resultado = await cls._controller.apaginar_atletas(
+                page, page_size, activos_solo, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        return cls._respuesta_pagina(resultado)
+    
+    @classmethod
+    def _respuesta_pagina(cls, resultado: dict):
+        """Respuesta paginada de atletas"""
+        serializer = AtletaSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} atletas"
+        )
+    
+    @classmethod
+    def actualizar_atleta(cls, atleta_id: int, data: dict, request=None):
+        """Actualizar un atleta (con If-Match, solo si no cambió desde que se obtuvo su ETag)"""
+        try:
+            version = version_if_match(request, lambda: cls._controller.obtener_atleta(atleta_id))
+            atleta = cls._controller.actualizar_atleta(atleta_id, data, version)
+        except VersionConflictError as e:
+            return APIResponse.precondition_failed(str(e))
         if atleta:
             serializer = AtletaSerializer(atleta)
             return APIResponse.success(
@@ -105,6 +187,16 @@ class AtletaService:
             message=f"Se encontraron {len(atletas)} atletas"
         )
     
+    @classmethod
+    def buscar_por_texto(cls, texto: str, limite: int = 20):
+        """Buscar atletas por texto libre (nombre, apellido o DNI)"""
+        atletas = cls._controller.buscar_por_texto(texto, limite)
+        serializer = AtletaSerializer(atletas, many=True)
+        return APIResponse.success(
+            data=serializer.data,
+            message=f"Se encontraron {len(atletas)} atletas"
+        )
+    
     @classmethod
     def asignar_grupo(cls, atleta_id: int, grupo_id: int):
         """Asignar un atleta a un grupo"""
@@ -118,3 +210,42 @@ class AtletaService:
         return APIResponse.not_found(
             message="Atleta o grupo no encontrado"
         )
+    
+    @classmethod
+    def obtener_estadisticas_lote(cls, atleta_ids: list = None, grupo_id: int = None):
+        """Obtener estadísticas de varios atletas (por lista de IDs o por grupo)"""
+        return cls._respuesta_estadisticas(cls._controller.obtener_estadisticas_lote(atleta_ids, grupo_id))
+    
+    @classmethod
+    async def aobtener_estadisticas_lote(cls, atleta_ids: list = None, grupo_id: int = None):
+        """Versión asíncrona de obtener_estadisticas_lote"""
+        return cls._respuesta_estadisticas(
+            await cls._controller.aobtener_estadisticas_lote(atleta_ids, grupo_id)
+        )
+    
+    @classmethod
+    def _respuesta_estadisticas(cls, resultado: dict):
+        """Respuesta con las estadísticas por ID de atleta"""
+        data = {}
+        for atleta_id, estadisticas in resultado.items():
+            ultima = estadisticas['ultima_prueba_antropometrica']
+            data[atleta_id] = {
+                'estadisticas_fisicas': estadisticas['estadisticas_fisicas'],
+                'ultima_prueba_antropometrica': (
+                    PruebaAntropometricaSerializer(ultima).data if ultima else None
+                ),
+            }
+        return APIResponse.success(
+            data=data,
+            message=f"Estadísticas de {len(data)} atletas"
+        )
+    
+    @classmethod
+    def exportar_atletas(cls, criterios: dict, formato: str = 'csv'):
+        """Exportar atletas en CSV o NDJSON (respuesta en streaming)"""
+        return respuesta_exportacion(
+            cls._controller.exportar_atletas(criterios),
+            COLUMNAS_EXPORTACION,
+            formato,
+            'atletas'
+        )
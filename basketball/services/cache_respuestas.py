@@ -0,0 +1,253 @@
+"""
+Caché de respuestas para endpoints de referencia y catálogo
+"""
+
+import hashlib
+import json
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, Optional, Sequence, Type
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from basketball.dao import VersionConflictError
+from basketball.dao.routing import primary_reads
+from basketball.dao.signals import bulk_changed
+from basketball_project.renderers import dumps
+
+
+PREFIJO = 'resp'
+METODOS_CACHEABLES = ('GET', 'HEAD')
+
+# Max-age para respuestas que solo cambian con un despliegue (catálogos, raíz de la API)
+MAX_AGE_ESTATICO = 3600
+
+
+def _cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def cache_compartida() -> bool:
+    """
+    Si RESPONSE_CACHE_ALIAS apunta a una caché compartida entre procesos.
+
+    Con LocMemCache cada proceso tendría sus propias versiones de los modelos
+    y no vería las escrituras de los demás (otros workers, manage.py): no se
+    guardan respuestas ni se emite Last-Modified, solo el ETag del contenido.
+    """
+    return not isinstance(_cache(), (LocMemCache, DummyCache))
+
+
+def comprobar_cache(app_configs=None, **kwargs):
+    """System check: RESPONSE_CACHE_TIMEOUT no tiene efecto sin una caché compartida"""
+    if getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 0) and not cache_compartida():
+        return [checks.Warning(
+            'RESPONSE_CACHE_TIMEOUT > 0 se ignora: RESPONSE_CACHE_ALIAS no es una caché compartida',
+            hint='Apunte RESPONSE_CACHE_ALIAS a una caché compartida entre procesos (por ejemplo Redis)',
+            id='basketball.W001',
+        )]
+    return []
+
+
+def _clave_version(modelo: Type[models.Model]) -> str:
+    return f'{PREFIJO}:version:{modelo._meta.label_lower}'
+
+
+def marcar_cambio(modelo: Type[models.Model]) -> None:
+    """
+    Registrar una escritura en un modelo: invalida las respuestas que dependen de él.
+
+    La versión se actualiza de inmediato y otra vez al confirmar la
+    transacción, para descartar lo cacheado por otro proceso antes del commit.
+    """
+    clave = _clave_version(modelo)
+    _cache().set(clave, time.time_ns(), None)
+    transaction.on_commit(lambda: _cache().set(clave, time.time_ns(), None))
+
+
+def _marcar_cambio_senal(sender, **kwargs) -> None:
+    marcar_cambio(sender)
+
+
+def registrar_modelos(modelos: Iterable[Type[models.Model]]) -> None:
+    """Invalidar las respuestas cacheadas cuando se escribe en estos modelos"""
+    for modelo in modelos:
+        uid = f'{PREFIJO}:{modelo._meta.label_lower}'
+        post_save.connect(_marcar_cambio_senal, sender=modelo, dispatch_uid=uid)
+        post_delete.connect(_marcar_cambio_senal, sender=modelo, dispatch_uid=uid)
+        bulk_changed.connect(_marcar_cambio_senal, sender=modelo, dispatch_uid=uid)
+
+
+def versiones(modelos: Sequence[Type[models.Model]]) -> Dict[str, int]:
+    """Versión actual (timestamp en ns de la última escritura) de cada modelo"""
+    cache = _cache()
+    claves = [_clave_version(modelo) for modelo in modelos]
+    actuales = cache.get_many(claves)
+    for clave in claves:
+        if clave not in actuales:
+            cache.add(clave, time.time_ns(), None)
+            actuales[clave] = cache.get(clave)
+    return actuales
+
+
+def _clave_respuesta(request, modelos: Sequence[Type[models.Model]]) -> tuple:
+    parametros = json.dumps(sorted(request.GET.lists()))
+    version = versiones(modelos)
+    firma = hashlib.md5(
+        f'{request.path}?{parametros}|{sorted(version.items())}'.encode()
+    ).hexdigest()
+    return f'{PREFIJO}:{firma}', max(version.values(), default=None)
+
+
+def calcular_etag(data) -> str:
+    """ETag fuerte a partir del contenido serializado de la respuesta"""
+    return f'"{hashlib.md5(dumps(data, sort_keys=True)).hexdigest()}"'
+
+
+def respuesta_cacheada(
+    request,
+    construir: Callable[[], Response],
+    depende_de: Sequence[Type[models.Model]] = (),
+    max_age: Optional[int] = None,
+) -> Response:
+    """
+    Respuesta con ETag/Last-Modified/Cache-Control y caché del lado del servidor.
+
+    Con una caché compartida (ver cache_compartida), la respuesta de
+    ``construir`` se guarda por ruta y parámetros durante
+    RESPONSE_CACHE_TIMEOUT segundos (0 desactiva el almacenamiento), se
+    descarta cuando cambia algún modelo de ``depende_de`` y lleva
+    Last-Modified. Un If-None-Match (o If-Modified-Since, si hay
+    Last-Modified) vigente recibe 304 sin cuerpo. Solo se cachean las
+    respuestas 200 de GET/HEAD.
+
+    Args:
+        request: Petición actual (None construye la respuesta sin caché)
+        construir: Función que genera la respuesta completa
+        depende_de: Modelos cuyas escrituras invalidan la respuesta
+        max_age: Segundos que el cliente puede reutilizarla sin revalidar
+                 (default: RESPONSE_CACHE_MAX_AGE; 0 obliga a revalidar)
+    """
+    if request is None or request.method not in METODOS_CACHEABLES:
+        return construir()
+
+    # Las versiones de los modelos solo son fiables si todos los procesos las comparten
+    compartida = cache_compartida()
+    timeout = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 0) if compartida else 0
+    if max_age is None:
+        max_age = getattr(settings, 'RESPONSE_CACHE_MAX_AGE', 0)
+    clave, modificado_ns = _clave_respuesta(request, depende_de) if compartida else (None, None)
+
+    entrada = _cache().get(clave) if timeout else None
+    if entrada is None:
+        # Lo que se guarda se lee del primario: una réplica atrasada dejaría datos viejos
+        with primary_reads() if timeout else nullcontext():
+            response = construir()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        entrada = {
+            'data': response.data,
+            'etag': calcular_etag(response.data),
+            'modificado': (modificado_ns or time.time_ns()) // 1_000_000_000 if compartida else None,
+        }
+        if timeout:
+            _cache().set(clave, entrada, timeout)
+    else:
+        response = Response(entrada['data'], status=status.HTTP_200_OK)
+
+    response['ETag'] = entrada['etag']
+    if entrada['modificado'] is not None:
+        response['Last-Modified'] = http_date(entrada['modificado'])
+    if max_age:
+        patch_cache_control(response, max_age=max_age)
+    else:
+        patch_cache_control(response, no_cache=True)
+
+    return get_conditional_response(
+        request, etag=entrada['etag'], last_modified=entrada['modificado'], response=response
+    )
+
+
+def etag_fila(instancia: models.Model, campos_extra: Sequence[str] = ()) -> str:
+    """
+    ETag fuerte de una fila versionada (ModeloVersionado), sin serializarla.
+
+    Incluye la versión de las relaciones versionadas (el serializer muestra
+    datos de ellas; con select_related no generan consultas) y el valor de
+    ``campos_extra``, para anotaciones como cantidad_atletas.
+    """
+    partes = [instancia._meta.label_lower, str(instancia.pk), str(instancia.version)]
+    for campo in instancia._meta.concrete_fields:
+        if campo.is_relation and hasattr(campo.related_model, 'version'):
+            relacionado = getattr(instancia, campo.name)
+            if relacionado is not None:
+                partes.append(f'{campo.name}:{relacionado.pk}:{relacionado.version}')
+    partes.extend(f'{campo}={getattr(instancia, campo, None)}' for campo in campos_extra)
+    return f'"{hashlib.md5("|".join(partes).encode()).hexdigest()}"'
+
+
+def respuesta_condicional(
+    request,
+    instancia: models.Model,
+    construir: Callable[[], Response],
+    campos_extra: Sequence[str] = (),
+) -> Response:
+    """
+    Respuesta de detalle con ETag derivado de la versión de la fila.
+
+    Si el If-None-Match de la petición coincide se responde 304 sin ejecutar
+    ``construir`` (no se serializa la instancia).
+    """
+    etag = etag_fila(instancia, campos_extra)
+    response = None
+    if request is not None and request.method in METODOS_CACHEABLES:
+        response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = construir()
+    response['ETag'] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def version_if_match(
+    request,
+    obtener: Callable[[], Optional[models.Model]],
+    campos_extra: Sequence[str] = (),
+) -> Optional[int]:
+    """
+    Versión esperada de la fila según la cabecera If-Match.
+
+    Args:
+        request: Petición actual
+        obtener: Función que lee la fila con el mismo perfil que el detalle
+        campos_extra: Igual que en etag_fila
+
+    Returns:
+        La versión actual si el ETag coincide, o None si no hay If-Match,
+        es '*' o la fila no existe
+
+    Raises:
+        VersionConflictError: Si la fila cambió desde que se obtuvo el ETag
+    """
+    cabecera = request.headers.get('If-Match') if request is not None else None
+    if not cabecera:
+        return None
+    etags = parse_etags(cabecera)
+    if '*' in etags:
+        return None
+    instancia = obtener()
+    if instancia is None:
+        return None
+    if etag_fila(instancia, campos_extra) not in etags:
+        raise VersionConflictError('El recurso fue modificado desde que se obtuvo su ETag')
+    return instancia.version
@@ -0,0 +1,98 @@
+"""
+Lectura de archivos de carga masiva (CSV o XLSX) como lista de filas
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+
+class FilaArchivo(dict):
+    """Fila leída de un archivo; ``numero`` es su línea en el archivo (el encabezado es la 1)"""
+    
+    def __init__(self, datos: Dict[str, Any], numero: int):
+        super().__init__(datos)
+        self.numero = numero
+
+
+def leer_archivo(archivo) -> List[FilaArchivo]:
+    """
+    Leer un archivo subido y devolver sus filas como diccionarios.
+    
+    La primera fila es el encabezado; los nombres de columna se normalizan a
+    minúsculas y las celdas vacías se omiten. Cada fila conserva su número de
+    línea para el reporte de errores, aunque se descarten filas vacías.
+    
+    Raises:
+        ValueError: Si el formato no es CSV/XLSX o el archivo no se puede leer
+    """
+    nombre = (archivo.name or '').lower()
+    if nombre.endswith('.xlsx'):
+        return leer_xlsx(archivo)
+    if nombre.endswith('.csv') or getattr(archivo, 'content_type', '') == 'text/csv':
+        return leer_csv(archivo.read())
+    raise ValueError('Formato de archivo no soportado: use CSV o XLSX')
+
+
+def leer_csv(contenido: bytes) -> List[FilaArchivo]:
+    """Filas de un CSV separado por comas, punto y coma o tabuladores"""
+    try:
+        texto = contenido.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        texto = contenido.decode('latin-1')
+    try:
+        dialecto = csv.Sniffer().sniff(texto[:4096], delimiters=',;\t')
+    except csv.Error:
+        dialecto = csv.excel
+    lector = csv.reader(io.StringIO(texto), dialecto)
+    return _filas(next(lector, None), lector)
+
+
+def leer_xlsx(archivo) -> List[FilaArchivo]:
+    """Filas de la hoja activa de un libro XLSX (requiere openpyxl)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError('La carga de archivos XLSX requiere el paquete openpyxl')
+    try:
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f'No se pudo leer el archivo XLSX: {e}')
+    try:
+        filas = libro.active.iter_rows(values_only=True)
+        return _filas(next(filas, None), filas)
+    finally:
+        libro.close()
+
+
+def _filas(encabezado, valores: Iterable[Iterable[Any]]) -> List[FilaArchivo]:
+    """Combinar encabezado y valores, descartando celdas y filas vacías"""
+    if not encabezado:
+        return []
+    columnas = [str(columna or '').strip().lower() for columna in encabezado]
+    filas = []
+    for numero, celdas in enumerate(valores, start=2):
+        celdas = list(celdas)
+        if len(celdas) > len(columnas) and any(_valor(c) is not None for c in celdas[len(columnas):]):
+            raise ValueError(f'La fila {numero} tiene más columnas que el encabezado')
+        fila = {
+            columna: _valor(celda)
+            for columna, celda in zip(columnas, celdas)
+            if columna and _valor(celda) is not None
+        }
+        if fila:
+            filas.append(FilaArchivo(fila, numero))
+    return filas
+
+
+def _valor(celda: Any) -> Any:
+    """Normalizar una celda: texto sin espacios, fechas sin hora y enteros sin decimales"""
+    if isinstance(celda, str):
+        celda = celda.strip()
+        return celda or None
+    if isinstance(celda, datetime):
+        return celda.date()
+    if isinstance(celda, float) and celda.is_integer():
+        return int(celda)
+    return celda
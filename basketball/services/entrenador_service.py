@@ -3,6 +3,7 @@ Servicio API para Entrenadores - Usando DAO
 """
 
 from basketball.controllers.entrenador_controller import EntrenadorController
+from basketball.dao import InvalidCursorError
 from basketball.services.api_response import APIResponse
 from basketball.serializers import EntrenadorSerializer, GrupoAtletaSerializer
 
@@ -67,6 +68,24 @@ class EntrenadorService:
             message=f"Se encontraron {len(entrenadores)} entrenadores"
         )
     
+    @classmethod
+    def paginar_entrenadores(
+        cls, page: int = 1, page_size: int = 10, criterios: dict = None, cursor: str = None
+    ):
+        """Listar entrenadores paginados con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_entrenadores(
+                page, page_size, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = EntrenadorSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} entrenadores"
+        )
+    
     @classmethod
     def actualizar_entrenador(cls, entrenador_id: int, data: dict):
         """Actualizar un entrenador"""
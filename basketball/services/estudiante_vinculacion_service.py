@@ -3,6 +3,7 @@ Servicio API para Estudiantes de Vinculación - Usando DAO
 """
 
 from basketball.controllers.estudiante_vinculacion_controller import EstudianteVinculacionController
+from basketball.dao import InvalidCursorError
 from basketball.services.api_response import APIResponse
 from basketball.serializers import EstudianteVinculacionSerializer
 
@@ -67,6 +68,24 @@ class EstudianteVinculacionService:
             message=f"Se encontraron {len(estudiantes)} estudiantes"
         )
     
+    @classmethod
+    def paginar_estudiantes(
+        cls, page: int = 1, page_size: int = 10, criterios: dict = None, cursor: str = None
+    ):
+        """Listar estudiantes paginados con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_estudiantes(
+                page, page_size, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = EstudianteVinculacionSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} estudiantes"
+        )
+    
     @classmethod
     def actualizar_estudiante(cls, estudiante_id: int, data: dict):
         """Actualizar un estudiante"""
@@ -0,0 +1,75 @@
+"""
+Exportación en streaming (CSV o NDJSON) de QuerySets grandes
+"""
+
+import csv
+from typing import Iterable, Iterator, List
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from basketball_project.renderers import dumps
+
+
+FORMATOS_EXPORTACION = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class _Eco:
+    """Buffer de escritura que devuelve lo escrito, para usar csv.writer en streaming"""
+
+    def write(self, valor: str) -> str:
+        return valor
+
+
+def respuesta_exportacion(
+    filas: QuerySet, columnas: List[str], formato: str, nombre: str
+) -> StreamingHttpResponse:
+    """
+    Respuesta en streaming con las filas de un QuerySet values_list.
+    
+    Las filas se leen con iterator(chunk_size=EXPORT_CHUNK_SIZE) (cursor del
+    lado del servidor en PostgreSQL) y se emiten por bloques, por lo que la
+    memoria usada no depende del tamaño de la tabla.
+    
+    Args:
+        filas: QuerySet values_list con las columnas en el orden de columnas
+        columnas: Nombres de columna (encabezado CSV / claves NDJSON)
+        formato: 'csv' o 'ndjson'
+        nombre: Nombre del archivo descargado, sin extensión
+    """
+    chunk_size = getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+    generar = _ndjson if formato == 'ndjson' else _csv
+    response = StreamingHttpResponse(
+        _por_bloques(generar(filas.iterator(chunk_size=chunk_size), columnas), chunk_size),
+        content_type=FORMATOS_EXPORTACION[formato],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{nombre}.{formato}"'
+    return response
+
+
+def _csv(filas: Iterable[tuple], columnas: List[str]) -> Iterator[str]:
+    escritor = csv.writer(_Eco())
+    yield escritor.writerow(columnas)
+    for fila in filas:
+        yield escritor.writerow(fila)
+
+
+def _ndjson(filas: Iterable[tuple], columnas: List[str]) -> Iterator[str]:
+    for fila in filas:
+        yield dumps(dict(zip(columnas, fila))).decode() + '\n'
+
+
+def _por_bloques(lineas: Iterable[str], tamano: int) -> Iterator[str]:
+    """Agrupar líneas para no enviar un fragmento HTTP por fila"""
+    bloque = []
+    for linea in lineas:
+        bloque.append(linea)
+        if len(bloque) >= tamano:
+            yield ''.join(bloque)
+            bloque = []
+    if bloque:
+        yield ''.join(bloque)
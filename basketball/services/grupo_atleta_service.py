@@ -3,7 +3,10 @@ Servicio API para Grupos de Atletas - Usando DAO
 """
 
 from basketball.controllers.grupo_atleta_controller import GrupoAtletaController
+from basketball.dao import InvalidCursorError, VersionConflictError
+from basketball.models import Atleta, GrupoAtleta
 from basketball.services.api_response import APIResponse
+from basketball.services.cache_respuestas import version_if_match
 from basketball.serializers import GrupoAtletaSerializer, AtletaSerializer
 
 
@@ -29,14 +32,17 @@ class GrupoAtletaService:
             )
     
     @classmethod
-    def obtener_grupo(cls, grupo_id: int):
-        """Obtener un grupo por ID"""
+    def obtener_grupo(cls, grupo_id: int, request=None):
+        """Obtener un grupo por ID (304 si el If-None-Match coincide con su versión)"""
         grupo = cls._controller.obtener_grupo(grupo_id)
         if grupo:
-            serializer = GrupoAtletaSerializer(grupo)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Grupo encontrado"
+            return APIResponse.conditional(
+                request, grupo,
+                lambda: APIResponse.success(
+                    data=GrupoAtletaSerializer(grupo).data,
+                    message="Grupo encontrado"
+                ),
+                extra_fields=('cantidad_atletas',)
             )
         return APIResponse.not_found(
             message="Grupo no encontrado",
@@ -54,9 +60,50 @@ class GrupoAtletaService:
         )
     
     @classmethod
-    def actualizar_grupo(cls, grupo_id: int, data: dict):
-        """Actualizar un grupo"""
-        grupo = cls._controller.actualizar_grupo(grupo_id, data)
+    def paginar_grupos(
+        cls, page: int = 1, page_size: int = 10,
+        activos_solo: bool = True, categoria: str = None, cursor: str = None,
+        request=None
+    ):
+        """
+        Listar grupos paginados con filtro opcional por categoría.
+        
+        Con request, la respuesta se cachea hasta que cambian los grupos o
+        los atletas (por el conteo de atletas de cada grupo).
+        """
+        return APIResponse.cached(
+            request,
+            lambda: cls._paginar_grupos(page, page_size, activos_solo, categoria, cursor),
+            depends_on=(GrupoAtleta, Atleta)
+        )
+    
+    @classmethod
+    def _paginar_grupos(
+        cls, page: int, page_size: int, activos_solo: bool, categoria: str, cursor: str
+    ):
+        try:
+            resultado = cls._controller.paginar_grupos(
+                page, page_size, activos_solo, categoria, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = GrupoAtletaSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} grupos"
+        )
+    
+    @classmethod
+    def actualizar_grupo(cls, grupo_id: int, data: dict, request=None):
+        """Actualizar un grupo (con If-Match, solo si no cambió desde que se obtuvo su ETag)"""
+        try:
+            version = version_if_match(
+                request, lambda: cls._controller.obtener_grupo(grupo_id), ('cantidad_atletas',)
+            )
+            grupo = cls._controller.actualizar_grupo(grupo_id, data, version)
+        except VersionConflictError as e:
+            return APIResponse.precondition_failed(str(e))
         if grupo:
             serializer = GrupoAtletaSerializer(grupo)
             return APIResponse.success(
@@ -2,8 +2,11 @@
 Servicio API para Inscripciones - Usando DAO
 """
 
-from basketball.controllers.inscripcion_controller import InscripcionController
+from basketball.controllers.inscripcion_controller import InscripcionController, COLUMNAS_EXPORTACION
+from basketball.dao import InvalidCursorError, VersionConflictError
 from basketball.services.api_response import APIResponse
+from basketball.services.cache_respuestas import version_if_match
+from basketball.services.exportacion import respuesta_exportacion
 from basketball.serializers import InscripcionSerializer
 
 
@@ -29,14 +32,16 @@ class InscripcionService:
             )
     
     @classmethod
-    def obtener_inscripcion(cls, inscripcion_id: int):
-        """Obtener una inscripción por ID"""
+    def obtener_inscripcion(cls, inscripcion_id: int, request=None):
+        """Obtener una inscripción por ID (304 si el If-None-Match coincide con su versión)"""
         inscripcion = cls._controller.obtener_inscripcion(inscripcion_id)
         if inscripcion:
-            serializer = InscripcionSerializer(inscripcion)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Inscripción encontrada"
+            return APIResponse.conditional(
+                request, inscripcion,
+                lambda: APIResponse.success(
+                    data=InscripcionSerializer(inscripcion).data,
+                    message="Inscripción encontrada"
+                )
             )
         return APIResponse.not_found(
             message="Inscripción no encontrada",
@@ -53,6 +58,24 @@ class InscripcionService:
             message=f"Se encontraron {len(inscripciones)} inscripciones"
         )
     
+    @classmethod
+    def paginar_inscripciones(
+        cls, page: int = 1, page_size: int = 10, criterios: dict = None, cursor: str = None
+    ):
+        """Listar inscripciones paginadas con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_inscripciones(
+                page, page_size, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = InscripcionSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} inscripciones"
+        )
+    
     @classmethod
     def listar_inscripciones_habilitadas(cls):
         """Listar inscripciones habilitadas"""
@@ -74,9 +97,13 @@ class InscripcionService:
         )
     
     @classmethod
-    def actualizar_inscripcion(cls, inscripcion_id: int, data: dict):
-        """Actualizar una inscripción"""
-        inscripcion = cls._controller.actualizar_inscripcion(inscripcion_id, data)
+    def actualizar_inscripcion(cls, inscripcion_id: int, data: dict, request=None):
+        """Actualizar una inscripción (con If-Match, solo si no cambió desde que se obtuvo su ETag)"""
+        try:
+            version = version_if_match(request, lambda: cls._controller.obtener_inscripcion(inscripcion_id))
+            inscripcion = cls._controller.actualizar_inscripcion(inscripcion_id, data, version)
+        except VersionConflictError as e:
+            return APIResponse.precondition_failed(str(e))
         if inscripcion:
             serializer = InscripcionSerializer(inscripcion)
             return APIResponse.success(
@@ -149,3 +176,13 @@ class InscripcionService:
             data=serializer.data,
             message=f"Se encontraron {len(inscripciones)} inscripciones"
         )
+    
+    @classmethod
+    def exportar_inscripciones(cls, criterios: dict, formato: str = 'csv'):
+        """Exportar inscripciones en CSV o NDJSON (respuesta en streaming)"""
+        return respuesta_exportacion(
+            cls._controller.exportar_inscripciones(criterios),
+            COLUMNAS_EXPORTACION,
+            formato,
+            'inscripciones'
+        )
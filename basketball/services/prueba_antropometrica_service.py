@@ -2,8 +2,11 @@
 Servicio API para Pruebas Antropométricas - Usando DAO
 """
 
-from basketball.controllers.prueba_antropometrica_controller import PruebaAntropometricaController
+from basketball.controllers.prueba_antropometrica_controller import PruebaAntropometricaController, COLUMNAS_EXPORTACION
+from basketball.dao import InvalidCursorError, VersionConflictError
 from basketball.services.api_response import APIResponse
+from basketball.services.cache_respuestas import version_if_match
+from basketball.services.exportacion import respuesta_exportacion
 from basketball.serializers import PruebaAntropometricaSerializer
 
 
@@ -29,14 +32,33 @@ class PruebaAntropometricaService:
             )
     
     @classmethod
-    def obtener_prueba(cls, prueba_id: int):
-        """Obtener una prueba por ID"""
+    def cargar_pruebas(cls, filas: list):
+        """Cargar pruebas antropométricas en lote con reporte por fila"""
+        try:
+            reporte = cls._controller.cargar_pruebas(filas)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        if not reporte['creadas'] and reporte['errores']:
+            return APIResponse.error(
+                message="No se cargó ninguna prueba",
+                errors=reporte
+            )
+        return APIResponse.created(
+            data=reporte,
+            message=f"Se cargaron {reporte['creadas']} de {reporte['total']} pruebas"
+        )
+    
+    @classmethod
+    def obtener_prueba(cls, prueba_id: int, request=None):
+        """Obtener una prueba por ID (304 si el If-None-Match coincide con su versión)"""
         prueba = cls._controller.obtener_prueba(prueba_id)
         if prueba:
-            serializer = PruebaAntropometricaSerializer(prueba)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Prueba encontrada"
+            return APIResponse.conditional(
+                request, prueba,
+                lambda: APIResponse.success(
+                    data=PruebaAntropometricaSerializer(prueba).data,
+                    message="Prueba encontrada"
+                )
             )
         return APIResponse.not_found(
             message="Prueba no encontrada",
@@ -54,9 +76,32 @@ class PruebaAntropometricaService:
         )
     
     @classmethod
-    def actualizar_prueba(cls, prueba_id: int, data: dict):
-        """Actualizar una prueba"""
-        prueba = cls._controller.actualizar_prueba(prueba_id, data)
+    def paginar_pruebas(
+        cls, page: int = 1, page_size: int = 10,
+        activas_solo: bool = True, criterios: dict = None, cursor: str = None
+    ):
+        """Listar pruebas paginadas con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_pruebas(
+                page, page_size, activas_solo, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = PruebaAntropometricaSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} pruebas"
+        )
+    
+    @classmethod
+    def actualizar_prueba(cls, prueba_id: int, data: dict, request=None):
+        """Actualizar una prueba (con If-Match, solo si no cambió desde que se obtuvo su ETag)"""
+        try:
+            version = version_if_match(request, lambda: cls._controller.obtener_prueba(prueba_id))
+            prueba = cls._controller.actualizar_prueba(prueba_id, data, version)
+        except VersionConflictError as e:
+            return APIResponse.precondition_failed(str(e))
         if prueba:
             serializer = PruebaAntropometricaSerializer(prueba)
             return APIResponse.success(
@@ -124,3 +169,13 @@ class PruebaAntropometricaService:
             data=serializer.data,
             message=f"Se encontraron {len(pruebas)} pruebas"
         )
+    
+    @classmethod
+    def exportar_pruebas(cls, criterios: dict, formato: str = 'csv'):
+        """Exportar pruebas antropométricas en CSV o NDJSON (respuesta en streaming)"""
+        return respuesta_exportacion(
+            cls._controller.exportar_pruebas(criterios),
+            COLUMNAS_EXPORTACION,
+            formato,
+            'pruebas_antropometricas'
+        )
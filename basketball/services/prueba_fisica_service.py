@@ -2,9 +2,13 @@
 Servicio API para Pruebas Físicas - Usando DAO
 """
 
-from basketball.controllers.prueba_fisica_controller import PruebaFisicaController
+from basketball.controllers.prueba_fisica_controller import PruebaFisicaController, COLUMNAS_EXPORTACION
+from basketball.dao import InvalidCursorError, VersionConflictError
 from basketball.services.api_response import APIResponse
-from basketball.serializers import PruebaFisicaSerializer
+from basketball.services.cache_respuestas import MAX_AGE_ESTATICO, version_if_match
+from basketball.services.exportacion import respuesta_exportacion
+from basketball.models import Atleta, GrupoAtleta, PruebaFisica
+from basketball.serializers import PruebaFisicaSerializer, RankingPruebaSerializer
 
 
 class PruebaFisicaService:
@@ -29,14 +33,33 @@ class PruebaFisicaService:
             )
     
     @classmethod
-    def obtener_prueba(cls, prueba_id: int):
-        """Obtener una prueba por ID"""
+    def cargar_pruebas(cls, filas: list):
+        """Cargar pruebas físicas en lote con reporte por fila"""
+        try:
+            reporte = cls._controller.cargar_pruebas(filas)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        if not reporte['creadas'] and reporte['errores']:
+            return APIResponse.error(
+                message="No se cargó ninguna prueba",
+                errors=reporte
+            )
+        return APIResponse.created(
+            data=reporte,
+            message=f"Se cargaron {reporte['creadas']} de {reporte['total']} pruebas"
+        )
+    
+    @classmethod
+    def obtener_prueba(cls, prueba_id: int, request=None):
+        """Obtener una prueba por ID (304 si el If-None-Match coincide con su versión)"""
         prueba = cls._controller.obtener_prueba(prueba_id)
         if prueba:
-            serializer = PruebaFisicaSerializer(prueba)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Prueba encontrada"
+            return APIResponse.conditional(
+                request, prueba,
+                lambda: APIResponse.success(
+                    data=PruebaFisicaSerializer(prueba).data,
+                    message="Prueba encontrada"
+                )
             )
         return APIResponse.not_found(
             message="Prueba no encontrada",
@@ -54,9 +77,32 @@ class PruebaFisicaService:
         )
     
     @classmethod
-    def actualizar_prueba(cls, prueba_id: int, data: dict):
-        """Actualizar una prueba"""
-        prueba = cls._controller.actualizar_prueba(prueba_id, data)
+    def paginar_pruebas(
+        cls, page: int = 1, page_size: int = 10,
+        activas_solo: bool = True, criterios: dict = None, cursor: str = None
+    ):
+        """Listar pruebas paginadas con filtros opcionales"""
+        try:
+            resultado = cls._controller.paginar_pruebas(
+                page, page_size, activas_solo, criterios, cursor
+            )
+        except InvalidCursorError as e:
+            return APIResponse.error(message=str(e))
+        serializer = PruebaFisicaSerializer(resultado['data'], many=True)
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Se encontraron {resultado.get('total', len(resultado['data']))} pruebas"
+        )
+    
+    @classmethod
+    def actualizar_prueba(cls, prueba_id: int, data: dict, request=None):
+        """Actualizar una prueba (con If-Match, solo si no cambió desde que se obtuvo su ETag)"""
+        try:
+            version = version_if_match(request, lambda: cls._controller.obtener_prueba(prueba_id))
+            prueba = cls._controller.actualizar_prueba(prueba_id, data, version)
+        except VersionConflictError as e:
+            return APIResponse.precondition_failed(str(e))
         if prueba:
             serializer = PruebaFisicaSerializer(prueba)
             return APIResponse.success(
@@ -122,12 +168,15 @@ class PruebaFisicaService:
         )
     
     @classmethod
-    def obtener_tipos_prueba(cls):
-        """Obtener tipos de prueba disponibles"""
-        tipos = cls._controller.obtener_tipos_prueba()
-        return APIResponse.success(
-            data=tipos,
-            message="Tipos de prueba obtenidos"
+    def obtener_tipos_prueba(cls, request=None):
+        """Obtener tipos de prueba disponibles (catálogo estático, cacheado)"""
+        return APIResponse.cached(
+            request,
+            lambda: APIResponse.success(
+                data=cls._controller.obtener_tipos_prueba(),
+                message="Tipos de prueba obtenidos"
+            ),
+            max_age=MAX_AGE_ESTATICO
         )
     
     @classmethod
@@ -138,3 +187,42 @@ class PruebaFisicaService:
             data=estadisticas,
             message="Estadísticas obtenidas"
         )
+    
+    @classmethod
+    def obtener_ranking(
+        cls, tipo_prueba: str, grupo_id: int = None, sexo: str = None,
+        page: int = 1, page_size: int = 10, request=None
+    ):
+        """
+        Ranking de un tipo de prueba por grupo y sexo (cacheado).
+        Se invalida con las escrituras en pruebas físicas, atletas y grupos.
+        """
+        return APIResponse.cached(
+            request,
+            lambda: cls._ranking(tipo_prueba, grupo_id, sexo, page, page_size),
+            depends_on=(PruebaFisica, Atleta, GrupoAtleta)
+        )
+    
+    @classmethod
+    def _ranking(cls, tipo_prueba: str, grupo_id: int, sexo: str, page: int, page_size: int):
+        try:
+            resultado = cls._controller.obtener_ranking(tipo_prueba, grupo_id, sexo, page, page_size)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        serializer = RankingPruebaSerializer(resultado['data'], many=True)
+        orden = "menor" if resultado['menor_es_mejor'] else "mayor"
+        return APIResponse.from_page(
+            resultado,
+            data=serializer.data,
+            message=f"Ranking de {tipo_prueba}: {resultado['total']} atletas ({orden} resultado es mejor)"
+        )
+    
+    @classmethod
+    def exportar_pruebas(cls, criterios: dict, formato: str = 'csv'):
+        """Exportar pruebas físicas en CSV o NDJSON (respuesta en streaming)"""
+        return respuesta_exportacion(
+            cls._controller.exportar_pruebas(criterios),
+            COLUMNAS_EXPORTACION,
+            formato,
+            'pruebas_fisicas'
+        )
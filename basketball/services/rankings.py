@@ -0,0 +1,82 @@
+"""
+Mantenimiento de la tabla de rankings (RankingPrueba)
+Una prueba física nueva o eliminada ajusta solo la fila de su atleta y tipo;
+una actualización recalcula las filas del atleta. El grupo y el sexo se
+copian cuando cambia el atleta. Las escrituras masivas (bulk_changed)
+recalculan solo los atletas que trae la señal.
+"""
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from basketball.dao import RankingPruebaDAO
+from basketball.dao.signals import bulk_changed
+from basketball.models import Atleta, PruebaFisica
+
+
+PREFIJO = 'ranking'
+
+_dao = RankingPruebaDAO()
+
+
+def _recordar_atleta(sender, instance, raw=False, **kwargs) -> None:
+    """Guardar el atleta anterior de una prueba existente (puede reasignarse a otro)"""
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._ranking_atleta_anterior = (
+        sender.objects.filter(pk=instance.pk).values_list('atleta_id', flat=True).first()
+    )
+
+
+def _prueba_guardada(sender, instance, created=False, raw=False, **kwargs) -> None:
+    if raw:
+        return
+    if created:
+        _dao.add_prueba(instance)
+        return
+    # Una actualización puede cambiar el resultado, el tipo, el estado o el atleta
+    anterior = getattr(instance, '_ranking_atleta_anterior', None)
+    _dao.refresh_atletas({instance.atleta_id} | ({anterior} if anterior else set()))
+
+
+def _prueba_eliminada(sender, instance, origin=None, **kwargs) -> None:
+    # Si se elimina el atleta, sus filas de ranking se eliminan en cascada
+    if isinstance(origin, Atleta):
+        return
+    if isinstance(origin, QuerySet):
+        # QuerySet.delete() borra todas las filas antes de emitir las señales:
+        # basta con recalcular una vez cada atleta afectado
+        atletas = origin.__dict__.setdefault('_ranking_atletas', set())
+        if instance.atleta_id not in atletas:
+            atletas.add(instance.atleta_id)
+            _dao.refresh_atletas([instance.atleta_id])
+        return
+    _dao.remove_prueba(instance)
+
+
+def _atleta_guardado(sender, instance, created=False, raw=False, **kwargs) -> None:
+    if created or raw:
+        return
+    _dao.sync_atletas([instance.pk])
+
+
+def _pruebas_masivas(sender, keys=None, **kwargs) -> None:
+    atleta_ids = (keys or {}).get('atleta_id')
+    if atleta_ids:
+        _dao.refresh_atletas(atleta_ids)
+
+
+def _atletas_masivos(sender, keys=None, **kwargs) -> None:
+    atleta_ids = (keys or {}).get('id')
+    if atleta_ids:
+        _dao.sync_atletas(atleta_ids)
+
+
+def registrar_senales() -> None:
+    """Conectar las señales que mantienen la tabla de rankings"""
+    pre_save.connect(_recordar_atleta, sender=PruebaFisica, dispatch_uid=f'{PREFIJO}:pre_save')
+    post_save.connect(_prueba_guardada, sender=PruebaFisica, dispatch_uid=f'{PREFIJO}:prueba')
+    post_delete.connect(_prueba_eliminada, sender=PruebaFisica, dispatch_uid=f'{PREFIJO}:prueba')
+    bulk_changed.connect(_pruebas_masivas, sender=PruebaFisica, dispatch_uid=f'{PREFIJO}:pruebas')
+    post_save.connect(_atleta_guardado, sender=Atleta, dispatch_uid=f'{PREFIJO}:atleta')
+    bulk_changed.connect(_atletas_masivos, sender=Atleta, dispatch_uid=f'{PREFIJO}:atletas')
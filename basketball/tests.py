@@ -2,18 +2,48 @@
 Tests del módulo Basketball
 """
 
-from django.test import TestCase
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import CommandError
+from django.db import DatabaseError, connection, connections, router, transaction
+from django.db.models import QuerySet
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from datetime import date, timedelta
 from decimal import Decimal
+from datetime import datetime, timezone as dt_timezone
 
 from basketball.models import (
     Usuario, GrupoAtleta, Entrenador, EstudianteVinculacion,
-    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica,
+    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica, RankingPrueba,
     TipoInscripcion, TipoPrueba
 )
+from basketball.dao import (
+    AtletaDAO, GrupoAtletaDAO, PruebaAntropometricaDAO, PruebaFisicaDAO, RankingPruebaDAO,
+    VersionConflictError
+)
+from basketball.controllers.atleta_controller import AtletaController
+from basketball.controllers.connection import ConnectionPool, PoolTimeoutError
+from basketball.dao.cache import LRUCacheBackend, reset_cache_backend
+from basketball.dao import concurrency, routing
+from basketball.services.cache_respuestas import comprobar_cache
+from basketball_project.renderers import FastJSONParser, FastJSONRenderer
 
 
 class AtletaModelTest(TestCase):
@@ -169,6 +199,40 @@ class PruebaAntropometricaModelTest(TestCase):
     def test_validar_datos(self):
         """Test validación de datos"""
         self.assertTrue(self.prueba.validar_datos())
+    
+    def test_estadisticas_agregadas(self):
+        """Test estadísticas calculadas con aggregate y ventana de fechas"""
+        anterior = PruebaAntropometrica.objects.create(
+            atleta=self.atleta,
+            estatura=174.5,
+            peso=66.0,
+            altura_sentado=89.0,
+            envergadura=179.0
+        )
+        PruebaAntropometrica.objects.filter(pk=anterior.pk).update(
+            fecha_registro=date.today() - timedelta(days=60)
+        )
+        dao = PruebaAntropometricaDAO()
+        with self.assertNumQueries(2):
+            estadisticas = dao.get_estadisticas_by_atleta(self.atleta.id)
+        self.assertEqual(estadisticas['total_pruebas'], 2)
+        self.assertEqual(estadisticas['ultima_prueba'], self.prueba)
+        self.assertAlmostEqual(estadisticas['promedio_peso'], 68.0)
+        self.assertAlmostEqual(estadisticas['promedio_estatura'], 175.0)
+        
+        recientes = dao.get_estadisticas_by_atleta(
+            self.atleta.id, fecha_desde=date.today() - timedelta(days=30)
+        )
+        self.assertEqual(recientes['total_pruebas'], 1)
+        self.assertAlmostEqual(recientes['promedio_peso'], 70.0)
+        antiguas = dao.get_estadisticas_by_atleta(
+            self.atleta.id, fecha_hasta=date.today() - timedelta(days=30)
+        )
+        self.assertEqual(antiguas['ultima_prueba'], anterior)
+        self.assertEqual(
+            dao.get_estadisticas_by_atleta(self.atleta.id, fecha_desde=date.today() + timedelta(days=1)),
+            {}
+        )
 
 
 class PruebaFisicaModelTest(TestCase):
@@ -216,6 +280,196 @@ class PruebaFisicaModelTest(TestCase):
         self.assertIn("porcentaje_cambio", comparacion)
 
 
+class FastJSONRendererTest(TestCase):
+    """Tests del renderer/parser JSON basado en orjson"""
+    
+    def test_misma_salida_que_drf(self):
+        """Test que fechas, Decimals, TextChoices y claves numéricas se codifican como en DRF"""
+        data = {
+            'fecha': date(2024, 3, 14),
+            'momento': datetime(2024, 3, 14, 10, 30, 15, 250000, tzinfo=dt_timezone.utc),
+            'valor': Decimal('12.50'),
+            'tipo': TipoPrueba.VELOCIDAD,
+            'por_atleta': {1: 'a', 2: 'b'},
+            'duracion': timedelta(minutes=1, seconds=30),
+            'texto': 'Ñandú \u2028 fin',
+            'lista': (1, 2.5, None, True),
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+        self.assertEqual(
+            FastJSONRenderer().render(data, 'application/json; indent=2'),
+            JSONRenderer().render(data, 'application/json; indent=2')
+        )
+    
+    def test_parser(self):
+        """Test que el parser lee UTF-8 y rechaza JSON inválido"""
+        parser = FastJSONParser()
+        self.assertEqual(parser.parse(BytesIO('{"nombre": "Ñandú"}'.encode())), {'nombre': 'Ñandú'})
+        for invalido in [b'{"a": ', b'{"a": NaN}']:
+            with self.assertRaises(ParseError):
+                parser.parse(BytesIO(invalido))
+
+
+class CargaMasivaDAOTest(TestCase):
+    """Tests de GenericDAO.bulk_ingest"""
+    
+    def setUp(self):
+        """Crear un grupo y un atleta existente"""
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-15", rango_edad_minima=13, rango_edad_maxima=15, categoria="Formativa"
+        )
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Ana", apellido_atleta="Martínez", dni="5566778899",
+            fecha_nacimiento=date(2009, 11, 25), sexo="Femenino"
+        )
+    
+    def fila_atleta(self, dni, **datos):
+        fila = {
+            'nombre_atleta': 'Luis', 'apellido_atleta': 'Vega', 'dni': dni,
+            'fecha_nacimiento': '2011-03-14', 'sexo': 'Masculino', 'grupo': self.grupo.id,
+        }
+        fila.update(datos)
+        return fila
+    
+    def test_errores_por_fila(self):
+        """Test que las filas inválidas se reportan sin abortar el lote"""
+        filas = [
+            self.fila_atleta('100'),
+            self.fila_atleta('5566778899'),
+            self.fila_atleta('101', grupo=9999),
+            self.fila_atleta('102', nombre_atleta=''),
+            self.fila_atleta('103', fecha_nacimiento='no-es-fecha'),
+            self.fila_atleta('100'),
+            self.fila_atleta('104', grupo=None),
+        ]
+        resultado = AtletaDAO().bulk_ingest(filas, batch_size=3)
+        
+        self.assertEqual(resultado['creados'], 2)
+        errores = {error['fila']: error['errores'] for error in resultado['errores']}
+        self.assertEqual(sorted(errores), [1, 2, 3, 4, 5])
+        self.assertIn('dni', errores[1])
+        self.assertIn('grupo', errores[2])
+        self.assertIn('nombre_atleta', errores[3])
+        self.assertIn('fecha_nacimiento', errores[4])
+        
+        atleta = Atleta.objects.get(dni='100')
+        self.assertEqual(atleta.edad, atleta.calcular_edad())
+        self.assertEqual(atleta.grupo, self.grupo)
+    
+    def test_campos_derivados_antropometricos(self):
+        """Test que se calculan IMC e índice córnico en la carga masiva"""
+        resultado = PruebaAntropometricaDAO().bulk_ingest([
+            {'atleta': self.atleta.id, 'estatura': '170', 'peso': '65', 'altura_sentado': '88.4'},
+            {'atleta': self.atleta.id, 'estatura': '-1', 'peso': '65'},
+        ])
+        
+        self.assertEqual(resultado['creados'], 1)
+        self.assertEqual(resultado['errores'][0]['fila'], 1)
+        prueba = PruebaAntropometrica.objects.get(atleta=self.atleta)
+        self.assertEqual(prueba.indice_masa_corporal, 22.49)
+        self.assertEqual(prueba.indice_cornico, 52.0)
+    
+    def test_bulk_create_calcula_edad(self):
+        """Test que bulk_create también calcula los campos derivados"""
+        creados = AtletaDAO().bulk_create([
+            self.fila_atleta('200', fecha_nacimiento=date(2011, 3, 14), grupo_id=self.grupo.id, grupo=None)
+        ])
+        self.assertEqual(Atleta.objects.get(dni='200').edad, creados[0].calcular_edad())
+
+
+@override_settings(DAO_CACHE_BACKEND='lru')
+class CacheDAOTest(TestCase):
+    """Tests de la caché de lectura de los DAOs"""
+    
+    def setUp(self):
+        """Crear un grupo y un atleta con la caché vacía"""
+        reset_cache_backend()
+        self.addCleanup(reset_cache_backend)
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-15", rango_edad_minima=13, rango_edad_maxima=15, categoria="Formativa"
+        )
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Ana", apellido_atleta="Martínez", dni="5566778899",
+            fecha_nacimiento=date(2009, 11, 25), sexo="Femenino", grupo=self.grupo
+        )
+        self.dao = AtletaDAO()
+    
+    def test_find_by_id_cacheado(self):
+        """Test que la segunda lectura por ID no consulta la base de datos"""
+        self.dao.find_by_id(self.atleta.id)
+        with self.assertNumQueries(0):
+            atleta = self.dao.find_by_id(str(self.atleta.id))
+        self.assertEqual(atleta.dni, "5566778899")
+        
+        atleta.nombre_atleta = "Modificado"
+        self.assertEqual(self.dao.find_by_id(self.atleta.id).nombre_atleta, "Ana")
+    
+    def test_find_by_field_unico(self):
+        """Test que find_by_field cachea los campos únicos"""
+        self.dao.find_by_dni("5566778899")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.dao.find_by_dni("5566778899").id, self.atleta.id)
+        
+        self.dao.update(self.atleta.id, dni="1111111111")
+        self.assertIsNone(self.dao.find_by_dni("5566778899"))
+        self.assertEqual(self.dao.find_by_dni("1111111111").id, self.atleta.id)
+    
+    def test_invalidacion(self):
+        """Test que update, delete, restore y las escrituras masivas invalidan la caché"""
+        self.dao.find_by_id(self.atleta.id)
+        self.dao.update(self.atleta.id, nombre_atleta="Ana María")
+        self.assertEqual(self.dao.find_by_id(self.atleta.id).nombre_atleta, "Ana María")
+        
+        self.dao.delete(self.atleta.id)
+        self.assertFalse(self.dao.find_by_id(self.atleta.id).estado)
+        self.dao.restore(self.atleta.id)
+        self.assertTrue(self.dao.find_by_id(self.atleta.id).estado)
+        
+        self.dao.update_by_filters({'id': self.atleta.id}, {'apellido_atleta': 'Vega'})
+        self.assertEqual(self.dao.find_by_id(self.atleta.id).apellido_atleta, "Vega")
+        self.dao.delete_by_filters({'id': self.atleta.id})
+        self.assertFalse(self.dao.find_by_id(self.atleta.id).estado)
+        
+        self.atleta.refresh_from_db()
+        self.atleta.nombre_atleta = "Otra"
+        self.atleta.save()
+        self.assertEqual(self.dao.find_by_id(self.atleta.id).nombre_atleta, "Otra")
+        
+        self.dao.hard_delete(self.atleta.id)
+        self.assertIsNone(self.dao.find_by_id(self.atleta.id))
+    
+    def test_perfiles_no_cacheados(self):
+        """Test que las lecturas con perfil de carga no usan la caché"""
+        grupos = GrupoAtletaDAO()
+        grupos.find_by_id(self.grupo.id)
+        with self.assertNumQueries(1):
+            grupo = grupos.with_profile('detail').find_by_id(self.grupo.id)
+        self.assertEqual(grupo.cantidad_atletas, 1)
+    
+    @override_settings(DAO_CACHE_BACKEND='none')
+    def test_cache_desactivada(self):
+        """Test que con DAO_CACHE_BACKEND='none' siempre se consulta la base de datos"""
+        self.dao.find_by_id(self.atleta.id)
+        with self.assertNumQueries(1):
+            self.dao.find_by_id(self.atleta.id)
+    
+    def test_lru_expulsion_y_ttl(self):
+        """Test que la caché LRU respeta el tamaño máximo y el TTL"""
+        cache = LRUCacheBackend(max_size=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        
+        expirada = LRUCacheBackend(max_size=2, ttl=0)
+        expirada.set('a', 1)
+        self.assertIsNone(expirada.get('a'))
+
+
 class AtletaAPITest(APITestCase):
     """Tests de API para Atleta"""
     
@@ -410,6 +664,1314 @@ class PruebaFisicaAPITest(APITestCase):
         url = '/api/v1/pruebas-fisicas/tipos/'
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_estadisticas_atleta_api(self):
+        """Test estadísticas por tipo de prueba en una sola consulta"""
+        for dias, resultado in [(2, 12.0), (1, 15.0), (0, 9.0)]:
+            prueba = PruebaFisica.objects.create(
+                atleta=self.atleta,
+                tipo_prueba=TipoPrueba.FUERZA,
+                resultado=resultado,
+                unidad_medida="repeticiones"
+            )
+            PruebaFisica.objects.filter(pk=prueba.pk).update(
+                fecha_registro=date.today() - timedelta(days=dias)
+            )
+        PruebaFisica.objects.create(
+            atleta=self.atleta,
+            tipo_prueba=TipoPrueba.VELOCIDAD,
+            resultado=11.0,
+            unidad_medida="segundos",
+            estado=False
+        )
+        with self.assertNumQueries(1):
+            estadisticas = PruebaFisicaDAO().get_estadisticas_by_atleta(self.atleta.id)
+        self.assertEqual(list(estadisticas), [TipoPrueba.FUERZA])
+        self.assertEqual(estadisticas[TipoPrueba.FUERZA], {
+            'total_pruebas': 3,
+            'ultimo_resultado': 9.0,
+            'mejor_resultado': 15.0,
+            'promedio': 12.0,
+        })
+        url = f'/api/v1/pruebas-fisicas/atleta/{self.atleta.id}/estadisticas/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class CargaMasivaAPITest(APITestCase):
+    """Tests de la carga masiva de pruebas"""
+    
+    def setUp(self):
+        """Crear atletas identificados por DNI"""
+        self.atletas = [
+            Atleta.objects.create(
+                nombre_atleta=f"Carga{i}", apellido_atleta="Test", dni=f"99000000{i:02d}",
+                fecha_nacimiento=date(2010, 1, 1), sexo="Femenino"
+            )
+            for i in range(3)
+        ]
+    
+    def subir(self, url, contenido, nombre='pruebas.csv'):
+        archivo = SimpleUploadedFile(nombre, contenido.encode('utf-8'), content_type='text/csv')
+        return self.client.post(url, {'archivo': archivo}, format='multipart')
+    
+    def test_csv_pruebas_fisicas(self):
+        """Test carga desde CSV con reporte de las filas inválidas"""
+        contenido = (
+            "atleta_dni;tipo_prueba;resultado;unidad_medida\n"
+            "9900000000;velocidad;4.5;segundos\n"
+            "\n"
+            "9900000001;FUERZA;22;repeticiones\n"
+            "1234567890;FUERZA;20;repeticiones\n"
+            "9900000002;SALTO;30;cm\n"
+        )
+        response = self.subir('/api/v1/pruebas-fisicas/carga-masiva/', contenido)
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        reporte = response.data['data']
+        self.assertEqual((reporte['total'], reporte['creadas']), (4, 2))
+        # Líneas del archivo: el encabezado es la 1 y la línea vacía también cuenta
+        errores = {error['fila']: error['errores'] for error in reporte['errores']}
+        self.assertEqual(set(errores), {5, 6})
+        self.assertIn('atleta_dni', errores[5])
+        self.assertIn('tipo_prueba', errores[6])
+        self.assertTrue(PruebaFisica.objects.filter(
+            atleta=self.atletas[0], tipo_prueba=TipoPrueba.VELOCIDAD, resultado=4.5
+        ).exists())
+    
+    def test_consultas_constantes(self):
+        """Test que los atletas se resuelven sin una consulta por fila"""
+        url = '/api/v1/pruebas-fisicas/carga-masiva/'
+        
+        def consultas(repeticiones):
+            filas = [
+                {'atleta_dni': atleta.dni, 'tipo_prueba': 'AGILIDAD', 'resultado': 12, 'unidad_medida': 's'}
+                for atleta in self.atletas
+            ] * repeticiones
+            with CaptureQueriesContext(connection) as contexto:
+                response = self.client.post(url, filas, format='json')
+            self.assertEqual(response.data['data']['creadas'], len(filas))
+            return len(contexto)
+        
+        self.assertEqual(consultas(1), consultas(20))
+    
+    def test_json_antropometricas(self):
+        """Test carga desde JSON con campos derivados calculados"""
+        response = self.client.post('/api/v1/pruebas-antropometricas/carga-masiva/', {'filas': [
+            {'atleta_id': self.atletas[0].id, 'estatura': 150, 'peso': 45, 'altura_sentado': 78},
+        ]}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        prueba = PruebaAntropometrica.objects.get(atleta=self.atletas[0])
+        self.assertEqual(prueba.indice_masa_corporal, 20.0)
+        self.assertEqual(prueba.indice_cornico, 52.0)
+    
+    def test_carga_invalida(self):
+        """Test rechazo de columnas desconocidas, formatos y cargas sin filas válidas"""
+        url = '/api/v1/pruebas-fisicas/carga-masiva/'
+        response = self.subir(url, "atleta_dni,tipo,resultado\n9900000000,FUERZA,1\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('tipo', response.data['message'])
+        
+        response = self.subir(url, "x", nombre='pruebas.txt')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.post(url, [{'atleta_dni': '0000'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors']['creadas'], 0)
+        # En JSON, 'fila' es el índice desde 0 en el arreglo
+        self.assertEqual(response.data['errors']['errores'][0]['fila'], 0)
+        self.assertFalse(PruebaFisica.objects.exists())
+
+
+class ExportacionAPITest(APITestCase):
+    """Tests de las exportaciones en streaming"""
+    
+    def setUp(self):
+        """Crear atletas con pruebas físicas"""
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-13", rango_edad_minima=11, rango_edad_maxima=13, categoria="Formativa"
+        )
+        self.atletas = [
+            Atleta.objects.create(
+                nombre_atleta=f"Export{i}", apellido_atleta="Test", dni=f"88000000{i:02d}",
+                fecha_nacimiento=date(2012, 5, 1), sexo="Masculino" if i % 2 else "Femenino",
+                grupo=self.grupo
+            )
+            for i in range(4)
+        ]
+        for atleta in self.atletas:
+            for tipo in (TipoPrueba.VELOCIDAD, TipoPrueba.FUERZA):
+                PruebaFisica.objects.create(
+                    atleta=atleta, tipo_prueba=tipo, resultado=10, unidad_medida="u"
+                )
+    
+    def descargar(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+    
+    def test_csv_con_filtros(self):
+        """Test exportación CSV con los filtros del listado"""
+        contenido = self.descargar('/api/v1/pruebas-fisicas/exportar/', {'tipo': TipoPrueba.FUERZA})
+        filas = list(csv.DictReader(StringIO(contenido)))
+        
+        self.assertEqual(len(filas), 4)
+        self.assertEqual({fila['tipo_prueba'] for fila in filas}, {TipoPrueba.FUERZA})
+        self.assertEqual(filas[0]['atleta_dni'], self.atletas[0].dni)
+    
+    def test_ndjson(self):
+        """Test exportación NDJSON de atletas con su grupo"""
+        contenido = self.descargar('/api/v1/atletas/exportar/', {'formato': 'ndjson', 'sexo': 'Femenino'})
+        filas = [json.loads(linea) for linea in contenido.splitlines()]
+        
+        self.assertEqual([fila['dni'] for fila in filas], ['8800000000', '8800000002'])
+        self.assertEqual(filas[0]['grupo_nombre'], 'Sub-13')
+        self.assertEqual(filas[0]['fecha_nacimiento'], '2012-05-01')
+    
+    def test_consultas_constantes(self):
+        """Test que la exportación usa una única consulta sin importar las filas"""
+        for url in ('/api/v1/atletas/exportar/', '/api/v1/inscripciones/exportar/',
+                    '/api/v1/pruebas-fisicas/exportar/', '/api/v1/pruebas-antropometricas/exportar/'):
+            with CaptureQueriesContext(connection) as contexto:
+                self.descargar(url)
+            self.assertEqual(len(contexto), 1, url)
+    
+    def test_formato_invalido(self):
+        """Test rechazo de formatos no soportados"""
+        response = self.client.get('/api/v1/inscripciones/exportar/', {'formato': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LecturasAsincronasAPITest(APITestCase):
+    """Tests de los endpoints de lectura asíncronos de atletas"""
+    
+    def setUp(self):
+        """Crear un grupo con atletas y pruebas"""
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Grupo Async", rango_edad_minima=10, rango_edad_maxima=18, categoria="Juvenil"
+        )
+        self.atletas = []
+        for i in range(3):
+            atleta = Atleta.objects.create(
+                nombre_atleta=f"Async{i}", apellido_atleta="Test", dni=f"77000000{i:02d}",
+                fecha_nacimiento=date(2009, 1, 1), sexo="Femenino", grupo=self.grupo
+            )
+            self.atletas.append(atleta)
+            PruebaFisica.objects.create(
+                atleta=atleta, tipo_prueba=TipoPrueba.VELOCIDAD,
+                resultado=10.0 + i, unidad_medida="segundos"
+            )
+            PruebaAntropometrica.objects.create(
+                atleta=atleta, estatura=165.0, peso=55.0 + i, altura_sentado=85.0, envergadura=166.0
+            )
+    
+    async def test_mismas_respuestas_que_los_endpoints_sincronos(self):
+        """Test que listado, detalle y estadísticas asíncronos responden igual que los síncronos"""
+        atleta_id = self.atletas[0].id
+        pares = [
+            ('/api/v1/async/atletas/?page_size=2&page=2', '/api/v1/atletas/?page_size=2&page=2'),
+            ('/api/v1/async/atletas/?cursor=&page_size=2', '/api/v1/atletas/?cursor=&page_size=2'),
+            ('/api/v1/async/atletas/?nombre=Async1', '/api/v1/atletas/?nombre=Async1'),
+            (f'/api/v1/async/atletas/{atleta_id}/', f'/api/v1/atletas/{atleta_id}/'),
+            (f'/api/v1/async/atletas/estadisticas/?grupo_id={self.grupo.id}',
+             f'/api/v1/atletas/estadisticas/?grupo_id={self.grupo.id}'),
+        ]
+        for url_async, url in pares:
+            asincrona = await self.async_client.get(url_async)
+            sincrona = await self.async_client.get(url)
+            self.assertEqual(asincrona.status_code, status.HTTP_200_OK, url_async)
+            self.assertEqual(asincrona.json(), sincrona.json(), url_async)
+    
+    async def test_detalle_condicional_y_errores(self):
+        """Test de ETag/304, 404, parámetros inválidos y métodos no permitidos"""
+        url = f'/api/v1/async/atletas/{self.atletas[0].id}/'
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(url, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        response = await self.async_client.get('/api/v1/async/atletas/999999/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = await self.async_client.get('/api/v1/async/atletas/estadisticas/?ids=1,x')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], 'Los IDs deben ser números enteros')
+        response = await self.async_client.post('/api/v1/async/atletas/')
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+    
+    @override_settings(QUERY_INSTRUMENTATION_ENABLED=True)
+    async def test_instrumentacion_en_vistas_asincronas(self):
+        """Test que el middleware de consultas también mide las vistas asíncronas"""
+        ids = ','.join(str(atleta.id) for atleta in self.atletas)
+        with self.assertLogs('basketball_project.middleware', 'INFO') as logs:
+            response = await self.async_client.get(f'/api/v1/async/atletas/estadisticas/?ids={ids}')
+        self.assertEqual(len(response.json()['data']), 3)
+        self.assertIn('desc="2 queries"', response['Server-Timing'])
+        self.assertIn('"queries": 2', logs.output[0])
+    
+    async def test_dao_asincrono(self):
+        """Test que los métodos asíncronos del DAO equivalen a los síncronos"""
+        dao = AtletaDAO().with_profile('list')
+        pagina = await dao.apaginate(1, 2)
+        self.assertEqual(pagina['total'], 3)
+        self.assertEqual([a.id for a in pagina['data']], [a.id for a in self.atletas[:2]])
+        
+        siguiente = await dao.apaginate_cursor(
+            (await dao.apaginate_cursor('', 2))['next_cursor'], 2, with_count=True
+        )
+        self.assertEqual([a.id for a in siguiente['data']], [self.atletas[2].id])
+        self.assertEqual(siguiente['total'], 3)
+        
+        self.assertEqual((await dao.afind_by_id(self.atletas[1].id)).grupo.nombre, "Grupo Async")
+        self.assertIsNone(await dao.afind_by_id(999999))
+        self.assertEqual(await AtletaDAO().acount(active_only=True), 3)
+        self.assertTrue(await AtletaDAO().aexists(self.atletas[0].id))
+
+
+class PerfilAtletaAPITest(APITestCase):
+    """Tests del endpoint de perfil completo de un atleta"""
+    
+    def setUp(self):
+        """Crear un atleta con grupo, inscripción y pruebas"""
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Grupo Perfil", rango_edad_minima=10, rango_edad_maxima=18, categoria="Juvenil"
+        )
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Perfil", apellido_atleta="Test", dni="7800000001",
+            fecha_nacimiento=date(2009, 1, 1), sexo="Femenino", grupo=self.grupo
+        )
+        Inscripcion.objects.create(
+            atleta=self.atleta, fecha_inscripcion=date.today(), tipo_inscripcion=TipoInscripcion.NUEVO
+        )
+        PruebaFisica.objects.create(
+            atleta=self.atleta, tipo_prueba=TipoPrueba.FUERZA, resultado=40.0, unidad_medida="kg"
+        )
+        PruebaAntropometrica.objects.create(
+            atleta=self.atleta, estatura=165.0, peso=55.0, altura_sentado=85.0, envergadura=166.0
+        )
+        self.url = f'/api/v1/atletas/{self.atleta.id}/perfil/'
+    
+    def test_perfil_igual_a_los_endpoints_individuales(self):
+        """Test que el perfil reúne lo que devuelven las cinco llamadas por separado"""
+        atleta_id = self.atleta.id
+        perfil = self.client.get(self.url).json()['data']
+        partes = {
+            'atleta': f'/api/v1/atletas/{atleta_id}/',
+            'grupo': f'/api/v1/grupos/{self.grupo.id}/',
+            'inscripciones': f'/api/v1/inscripciones/atleta/{atleta_id}/',
+            'ultima_prueba_antropometrica': f'/api/v1/pruebas-antropometricas/atleta/{atleta_id}/ultima/',
+            'estadisticas_fisicas': f'/api/v1/pruebas-fisicas/atleta/{atleta_id}/estadisticas/',
+        }
+        for clave, url in partes.items():
+            self.assertEqual(perfil[clave], self.client.get(url).json()['data'], clave)
+    
+    def test_perfil_con_consultas_fijas(self):
+        """Test que el perfil usa cinco consultas sin importar cuántas pruebas tenga el atleta"""
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
+        for _ in range(3):
+            PruebaFisica.objects.create(
+                atleta=self.atleta, tipo_prueba=TipoPrueba.VELOCIDAD, resultado=12.0, unidad_medida="segundos"
+            )
+            Inscripcion.objects.create(
+                atleta=self.atleta, fecha_inscripcion=date.today(), tipo_inscripcion=TipoInscripcion.RENOVACION
+            )
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()['data']['inscripciones']), 4)
+    
+    def test_perfil_sin_grupo_ni_pruebas_y_no_encontrado(self):
+        """Test de un atleta sin grupo ni pruebas y de un atleta inexistente"""
+        atleta = Atleta.objects.create(
+            nombre_atleta="Solo", apellido_atleta="Test", dni="7800000002",
+            fecha_nacimiento=date(2010, 1, 1), sexo="Masculino"
+        )
+        data = self.client.get(f'/api/v1/atletas/{atleta.id}/perfil/').json()['data']
+        self.assertIsNone(data['grupo'])
+        self.assertIsNone(data['ultima_prueba_antropometrica'])
+        self.assertEqual(data['inscripciones'], [])
+        
+        response = self.client.get('/api/v1/atletas/999999/perfil/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ConsultasConcurrentesTest(TransactionTestCase):
+    """Tests de la ejecución de consultas independientes en el pool de hilos"""
+    
+    def setUp(self):
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Grupo Hilos", rango_edad_minima=10, rango_edad_maxima=18, categoria="Juvenil"
+        )
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Hilos", apellido_atleta="Test", dni="7800000003",
+            fecha_nacimiento=date(2009, 1, 1), sexo="Femenino", grupo=self.grupo
+        )
+    
+    def tearDown(self):
+        concurrency.shutdown()
+    
+    def test_consultas_en_hilos_del_pool(self):
+        """Test que cada consulta corre en un hilo del pool y hereda el contexto"""
+        def consulta():
+            return threading.current_thread().name, routing.is_pinned(), AtletaDAO().count()
+        
+        with routing.primary_reads():
+            resultados = concurrency.run_concurrently(consulta, consulta)
+        for hilo, fijado, total in resultados:
+            self.assertTrue(hilo.startswith('basketball-query'))
+            self.assertTrue(fijado)
+            self.assertEqual(total, 1)
+        
+        perfil = AtletaController().obtener_perfil(self.atleta.id)
+        self.assertEqual(perfil['atleta'].id, self.atleta.id)
+        self.assertEqual(perfil['grupo'].cantidad_atletas, 1)
+    
+    def test_en_serie_dentro_de_transacciones(self):
+        """Test que dentro de una transacción las consultas usan la conexión actual"""
+        with transaction.atomic():
+            atleta = Atleta.objects.create(
+                nombre_atleta="Nuevo", apellido_atleta="Test", dni="7800000004",
+                fecha_nacimiento=date(2010, 1, 1), sexo="Masculino"
+            )
+            hilo, perfil = concurrency.run_concurrently(
+                lambda: threading.current_thread().name,
+                lambda: AtletaController().obtener_perfil(atleta.id),
+            )
+        self.assertEqual(hilo, threading.current_thread().name)
+        self.assertEqual(perfil['atleta'].dni, "7800000004")
+        
+        with override_settings(PARALLEL_QUERY_WORKERS=1):
+            hilos = concurrency.run_concurrently(
+                lambda: threading.current_thread().name, lambda: threading.current_thread().name
+            )
+        self.assertEqual(set(hilos), {threading.current_thread().name})
+
+
+class RankingPruebaTest(APITestCase):
+    """Tests de la tabla de rankings y del endpoint de ranking de pruebas físicas"""
+    
+    def setUp(self):
+        """Crear dos grupos con atletas de ambos sexos"""
+        self.juvenil = GrupoAtleta.objects.create(
+            nombre="Juvenil", rango_edad_minima=13, rango_edad_maxima=18, categoria="Juvenil"
+        )
+        self.infantil = GrupoAtleta.objects.create(
+            nombre="Infantil", rango_edad_minima=8, rango_edad_maxima=12, categoria="Infantil"
+        )
+        self.atletas = [
+            Atleta.objects.create(
+                nombre_atleta=f"Ranking{i}", apellido_atleta="Test", dni=f"79000000{i:02d}",
+                fecha_nacimiento=date(2009, 1, 1), sexo=sexo, grupo=grupo
+            )
+            for i, (sexo, grupo) in enumerate([
+                ("Femenino", self.juvenil), ("Masculino", self.juvenil),
+                ("Femenino", self.juvenil), ("Femenino", self.infantil),
+            ])
+        ]
+        self.dao = PruebaFisicaDAO()
+    
+    def prueba(self, atleta, tipo, resultado):
+        return self.dao.create(atleta=atleta, tipo_prueba=tipo, resultado=resultado, unidad_medida="u")
+    
+    def ranking(self, **params):
+        response = self.client.get('/api/v1/pruebas-fisicas/ranking/', params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(fila['posicion'], fila['atleta'], fila['mejor_resultado']) for fila in response.json()['data']]
+    
+    def tabla(self):
+        return sorted(
+            RankingPrueba.objects.values_list(
+                'atleta_id', 'tipo_prueba', 'grupo_id', 'sexo', 'prueba_id', 'mejor_resultado', 'total_pruebas'
+            )
+        )
+    
+    def test_direccion_por_tipo_y_empates(self):
+        """Test que en VELOCIDAD gana el menor resultado, en FUERZA el mayor, y los empates comparten posición"""
+        a0, a1, a2, a3 = self.atletas
+        for atleta, tiempos in [(a0, [5.0, 4.2]), (a1, [4.5]), (a2, [4.2, 6.0]), (a3, [3.9])]:
+            for tiempo in tiempos:
+                self.prueba(atleta, TipoPrueba.VELOCIDAD, tiempo)
+        for atleta, repeticiones in [(a0, 20), (a1, 35), (a2, 28)]:
+            self.prueba(atleta, TipoPrueba.FUERZA, repeticiones)
+        
+        self.assertEqual(self.ranking(tipo_prueba='VELOCIDAD'), [
+            (1, a3.id, 3.9), (2, a0.id, 4.2), (2, a2.id, 4.2), (4, a1.id, 4.5),
+        ])
+        self.assertEqual(self.ranking(tipo_prueba='fuerza'), [(1, a1.id, 35), (2, a2.id, 28), (3, a0.id, 20)])
+        self.assertEqual(
+            self.ranking(tipo_prueba='VELOCIDAD', grupo_id=self.juvenil.id, sexo='Femenino'),
+            [(1, a0.id, 4.2), (1, a2.id, 4.2)]
+        )
+        self.assertEqual(self.ranking(tipo_prueba='VELOCIDAD', page=2, page_size=3), [(4, a1.id, 4.5)])
+        
+        # Las estadísticas del atleta usan el mismo criterio que el ranking
+        response = self.client.get(f'/api/v1/pruebas-fisicas/atleta/{a2.id}/estadisticas/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        estadisticas = response.json()['data']
+        self.assertEqual(estadisticas['VELOCIDAD']['mejor_resultado'], 4.2)
+        self.assertEqual(estadisticas['FUERZA']['mejor_resultado'], 28)
+        
+        # Los atletas inactivos no aparecen
+        AtletaDAO().delete(a3.id)
+        self.assertEqual(self.ranking(tipo_prueba='VELOCIDAD')[0], (1, a0.id, 4.2))
+    
+    def test_actualizacion_incremental(self):
+        """Test que altas, cambios y bajas de pruebas y atletas mantienen la tabla igual a una reconstrucción"""
+        a0, a1 = self.atletas[:2]
+        lenta = self.prueba(a0, TipoPrueba.VELOCIDAD, 5.0)
+        rapida = self.prueba(a0, TipoPrueba.VELOCIDAD, 4.0)
+        otra = self.prueba(a1, TipoPrueba.VELOCIDAD, 4.5)
+        fila = RankingPrueba.objects.get(atleta=a0, tipo_prueba=TipoPrueba.VELOCIDAD)
+        self.assertEqual((fila.prueba_id, fila.mejor_resultado, fila.total_pruebas), (rapida.id, 4.0, 2))
+        
+        self.dao.update(rapida.id, resultado=6.0)
+        fila = RankingPrueba.objects.get(atleta=a0, tipo_prueba=TipoPrueba.VELOCIDAD)
+        self.assertEqual((fila.prueba_id, fila.mejor_resultado), (lenta.id, 5.0))
+        
+        self.dao.update(otra.id, tipo_prueba=TipoPrueba.AGILIDAD, atleta=a0)
+        self.assertFalse(RankingPrueba.objects.filter(atleta=a1).exists())
+        self.assertEqual(RankingPrueba.objects.get(atleta=a0, tipo_prueba=TipoPrueba.AGILIDAD).prueba_id, otra.id)
+        
+        self.dao.delete(lenta.id)
+        self.assertEqual(RankingPrueba.objects.get(atleta=a0, tipo_prueba=TipoPrueba.VELOCIDAD).prueba_id, rapida.id)
+        self.dao.hard_delete(rapida.id)
+        self.assertFalse(RankingPrueba.objects.filter(atleta=a0, tipo_prueba=TipoPrueba.VELOCIDAD).exists())
+        
+        AtletaDAO().update(a0.id, grupo=self.infantil, sexo="Masculino")
+        self.assertEqual(
+            list(RankingPrueba.objects.filter(atleta=a0).values_list('grupo_id', 'sexo')),
+            [(self.infantil.id, "Masculino")]
+        )
+        
+        incremental = self.tabla()
+        RankingPruebaDAO().rebuild()
+        self.assertEqual(self.tabla(), incremental)
+    
+    def test_escrituras_masivas_y_seed(self):
+        """Test que las cargas masivas y seed_data --scale dejan la tabla igual a una reconstrucción"""
+        a0, a1 = self.atletas[:2]
+        self.dao.bulk_create([
+            {'atleta': a0, 'tipo_prueba': TipoPrueba.FUERZA, 'resultado': 30, 'unidad_medida': 'u'},
+            {'atleta': a1, 'tipo_prueba': TipoPrueba.FUERZA, 'resultado': 25, 'unidad_medida': 'u'},
+        ])
+        self.assertEqual(self.ranking(tipo_prueba='FUERZA'), [(1, a0.id, 30), (2, a1.id, 25)])
+        
+        call_command('seed_data', scale=30, semilla=9, lote=20, stdout=StringIO())
+        PruebaFisica.objects.filter(id__in=list(PruebaFisica.objects.values_list('id', flat=True)[:40])).delete()
+        AtletaDAO().update_by_filters({'dni__startswith': 'S009'}, {'sexo': 'Femenino'})
+        
+        incremental = self.tabla()
+        self.assertTrue(incremental)
+        RankingPruebaDAO().rebuild()
+        self.assertEqual(self.tabla(), incremental)
+    
+    def test_primera_prueba_concurrente(self):
+        """Test que si otra petición crea antes la fila del atleta y tipo, la prueba se suma sin error"""
+        a0 = self.atletas[0]
+        self.prueba(a0, TipoPrueba.FUERZA, 20)
+        first = QuerySet.first
+        
+        # La fila ya existe pero add_prueba no la ve, como si otra transacción la hubiera creado
+        def sin_fila_ranking(queryset):
+            return None if queryset.model is RankingPrueba else first(queryset)
+        
+        with mock.patch.object(QuerySet, 'first', sin_fila_ranking):
+            response = self.client.post('/api/v1/pruebas-fisicas/', {
+                'atleta_id': a0.id, 'tipo_prueba': TipoPrueba.FUERZA, 'resultado': 30, 'unidad_medida': 'u',
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        fila = RankingPrueba.objects.get(atleta=a0, tipo_prueba=TipoPrueba.FUERZA)
+        self.assertEqual((fila.mejor_resultado, fila.total_pruebas), (30, 2))
+    
+    def test_escrituras_masivas_solo_atletas_afectados(self):
+        """Test que una escritura masiva recalcula solo las filas de los atletas que toca"""
+        a0, a1, a2 = self.atletas[:3]
+        self.prueba(a2, TipoPrueba.FUERZA, 40)
+        ajena = RankingPrueba.objects.get(atleta=a2).pk
+    
+        self.dao.bulk_create([
+            {'atleta': a0, 'tipo_prueba': TipoPrueba.FUERZA, 'resultado': 30, 'unidad_medida': 'u'},
+        ])
+        # Reasignar las pruebas de un atleta a otro recalcula ambos
+        self.dao.update_by_filters({'atleta': a0}, {'atleta': a1})
+        self.assertEqual(self.ranking(tipo_prueba='FUERZA'), [(1, a2.id, 40), (2, a1.id, 30)])
+        self.assertEqual(RankingPrueba.objects.get(atleta=a2).pk, ajena)
+    
+        self.dao.delete_by_filters({'atleta': a1})
+        self.assertEqual(self.ranking(tipo_prueba='FUERZA'), [(1, a2.id, 40)])
+        self.assertEqual(RankingPrueba.objects.get(atleta=a2).pk, ajena)
+    
+    def test_consultas_y_errores(self):
+        """Test que el ranking se responde desde la tabla con consultas fijas y valida los parámetros"""
+        for i, atleta in enumerate(self.atletas):
+            for resultado in (10 + i, 12 + i, 14 + i):
+                self.prueba(atleta, TipoPrueba.FLEXIBILIDAD, resultado)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.ranking(tipo_prueba='FLEXIBILIDAD')), 4)
+        
+        for params in ({}, {'tipo_prueba': 'NATACION'}, {'tipo_prueba': 'FUERZA', 'grupo_id': 'x'}):
+            response = self.client.get('/api/v1/pruebas-fisicas/ranking/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+
+class BusquedaAtletaAPITest(APITestCase):
+    """Tests de la búsqueda de atletas por texto"""
+    
+    def setUp(self):
+        """Crear atletas con nombres parecidos"""
+        self.client = APIClient()
+        datos = [
+            ("Juan", "Pérez", "1100000001"),
+            ("Juana", "Ortiz", "1100000002"),
+            ("Pedro", "Juanes", "1100000003"),
+            ("Luis", "Mora", "2200000004"),
+        ]
+        self.atletas = {}
+        for nombre, apellido, dni in datos:
+            self.atletas[nombre] = Atleta.objects.create(
+                nombre_atleta=nombre,
+                apellido_atleta=apellido,
+                dni=dni,
+                fecha_nacimiento=date(2009, 1, 1),
+                sexo="Masculino"
+            )
+        Atleta.objects.filter(pk=self.atletas["Juana"].pk).update(estado=False)
+    
+    def test_busqueda_ordenada_por_relevancia(self):
+        """Test que los prefijos aparecen antes y los inactivos se excluyen"""
+        response = self.client.get('/api/v1/atletas/buscar/', {'q': 'juan'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        nombres = [item['nombre_atleta'] for item in response.data['data']]
+        self.assertEqual(nombres, ["Juan", "Pedro"])
+    
+    def test_busqueda_varias_palabras_y_dni(self):
+        """Test que cada palabra debe coincidir y que se busca también por DNI"""
+        response = self.client.get('/api/v1/atletas/buscar/', {'q': 'juan pérez'})
+        self.assertEqual([item['id'] for item in response.data['data']], [self.atletas["Juan"].id])
+        response = self.client.get('/api/v1/atletas/buscar/', {'q': '2200'})
+        self.assertEqual([item['id'] for item in response.data['data']], [self.atletas["Luis"].id])
+    
+    def test_busqueda_limite_y_texto_vacio(self):
+        """Test del límite de resultados y del texto obligatorio"""
+        response = self.client.get('/api/v1/atletas/buscar/', {'q': '00000', 'limit': 2})
+        self.assertEqual(len(response.data['data']), 2)
+        response = self.client.get('/api/v1/atletas/buscar/', {'q': '  '})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EstadisticasLoteAPITest(APITestCase):
+    """Tests del endpoint de estadísticas de varios atletas"""
+    
+    def setUp(self):
+        """Crear un grupo con atletas y sus pruebas"""
+        self.client = APIClient()
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Grupo Lote",
+            rango_edad_minima=10,
+            rango_edad_maxima=18,
+            categoria="Juvenil"
+        )
+        self.atletas = []
+        for i in range(4):
+            atleta = Atleta.objects.create(
+                nombre_atleta=f"Lote{i}",
+                apellido_atleta="Test",
+                dni=f"76000000{i:02d}",
+                fecha_nacimiento=date(2009, 1, 1),
+                sexo="Masculino",
+                grupo=self.grupo
+            )
+            self.atletas.append(atleta)
+            for resultado in (10.0, 20.0):
+                PruebaFisica.objects.create(
+                    atleta=atleta,
+                    tipo_prueba=TipoPrueba.FUERZA,
+                    resultado=resultado + i,
+                    unidad_medida="repeticiones"
+                )
+            for peso in (60.0, 62.0):
+                PruebaAntropometrica.objects.create(
+                    atleta=atleta,
+                    estatura=170.0,
+                    peso=peso,
+                    altura_sentado=88.0,
+                    envergadura=172.0
+                )
+    
+    def test_estadisticas_por_grupo(self):
+        """Test que el grupo devuelve las estadísticas de todos sus atletas"""
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/v1/atletas/estadisticas/', {'grupo_id': self.grupo.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), 4)
+        atleta = self.atletas[2]
+        estadisticas = response.data['data'][atleta.id]
+        self.assertEqual(estadisticas['estadisticas_fisicas'][TipoPrueba.FUERZA]['mejor_resultado'], 22.0)
+        self.assertEqual(estadisticas['ultima_prueba_antropometrica']['peso'], 62.0)
+        self.assertEqual(
+            estadisticas['estadisticas_fisicas'],
+            PruebaFisicaDAO().get_estadisticas_by_atleta(atleta.id)
+        )
+    
+    def test_estadisticas_por_ids(self):
+        """Test que se pueden pedir atletas concretos, incluso sin pruebas"""
+        sin_pruebas = Atleta.objects.create(
+            nombre_atleta="Sin",
+            apellido_atleta="Pruebas",
+            dni="7600000099",
+            fecha_nacimiento=date(2009, 1, 1),
+            sexo="Femenino"
+        )
+        ids = f"{self.atletas[0].id},{sin_pruebas.id}"
+        response = self.client.get('/api/v1/atletas/estadisticas/', {'ids': ids})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'][sin_pruebas.id], {
+            'estadisticas_fisicas': {},
+            'ultima_prueba_antropometrica': None,
+        })
+    
+    def test_estadisticas_parametros_invalidos(self):
+        """Test que se exige una lista de IDs válida o un grupo"""
+        response = self.client.get('/api/v1/atletas/estadisticas/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get('/api/v1/atletas/estadisticas/', {'ids': '1,abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PaginacionAPITest(APITestCase):
+    """Tests de paginación en los endpoints de listado"""
+    
+    def setUp(self):
+        """Crear atletas y pruebas suficientes para varias páginas"""
+        self.client = APIClient()
+        self.atletas = [
+            Atleta.objects.create(
+                nombre_atleta=f"Atleta{i}",
+                apellido_atleta="Paginado",
+                dni=f"77000000{i:02d}",
+                fecha_nacimiento=date(2010, 1, 1),
+                sexo="Masculino"
+            )
+            for i in range(25)
+        ]
+        for atleta in self.atletas[:5]:
+            PruebaFisica.objects.create(
+                atleta=atleta,
+                tipo_prueba=TipoPrueba.VELOCIDAD,
+                resultado=10.0,
+                unidad_medida="segundos"
+            )
+    
+    def test_listado_paginado_por_defecto(self):
+        """Test que el listado usa PAGE_SIZE por defecto"""
+        response = self.client.get('/api/v1/atletas/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), 10)
+        self.assertEqual(response.data['pagination']['total_items'], 25)
+        self.assertEqual(response.data['pagination']['total_pages'], 3)
+        self.assertTrue(response.data['pagination']['has_next'])
+    
+    def test_page_y_page_size(self):
+        """Test selección de página y tamaño de página"""
+        response = self.client.get('/api/v1/atletas/', {'page': 3, 'page_size': 10})
+        self.assertEqual(len(response.data['data']), 5)
+        self.assertFalse(response.data['pagination']['has_next'])
+        self.assertTrue(response.data['pagination']['has_previous'])
+    
+    def test_paginas_sin_solapamiento(self):
+        """Test que las páginas no repiten registros"""
+        ids = []
+        for page in (1, 2, 3):
+            response = self.client.get('/api/v1/atletas/', {'page': page, 'page_size': 10})
+            ids.extend(item['id'] for item in response.data['data'])
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), 25)
+    
+    @override_settings(API_MAX_PAGE_SIZE=20)
+    def test_tope_page_size(self):
+        """Test que page_size no supera API_MAX_PAGE_SIZE"""
+        response = self.client.get('/api/v1/atletas/', {'page_size': 1000})
+        self.assertEqual(len(response.data['data']), 20)
+        self.assertEqual(response.data['pagination']['page_size'], 20)
+    
+    def test_parametros_invalidos(self):
+        """Test que parámetros inválidos usan valores por defecto"""
+        response = self.client.get('/api/v1/atletas/', {'page': 'abc', 'page_size': '-5'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['pagination']['current_page'], 1)
+        self.assertEqual(response.data['pagination']['page_size'], 10)
+    
+    def test_paginacion_con_filtros(self):
+        """Test paginación combinada con filtros de búsqueda"""
+        response = self.client.get(
+            '/api/v1/pruebas-fisicas/', {'tipo': 'VELOCIDAD', 'page_size': 2}
+        )
+        self.assertEqual(response.data['pagination']['total_items'], 5)
+        self.assertEqual(len(response.data['data']), 2)
+
+
+class PaginacionCursorTest(APITestCase):
+    """Tests de paginación por cursor (keyset)"""
+    
+    def setUp(self):
+        """Crear pruebas físicas con fechas repetidas para probar el desempate"""
+        self.client = APIClient()
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Cursor",
+            apellido_atleta="Test",
+            dni="7800000000",
+            fecha_nacimiento=date(2009, 1, 1),
+            sexo="Femenino"
+        )
+        for i in range(23):
+            prueba = PruebaFisica.objects.create(
+                atleta=self.atleta,
+                tipo_prueba=TipoPrueba.FUERZA,
+                resultado=float(i),
+                unidad_medida="repeticiones"
+            )
+            PruebaFisica.objects.filter(pk=prueba.pk).update(
+                fecha_registro=date.today() - timedelta(days=i % 4)
+            )
+    
+    def test_recorrido_completo_por_cursor(self):
+        """Test que el cursor recorre todas las filas sin repetir ni omitir"""
+        ids = []
+        cursor = ''
+        while cursor is not None:
+            response = self.client.get(
+                '/api/v1/pruebas-fisicas/', {'cursor': cursor, 'page_size': 5}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('total_items', response.data['pagination'])
+            ids.extend(item['id'] for item in response.data['data'])
+            cursor = response.data['pagination']['next_cursor']
+        self.assertEqual(len(ids), 23)
+        self.assertEqual(len(set(ids)), 23)
+    
+    def test_orden_igual_a_paginacion_por_offset(self):
+        """Test que el cursor respeta el mismo orden que la paginación por página"""
+        offset = self.client.get('/api/v1/pruebas-fisicas/', {'page_size': 23})
+        cursor = self.client.get('/api/v1/pruebas-fisicas/', {'cursor': '', 'page_size': 23})
+        self.assertEqual(
+            [item['id'] for item in offset.data['data']],
+            [item['id'] for item in cursor.data['data']]
+        )
+    
+    def test_cursor_invalido(self):
+        """Test que un cursor manipulado devuelve error 400"""
+        response = self.client.get('/api/v1/pruebas-fisicas/', {'cursor': 'no-es-un-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_cursor_de_otro_listado(self):
+        """Test que un cursor de otro ordenamiento es rechazado"""
+        response = self.client.get('/api/v1/pruebas-fisicas/', {'cursor': '', 'page_size': 5})
+        cursor = response.data['pagination']['next_cursor']
+        response = self.client.get('/api/v1/atletas/', {'cursor': cursor})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_dao_con_conteo(self):
+        """Test que with_count incluye el total solo cuando se solicita"""
+        resultado = PruebaFisicaDAO().paginate_cursor(page_size=10, with_count=True)
+        self.assertEqual(resultado['total'], 23)
+        self.assertTrue(resultado['has_next'])
+
+
+class QueryBudgetMixin:
+    """
+    Utilidades para comprobar que un endpoint ejecuta un número fijo de consultas.
+    
+    La clase de test define poblar(cantidad), que agrega filas relacionadas con
+    los objetos creados en setUp. assertConsultasConstantes puebla la base con
+    cada tamaño de TAMANOS y falla mostrando el SQL si el conteo cambia.
+    """
+    
+    TAMANOS = (1, 4, 12)
+    
+    def capturar_consultas(self, url, params=None):
+        """SQL ejecutado al hacer GET sobre una URL (la respuesta debe ser 200)"""
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(url, params or {})
+        self.assertEqual(
+            response.status_code, status.HTTP_200_OK,
+            f"GET {url} respondió {response.status_code}"
+        )
+        return [consulta['sql'] for consulta in contexto.captured_queries]
+    
+    def assertConsultasConstantes(self, urls, params=None):
+        """Verificar que cada URL ejecuta las mismas consultas con todos los tamaños"""
+        referencia = {}
+        poblados = 0
+        for tamano in self.TAMANOS:
+            self.poblar(tamano - poblados)
+            poblados = tamano
+            for url in urls:
+                consultas = self.capturar_consultas(url, params)
+                if url not in referencia:
+                    referencia[url] = (tamano, consultas)
+                    continue
+                tamano_base, consultas_base = referencia[url]
+                if len(consultas) != len(consultas_base):
+                    detalle = '\n'.join(
+                        f'  {i}. {sql[:300]}' for i, sql in enumerate(consultas, start=1)
+                    )
+                    self.fail(
+                        f"GET {url}: {len(consultas_base)} consultas con N={tamano_base} "
+                        f"y {len(consultas)} con N={tamano}. SQL ejecutado:\n{detalle}"
+                    )
+
+
+class PresupuestoConsultasTest(QueryBudgetMixin, APITestCase):
+    """Tests de que los endpoints de lectura de cada ViewSet no crecen en consultas con N"""
+    
+    def setUp(self):
+        """Crear los objetos principales a los que poblar() agrega filas relacionadas"""
+        self.client = APIClient()
+        self.creados = 0
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Grupo Presupuesto",
+            rango_edad_minima=10,
+            rango_edad_maxima=18,
+            categoria="Juvenil"
+        )
+        self.atleta = self._crear_atleta("Principal", "7400000000")
+        self.inscripcion = Inscripcion.objects.create(
+            atleta=self.atleta,
+            fecha_inscripcion=date.today(),
+            tipo_inscripcion=TipoInscripcion.NUEVO
+        )
+        self.prueba_antropometrica = self._crear_prueba_antropometrica(self.atleta)
+        self.prueba_fisica = self._crear_prueba_fisica(self.atleta)
+        self.entrenador = Entrenador.objects.create(
+            usuario=self._crear_usuario("entrenador", "Entrenador"),
+            especialidad="Formativo",
+            club_asignado="Club Presupuesto"
+        )
+        self.entrenador.grupos.add(self.grupo)
+        self.estudiante = EstudianteVinculacion.objects.create(
+            usuario=self._crear_usuario("estudiante", "Estudiante"),
+            carrera="Pedagogía",
+            semestre="5"
+        )
+    
+    def _crear_usuario(self, prefijo, rol):
+        i = self.creados
+        self.creados += 1
+        return Usuario.objects.create(
+            nombre=f"{prefijo}{i}",
+            apellido="Presupuesto",
+            email=f"{prefijo}{i}@presupuesto.com",
+            clave="secreto",
+            dni=f"73{i:08d}",
+            rol=rol
+        )
+    
+    def _crear_atleta(self, nombre, dni, grupo=None):
+        return Atleta.objects.create(
+            nombre_atleta=nombre,
+            apellido_atleta="Presupuesto",
+            dni=dni,
+            fecha_nacimiento=date(2009, 1, 1),
+            sexo="Masculino",
+            grupo=grupo or self.grupo
+        )
+    
+    def _crear_prueba_antropometrica(self, atleta):
+        return PruebaAntropometrica.objects.create(
+            atleta=atleta,
+            estatura=170.0,
+            peso=65.0,
+            altura_sentado=88.0,
+            envergadura=172.0
+        )
+    
+    def _crear_prueba_fisica(self, atleta):
+        return PruebaFisica.objects.create(
+            atleta=atleta,
+            tipo_prueba=TipoPrueba.FUERZA,
+            resultado=10.0,
+            unidad_medida="repeticiones"
+        )
+    
+    def poblar(self, cantidad):
+        """Agregar atletas, pruebas, inscripciones, grupos, entrenadores y estudiantes"""
+        for _ in range(cantidad):
+            i = self.creados
+            grupo = GrupoAtleta.objects.create(
+                nombre=f"Grupo{i}",
+                rango_edad_minima=10,
+                rango_edad_maxima=18,
+                categoria="Juvenil"
+            )
+            atleta = self._crear_atleta(f"Atleta{i}", f"74{i + 1:08d}")
+            self._crear_atleta(f"Otro{i}", f"72{i:08d}", grupo=grupo)
+            for destino in (atleta, self.atleta):
+                Inscripcion.objects.create(
+                    atleta=destino,
+                    fecha_inscripcion=date.today(),
+                    tipo_inscripcion=TipoInscripcion.RENOVACION
+                )
+                self._crear_prueba_antropometrica(destino)
+                self._crear_prueba_fisica(destino)
+            entrenador = Entrenador.objects.create(
+                usuario=self._crear_usuario("entrenador", "Entrenador"),
+                especialidad="Formativo",
+                club_asignado="Club Presupuesto"
+            )
+            entrenador.grupos.add(self.grupo, grupo)
+            self.entrenador.grupos.add(grupo)
+            EstudianteVinculacion.objects.create(
+                usuario=self._crear_usuario("estudiante", "Estudiante"),
+                carrera="Pedagogía",
+                semestre="5"
+            )
+    
+    def test_atletas(self):
+        """Test de presupuesto de consultas en los endpoints de atletas"""
+        self.assertConsultasConstantes([
+            '/api/v1/atletas/?page_size=100',
+            f'/api/v1/atletas/{self.atleta.id}/',
+            f'/api/v1/atletas/dni/{self.atleta.dni}/',
+            '/api/v1/atletas/buscar/?q=Presupuesto&limit=100',
+            f'/api/v1/atletas/estadisticas/?grupo_id={self.grupo.id}',
+        ])
+    
+    def test_grupos(self):
+        """Test de presupuesto de consultas en los endpoints de grupos"""
+        self.assertConsultasConstantes([
+            '/api/v1/grupos/?page_size=100',
+            f'/api/v1/grupos/{self.grupo.id}/',
+            f'/api/v1/grupos/{self.grupo.id}/atletas/',
+        ])
+    
+    def test_inscripciones(self):
+        """Test de presupuesto de consultas en los endpoints de inscripciones"""
+        self.assertConsultasConstantes([
+            '/api/v1/inscripciones/?page_size=100',
+            f'/api/v1/inscripciones/{self.inscripcion.id}/',
+            f'/api/v1/inscripciones/atleta/{self.atleta.id}/',
+        ])
+    
+    def test_pruebas_antropometricas(self):
+        """Test de presupuesto de consultas en los endpoints de pruebas antropométricas"""
+        self.assertConsultasConstantes([
+            '/api/v1/pruebas-antropometricas/?page_size=100',
+            f'/api/v1/pruebas-antropometricas/{self.prueba_antropometrica.id}/',
+            f'/api/v1/pruebas-antropometricas/atleta/{self.atleta.id}/',
+            f'/api/v1/pruebas-antropometricas/atleta/{self.atleta.id}/ultima/',
+        ])
+    
+    def test_pruebas_fisicas(self):
+        """Test de presupuesto de consultas en los endpoints de pruebas físicas"""
+        self.assertConsultasConstantes([
+            '/api/v1/pruebas-fisicas/?page_size=100',
+            f'/api/v1/pruebas-fisicas/{self.prueba_fisica.id}/',
+            f'/api/v1/pruebas-fisicas/atleta/{self.atleta.id}/',
+            f'/api/v1/pruebas-fisicas/atleta/{self.atleta.id}/tipo/{TipoPrueba.FUERZA}/',
+            f'/api/v1/pruebas-fisicas/atleta/{self.atleta.id}/estadisticas/',
+        ])
+    
+    def test_entrenadores(self):
+        """Test de presupuesto de consultas en los endpoints de entrenadores"""
+        self.assertConsultasConstantes([
+            '/api/v1/entrenadores/?page_size=100',
+            f'/api/v1/entrenadores/{self.entrenador.id}/',
+            f'/api/v1/entrenadores/{self.entrenador.id}/grupos/',
+        ])
+    
+    def test_estudiantes_vinculacion(self):
+        """Test de presupuesto de consultas en los endpoints de estudiantes de vinculación"""
+        self.assertConsultasConstantes([
+            '/api/v1/estudiantes-vinculacion/?page_size=100',
+            f'/api/v1/estudiantes-vinculacion/{self.estudiante.id}/',
+        ])
+    
+    def test_cantidad_atletas_anotada(self):
+        """Test que el conteo anotado coincide con los atletas activos"""
+        self.poblar(3)
+        # El atleta principal y tres más en el grupo; se desactiva uno
+        Atleta.objects.filter(pk=self.atleta.pk).update(estado=False)
+        response = self.client.get(f'/api/v1/grupos/{self.grupo.id}/')
+        self.assertEqual(response.data['data']['cantidad_atletas'], 3)
+        response = self.client.get('/api/v1/entrenadores/')
+        for entrenador in response.data['data']:
+            cantidades = {g['id']: g['cantidad_atletas'] for g in entrenador['grupos_asignados']}
+            self.assertEqual(cantidades[self.grupo.id], 3)
+    
+    def test_perfil_desconocido(self):
+        """Test que un perfil de carga inexistente es rechazado"""
+        with self.assertRaises(ValueError):
+            PruebaFisicaDAO().with_profile('inexistente')
+
+
+class SeedDataEscalaTest(TestCase):
+    """Tests del modo --scale de seed_data"""
+    
+    def sembrar(self, **opciones):
+        call_command('seed_data', scale=40, semilla=7, lote=15, stdout=StringIO(), **opciones)
+        return list(
+            Atleta.objects.filter(dni__startswith='S007')
+            .order_by('dni').values_list('nombre_atleta', 'edad', 'grupo__nombre')
+        )
+    
+    def test_volumen_y_campos_derivados(self):
+        """Test que se generan los registros con edad, IMC e índice córnico calculados"""
+        self.sembrar()
+        atletas = Atleta.objects.filter(dni__startswith='S007').select_related('grupo')
+        self.assertEqual(atletas.count(), 40)
+        self.assertEqual(Inscripcion.objects.filter(atleta__in=atletas).count(), 40)
+        for atleta in atletas:
+            self.assertEqual(atleta.edad, atleta.calcular_edad())
+            self.assertTrue(atleta.grupo.rango_edad_minima <= atleta.edad <= atleta.grupo.rango_edad_maxima)
+        
+        self.assertGreaterEqual(PruebaFisica.objects.filter(atleta__in=atletas).count(), 40 * 5)
+        prueba = PruebaAntropometrica.objects.filter(atleta__in=atletas).first()
+        imc, cornico = prueba.indice_masa_corporal, prueba.indice_cornico
+        prueba.save()
+        self.assertAlmostEqual(prueba.indice_masa_corporal, imc, places=1)
+        self.assertAlmostEqual(prueba.indice_cornico, cornico, places=1)
+        self.assertTrue(
+            PruebaFisica.objects.filter(fecha_registro__lt=date.today() - timedelta(days=30)).exists()
+        )
+    
+    def test_semilla_determinista(self):
+        """Test que la misma semilla genera los mismos datos"""
+        primera = self.sembrar()
+        self.assertEqual(self.sembrar(clear=True), primera)
+    
+    def test_semilla_repetida(self):
+        """Test que no se duplican los datos de una semilla ya generada"""
+        self.sembrar()
+        with self.assertRaises(CommandError):
+            self.sembrar()
+    
+    def test_opciones_invalidas_no_borran_datos(self):
+        """Test que las opciones se validan antes de eliminar los datos con --clear"""
+        self.sembrar()
+        for opciones in ({'scale': -5}, {'lote': 0}, {'pruebas_por_atleta': -1}):
+            with self.assertRaises(CommandError):
+                call_command('seed_data', clear=True, stdout=StringIO(), **opciones)
+        self.assertEqual(Atleta.objects.filter(dni__startswith='S007').count(), 40)
+
+
+@override_settings(QUERY_INSTRUMENTATION_ENABLED=True)
+class QueryInstrumentationTest(APITestCase):
+    """Tests del middleware de instrumentación de consultas"""
+    
+    def setUp(self):
+        """Crear algunos atletas"""
+        self.client = APIClient()
+        for i in range(3):
+            Atleta.objects.create(
+                nombre_atleta=f"Medido{i}",
+                apellido_atleta="Test",
+                dni=f"75000000{i:02d}",
+                fecha_nacimiento=date(2009, 1, 1),
+                sexo="Masculino"
+            )
+    
+    def test_cabecera_server_timing(self):
+        """Test que la respuesta informa el conteo y tiempo de las consultas"""
+        with self.assertLogs('basketball_project.middleware', level='INFO') as logs:
+            response = self.client.get('/api/v1/atletas/')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", total;dur=[\d.]+$')
+        self.assertNotIn('X-Query-Budget-Exceeded', response)
+        registro = json.loads(logs.records[0].getMessage())
+        self.assertEqual(registro['path'], '/api/v1/atletas/')
+        self.assertGreater(registro['queries'], 0)
+        self.assertLessEqual(len(registro['slowest']), 3)
+    
+    @override_settings(QUERY_BUDGET=1)
+    def test_presupuesto_excedido(self):
+        """Test que las peticiones sobre el presupuesto se marcan y registran como warning"""
+        with self.assertLogs('basketball_project.middleware', level='WARNING') as logs:
+            response = self.client.get('/api/v1/atletas/')
+        self.assertIn('X-Query-Budget-Exceeded', response)
+        self.assertEqual(json.loads(logs.records[0].getMessage())['query_budget'], 1)
+    
+    @override_settings(QUERY_INSTRUMENTATION_ENABLED=False)
+    def test_desactivado(self):
+        """Test que sin la opción activa no se agrega la cabecera"""
+        response = self.client.get('/api/v1/atletas/')
+        self.assertNotIn('Server-Timing', response)
+
+
+class VersionFilasTest(APITestCase):
+    """Tests de ETag por versión de fila en los endpoints de detalle"""
+    
+    def setUp(self):
+        """Crear un grupo, un atleta y una prueba física"""
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-15", rango_edad_minima=13, rango_edad_maxima=15, categoria="Formativa"
+        )
+        self.atleta = Atleta.objects.create(
+            nombre_atleta="Ana", apellido_atleta="Martínez", dni="5566778899",
+            fecha_nacimiento=date(2010, 11, 25), sexo="Femenino", grupo=self.grupo
+        )
+        self.prueba = PruebaFisica.objects.create(
+            atleta=self.atleta, tipo_prueba=TipoPrueba.VELOCIDAD,
+            resultado=7.5, unidad_medida="segundos"
+        )
+    
+    def test_version_incrementa(self):
+        """Test que save() y las actualizaciones masivas del DAO incrementan la versión"""
+        self.assertEqual(self.atleta.version, 1)
+        self.atleta.save()
+        self.atleta.save(update_fields=['nombre_atleta'])
+        self.atleta.refresh_from_db()
+        self.assertEqual(self.atleta.version, 3)
+        
+        AtletaDAO().update_by_filters({'id': self.atleta.id}, {'apellido_atleta': 'Vega'})
+        AtletaDAO().delete_by_filters({'id': self.atleta.id})
+        self.atleta.refresh_from_db()
+        self.assertEqual(self.atleta.version, 5)
+        
+        with self.assertRaises(VersionConflictError):
+            AtletaDAO().update(self.atleta.id, expected_version=4, nombre_atleta="Otra")
+        AtletaDAO().update(self.atleta.id, expected_version=5, nombre_atleta="Otra")
+        self.atleta.refresh_from_db()
+        self.assertEqual((self.atleta.nombre_atleta, self.atleta.version), ("Otra", 6))
+    
+    def test_304_sin_serializar(self):
+        """Test que If-None-Match vigente responde 304 con una sola consulta"""
+        for url in [f'/api/v1/atletas/{self.atleta.id}/', f'/api/v1/pruebas-fisicas/{self.prueba.id}/',
+                    f'/api/v1/grupos/{self.grupo.id}/']:
+            etag = self.client.get(url)['ETag']
+            with self.assertNumQueries(1):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], etag)
+    
+    def test_etag_cambia_con_la_fila_y_sus_relaciones(self):
+        """Test que el ETag cambia al modificar la fila, la relación mostrada o el conteo"""
+        url_atleta = f'/api/v1/atletas/{self.atleta.id}/'
+        url_grupo = f'/api/v1/grupos/{self.grupo.id}/'
+        etag_atleta = self.client.get(url_atleta)['ETag']
+        etag_grupo = self.client.get(url_grupo)['ETag']
+        
+        self.grupo.nombre = "Sub-15 A"
+        self.grupo.save()
+        response = self.client.get(url_atleta, HTTP_IF_NONE_MATCH=etag_atleta)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['grupo_nombre'], "Sub-15 A")
+        
+        etag_grupo = self.client.get(url_grupo)['ETag']
+        Atleta.objects.create(
+            nombre_atleta="Luis", apellido_atleta="Vega", dni="100",
+            fecha_nacimiento=date(2010, 3, 14), sexo="Masculino", grupo=self.grupo
+        )
+        response = self.client.get(url_grupo, HTTP_IF_NONE_MATCH=etag_grupo)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['cantidad_atletas'], 2)
+    
+    def test_if_match(self):
+        """Test de concurrencia optimista con If-Match en la actualización"""
+        url = f'/api/v1/atletas/{self.atleta.id}/'
+        etag = self.client.get(url)['ETag']
+        
+        response = self.client.patch(url, {'nombre_atleta': 'Ana María'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = self.client.patch(url, {'nombre_atleta': 'Otra'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.atleta.refresh_from_db()
+        self.assertEqual(self.atleta.nombre_atleta, 'Ana María')
+        
+        response = self.client.patch(url, {'nombre_atleta': 'Otra'}, format='json', HTTP_IF_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+# Caché en archivos: compartida entre procesos, como Redis en producción
+CACHES_COMPARTIDAS = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'respuestas': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'basketball-tests-respuestas'),
+    },
+}
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=300, CACHES=CACHES_COMPARTIDAS, RESPONSE_CACHE_ALIAS='respuestas')
+class CacheRespuestasAPITest(APITestCase):
+    """Tests de la caché de respuestas con ETag/Cache-Control"""
+    
+    def setUp(self):
+        """Vaciar la caché y crear un grupo"""
+        caches['respuestas'].clear()
+        self.addCleanup(caches['respuestas'].clear)
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-15", rango_edad_minima=13, rango_edad_maxima=15, categoria="Formativa"
+        )
+    
+    def test_etag_y_304(self):
+        """Test que If-None-Match con el ETag vigente responde 304 sin cuerpo"""
+        for url in ['/api/v1/pruebas-fisicas/tipos/', '/api/']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('ETag', response)
+            self.assertIn('Last-Modified', response)
+            
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response.content, b'')
+        
+        response = self.client.get('/api/v1/pruebas-fisicas/tipos/')
+        self.assertIn('max-age=3600', response['Cache-Control'])
+    
+    def test_listado_grupos_cacheado(self):
+        """Test que el listado de grupos se sirve desde la caché hasta que hay escrituras"""
+        url = '/api/v1/grupos/'
+        primera = self.client.get(url, {'page_size': 5})
+        with self.assertNumQueries(0):
+            segunda = self.client.get(url, {'page_size': 5})
+        self.assertEqual(segunda.json(), primera.json())
+        self.assertEqual(segunda['ETag'], primera['ETag'])
+        
+        # Otros parámetros son otra entrada
+        with self.assertNumQueries(2):
+            self.client.get(url, {'page_size': 6})
+    
+    def test_invalidacion_por_escrituras(self):
+        """Test que las escrituras en grupos y atletas invalidan el listado"""
+        url = '/api/v1/grupos/'
+        etag = self.client.get(url)['ETag']
+        
+        Atleta.objects.create(
+            nombre_atleta="Ana", apellido_atleta="Martínez", dni="5566778899",
+            fecha_nacimiento=date(2010, 11, 25), sexo="Femenino", grupo=self.grupo
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'][0]['cantidad_atletas'], 1)
+        
+        GrupoAtletaDAO().update_by_filters({'id': self.grupo.id}, {'categoria': 'Élite'})
+        response = self.client.get(url)
+        self.assertEqual(response.data['data'][0]['categoria'], 'Élite')
+    
+    @override_settings(RESPONSE_CACHE_TIMEOUT=0)
+    def test_sin_almacenamiento(self):
+        """Test que con RESPONSE_CACHE_TIMEOUT=0 se consulta siempre pero se mantiene el ETag"""
+        url = '/api/v1/grupos/'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(2):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    @override_settings(RESPONSE_CACHE_ALIAS='default')
+    def test_cache_local_no_almacena(self):
+        """Test que con una caché local del proceso no se guardan respuestas ni se envía Last-Modified"""
+        url = '/api/v1/grupos/'
+        primera = self.client.get(url)
+        self.assertNotIn('Last-Modified', primera)
+        with self.assertNumQueries(2):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=primera['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([aviso.id for aviso in comprobar_cache()], ['basketball.W001'])
+        with override_settings(RESPONSE_CACHE_TIMEOUT=0):
+            self.assertEqual(comprobar_cache(), [])
 
 
 class HealthCheckAPITest(APITestCase):
@@ -421,6 +1983,165 @@ class HealthCheckAPITest(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'healthy')
+    
+    def test_health_check_estadisticas_conexiones(self):
+        """Test que el health check informa las conexiones y no se cachea"""
+        response = self.client.get('/health/')
+        database = response.data['database']
+        self.assertEqual(database['status'], 'connected')
+        self.assertFalse(database['connections']['default']['pooled'])
+        self.assertIn('created', database['connections']['default'])
+        self.assertIn('no-store', response['Cache-Control'])
+        self.assertNotIn('ETag', response)
+
+
+class ConnectionPoolTest(TestCase):
+    """Tests del pool de conexiones (con conexiones sqlite3 en memoria)"""
+    
+    def crear_pool(self, **kwargs):
+        pool = ConnectionPool(
+            lambda: sqlite3.connect(':memory:', check_same_thread=False),
+            check=lambda conn: conn.execute('SELECT 1').fetchone() == (1,),
+            **kwargs
+        )
+        self.addCleanup(pool.close)
+        return pool
+    
+    def test_reutiliza_conexiones(self):
+        """Test que una conexión devuelta se reutiliza en lugar de abrir otra"""
+        pool = self.crear_pool(max_size=2)
+        conn = pool.getconn()
+        self.assertEqual(pool.stats()['in_use'], 1)
+        pool.putconn(conn)
+        self.assertIs(pool.getconn(), conn)
+        
+        stats = pool.stats()
+        self.assertEqual((stats['created'], stats['checkouts']), (1, 2))
+        self.assertEqual((stats['size'], stats['in_use'], stats['idle']), (1, 1, 0))
+    
+    def test_espera_y_timeout(self):
+        """Test que con el pool lleno se espera una conexión libre o se falla al vencer el timeout"""
+        pool = self.crear_pool(max_size=1, timeout=0.05)
+        conn = pool.getconn()
+        with self.assertRaises(PoolTimeoutError):
+            pool.getconn()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+        
+        pool.timeout = 5
+        threading.Timer(0.05, pool.putconn, args=(conn,)).start()
+        self.assertIs(pool.getconn(), conn)
+        self.assertGreater(pool.stats()['wait_ms_max'], 0)
+    
+    def test_health_check_descarta_conexiones_rotas(self):
+        """Test que una conexión ociosa que no pasa el health check se reemplaza"""
+        pool = self.crear_pool(max_size=1)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.close()
+        
+        with self.assertLogs('basketball.controllers.connection', 'WARNING') as logs:
+            nueva = pool.getconn()
+        self.assertIsNot(nueva, conn)
+        self.assertIn('health check', logs.output[0])
+        stats = pool.stats()
+        self.assertEqual((stats['failed_checks'], stats['created'], stats['size']), (1, 2, 1))
+    
+    def test_cierra_conexiones_ociosas_y_vencidas(self):
+        """Test que se cierran las ociosas por encima de min_size y las que superan max_lifetime"""
+        pool = self.crear_pool(min_size=1, max_size=3, max_idle=0)
+        conexiones = [pool.getconn() for _ in range(3)]
+        for conn in conexiones:
+            pool.putconn(conn)
+        pool.reap()
+        self.assertEqual((pool.stats()['size'], pool.stats()['closed']), (1, 2))
+        
+        pool = self.crear_pool(max_size=1, max_lifetime=0)
+        pool.putconn(pool.getconn())
+        self.assertEqual((pool.stats()['size'], pool.stats()['closed']), (0, 1))
+
+
+@override_settings(DATABASE_ROUTERS=['basketball.dao.routing.ReplicaRouter'])
+class ReplicaRoutingTest(TransactionTestCase):
+    """Tests del enrutamiento de lecturas a réplicas (alias 'replica' sobre la misma base)"""
+    
+    databases = {'default', 'replica'}
+    
+    def setUp(self):
+        """Crear un grupo y olvidar las mediciones de retraso"""
+        routing.monitor.reset()
+        self.addCleanup(routing.monitor.reset)
+        self.grupo = GrupoAtleta.objects.create(
+            nombre="Sub-15", rango_edad_minima=13, rango_edad_maxima=15, categoria="Formativa"
+        )
+    
+    def test_lecturas_a_la_replica(self):
+        """Test que las lecturas del DAO y de la API van a la réplica"""
+        dao = GrupoAtletaDAO()
+        with routing.request_scope(), CaptureQueriesContext(connections['replica']) as replica:
+            self.assertEqual(dao.find_by_id(self.grupo.id)._state.db, 'replica')
+            self.assertEqual(dao.with_profile('list').find_all().count(), 1)
+            self.assertTrue(dao.exists(self.grupo.id))
+        self.assertEqual(len(replica), 3)
+        
+        with CaptureQueriesContext(connections['replica']) as replica:
+            response = self.client.get(f'/api/v1/grupos/{self.grupo.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(replica), 0)
+        
+        # using() fija el alias de las lecturas
+        self.assertEqual(dao.using('default').find_by_id(self.grupo.id)._state.db, 'default')
+    
+    def test_read_your_writes(self):
+        """Test que tras una escritura las lecturas del mismo ámbito van al primario"""
+        dao = GrupoAtletaDAO()
+        with routing.request_scope():
+            self.assertEqual(router.db_for_read(GrupoAtleta), 'replica')
+            with CaptureQueriesContext(connections['replica']) as replica:
+                dao.update(self.grupo.id, categoria='Élite')
+                self.assertEqual(dao.find_by_id(self.grupo.id).categoria, 'Élite')
+            self.assertEqual(len(replica), 0)
+        
+        # Una nueva petición vuelve a leer de la réplica
+        with routing.request_scope():
+            self.assertEqual(router.db_for_read(GrupoAtleta), 'replica')
+            with routing.primary_reads():
+                self.assertEqual(router.db_for_read(GrupoAtleta), 'default')
+    
+    @override_settings(DATABASE_REPLICAS=['replica', 'replica2'], REPLICA_MAX_LAG=5)
+    def test_round_robin_y_retraso(self):
+        """Test que las réplicas se turnan y se saltan las atrasadas o caídas"""
+        lags = {'replica': 0.0, 'replica2': 1.0}
+        
+        def medir(alias):
+            if isinstance(lags[alias], Exception):
+                raise lags[alias]
+            return lags[alias]
+        
+        with mock.patch.object(routing.monitor, 'measure', side_effect=medir), routing.request_scope():
+            self.assertEqual({routing.read_alias() for _ in range(4)}, {'replica', 'replica2'})
+            
+            lags['replica2'] = 30.0
+            routing.monitor.reset()
+            self.assertEqual({routing.read_alias() for _ in range(4)}, {'replica'})
+            
+            lags['replica'] = DatabaseError('sin conexión')
+            routing.monitor.reset()
+            with self.assertLogs('basketball.dao.routing', 'WARNING') as logs:
+                self.assertEqual(routing.read_alias(), 'default')
+            self.assertEqual(len(logs.output), 1)
+            self.assertIn('Réplica replica no disponible: sin conexión', logs.output[0])
+            self.assertEqual(
+                routing.monitor.stats(),
+                {
+                    'replica': {'lag_seconds': None, 'available': False},
+                    'replica2': {'lag_seconds': 30.0, 'available': False},
+                }
+            )
+    
+    def test_no_migra_replicas(self):
+        """Test que el router no migra las réplicas"""
+        self.assertFalse(router.allow_migrate('replica', 'basketball'))
+        self.assertTrue(router.allow_migrate('default', 'basketball'))
 
 
 class APIRootTest(APITestCase):
@@ -8,7 +8,8 @@ from rest_framework.routers import DefaultRouter
 from basketball.views import (
     AtletaViewSet, GrupoAtletaViewSet, InscripcionViewSet,
     PruebaAntropometricaViewSet, PruebaFisicaViewSet,
-    EntrenadorViewSet, EstudianteVinculacionViewSet
+    EntrenadorViewSet, EstudianteVinculacionViewSet,
+    atletas_async, atleta_async, atletas_estadisticas_async
 )
 
 # Crear el router
@@ -24,5 +25,9 @@ router.register(r'entrenadores', EntrenadorViewSet, basename='entrenador')
 router.register(r'estudiantes-vinculacion', EstudianteVinculacionViewSet, basename='estudiante-vinculacion')
 
 urlpatterns = [
+    # Lecturas asíncronas (ASGI)
+    path('async/atletas/', atletas_async, name='atleta-async-list'),
+    path('async/atletas/estadisticas/', atletas_estadisticas_async, name='atleta-async-estadisticas'),
+    path('async/atletas/<int:pk>/', atleta_async, name='atleta-async-detail'),
     path('', include(router.urls)),
 ]
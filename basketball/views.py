@@ -4,22 +4,28 @@ Implementación de vistas basadas en clases usando ViewSets
 Con documentación Swagger mejorada
 """
 
+from django.conf import settings
+from django.http import HttpResponseNotAllowed
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from basketball.models import (
     Usuario, GrupoAtleta, Entrenador, EstudianteVinculacion,
-    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica
+    Atleta, Inscripcion, PruebaAntropometrica, PruebaFisica, TipoPrueba
 )
 from basketball.serializers import (
     UsuarioSerializer, GrupoAtletaSerializer, EntrenadorSerializer,
     EstudianteVinculacionSerializer, AtletaSerializer, AtletaCreateSerializer,
-    InscripcionSerializer, PruebaAntropometricaSerializer, PruebaFisicaSerializer
+    InscripcionSerializer, PruebaAntropometricaSerializer, PruebaFisicaSerializer,
+    RankingPruebaSerializer
 )
 from basketball.services.api_response import APIResponse
+from basketball.services.carga_archivos import leer_archivo
+from basketball.services.exportacion import FORMATOS_EXPORTACION
 from basketball.services.atleta_service import AtletaService
 from basketball.services.grupo_atleta_service import GrupoAtletaService
 from basketball.services.inscripcion_service import InscripcionService
@@ -27,6 +33,134 @@ from basketball.services.prueba_antropometrica_service import PruebaAntropometri
 from basketball.services.prueba_fisica_service import PruebaFisicaService
 from basketball.services.entrenador_service import EntrenadorService
 from basketball.services.estudiante_vinculacion_service import EstudianteVinculacionService
+from basketball_project.renderers import FastJSONParser, FastJSONRenderer
+
+
+# Parámetros de paginación comunes a todos los listados
+PAGINATION_PARAMETERS = [
+    openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                      description="Número de página (default: 1)"),
+    openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                      description="Tamaño de página (default: PAGE_SIZE, máximo: API_MAX_PAGE_SIZE)"),
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      description="Paginación por cursor: vacío para la primera página, "
+                                  "luego el next_cursor de la respuesta (ignora page)"),
+]
+
+
+# Cabeceras condicionales de los endpoints de detalle (ETag derivado de la versión de la fila)
+IF_NONE_MATCH_PARAMETER = openapi.Parameter(
+    'If-None-Match', openapi.IN_HEADER, type=openapi.TYPE_STRING,
+    description="ETag de una respuesta anterior: responde 304 si la fila no cambió"
+)
+IF_MATCH_PARAMETER = openapi.Parameter(
+    'If-Match', openapi.IN_HEADER, type=openapi.TYPE_STRING,
+    description="ETag del detalle: solo actualiza si la fila no cambió (412 en caso contrario)"
+)
+
+
+def _parse_positive_int(value, default: int) -> int:
+    """Convertir un query param a entero positivo, usando default si es inválido"""
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _query_params(request):
+    """Query params de una petición de DRF o de una vista Django (vistas asíncronas)"""
+    return getattr(request, 'query_params', request.GET)
+
+
+def get_pagination_params(request) -> tuple:
+    """
+    Obtener (page, page_size, cursor) de los query params aplicando el tope máximo.
+    cursor es None cuando no se solicita paginación por cursor.
+    """
+    params = _query_params(request)
+    default_page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 10)
+    page = _parse_positive_int(params.get('page'), 1)
+    page_size = _parse_positive_int(params.get('page_size'), default_page_size)
+    cursor = params.get('cursor')
+    return page, min(page_size, settings.API_MAX_PAGE_SIZE), cursor
+
+
+def get_criterios_atleta(request) -> dict:
+    """Criterios de búsqueda de atletas presentes en los query params"""
+    params = _query_params(request)
+    criterios = {
+        campo: params.get(campo)
+        for campo in ('nombre', 'apellido', 'grupo_id', 'sexo', 'edad_min', 'edad_max')
+    }
+    return {k: v for k, v in criterios.items() if v is not None}
+
+
+def get_estadisticas_params(request) -> dict:
+    """
+    Obtener atleta_ids o grupo_id de los query params de las estadísticas por lote.
+    
+    Raises:
+        ValueError: Si faltan los parámetros, no son enteros o hay demasiados IDs
+    """
+    params = _query_params(request)
+    try:
+        if params.get('grupo_id'):
+            return {'grupo_id': int(params['grupo_id'])}
+        atleta_ids = [int(valor) for valor in (params.get('ids') or '').split(',') if valor.strip()]
+    except ValueError:
+        raise ValueError("Los IDs deben ser números enteros")
+    if not atleta_ids:
+        raise ValueError("Debe indicar 'ids' o 'grupo_id'")
+    if len(atleta_ids) > settings.API_MAX_PAGE_SIZE:
+        raise ValueError(f"Se permiten como máximo {settings.API_MAX_PAGE_SIZE} atletas por petición")
+    return {'atleta_ids': atleta_ids}
+
+
+# Cuerpo de las cargas masivas de pruebas (en multipart se envía el archivo en 'archivo')
+CARGA_MASIVA_BODY = openapi.Schema(
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Schema(type=openapi.TYPE_OBJECT),
+    description="Filas con los campos de la prueba. El atleta se indica con atleta_dni (o atleta_id). "
+                "También se acepta multipart/form-data con un CSV o XLSX con encabezado en 'archivo'. "
+                "En el reporte, 'fila' es la línea del archivo (el encabezado es la 1) o el índice "
+                "desde 0 en el arreglo JSON",
+)
+
+
+# Formato de las exportaciones en streaming
+EXPORTACION_PARAMETERS = [
+    openapi.Parameter('formato', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      enum=list(FORMATOS_EXPORTACION),
+                      description="Formato de salida: csv (default) o ndjson (un objeto JSON por línea)"),
+]
+
+
+def get_formato_exportacion(request) -> str:
+    """Obtener el formato de exportación de los query params"""
+    formato = request.query_params.get('formato', 'csv').lower()
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f"Formato no soportado: use {' o '.join(FORMATOS_EXPORTACION)}")
+    return formato
+
+
+def get_filas_carga(request) -> list:
+    """
+    Obtener las filas de una carga masiva: archivo CSV/XLSX en 'archivo',
+    un arreglo JSON o un objeto JSON con la clave 'filas'.
+    """
+    archivo = request.FILES.get('archivo')
+    if archivo:
+        filas = leer_archivo(archivo)
+    elif isinstance(request.data, list):
+        filas = request.data
+    else:
+        filas = request.data.get('filas')
+    if not isinstance(filas, list) or not filas:
+        raise ValueError("Debe enviar un archivo en 'archivo' o un arreglo de filas")
+    if len(filas) > settings.BULK_UPLOAD_MAX_ROWS:
+        raise ValueError(f"Se permiten como máximo {settings.BULK_UPLOAD_MAX_ROWS} filas por carga")
+    return filas
 
 
 class AtletaViewSet(viewsets.ViewSet):
@@ -54,27 +188,17 @@ class AtletaViewSet(viewsets.ViewSet):
                             description="Edad mínima"),
             openapi.Parameter('edad_max', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
                             description="Edad máxima"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: AtletaSerializer(many=True)}
     )
     def list(self, request):
         """Listar atletas con filtros opcionales via query params"""
         # Verificar si hay criterios de búsqueda
-        criterios = {
-            'nombre': request.query_params.get('nombre'),
-            'apellido': request.query_params.get('apellido'),
-            'grupo_id': request.query_params.get('grupo_id'),
-            'sexo': request.query_params.get('sexo'),
-            'edad_min': request.query_params.get('edad_min'),
-            'edad_max': request.query_params.get('edad_max'),
-        }
-        criterios = {k: v for k, v in criterios.items() if v is not None}
-        
-        if criterios:
-            return AtletaService.buscar_atletas(criterios)
-        
+        criterios = self._criterios(request)
+        page, page_size, cursor = get_pagination_params(request)
         activos_solo = request.query_params.get('activos', 'true').lower() == 'true'
-        return AtletaService.listar_atletas(activos_solo)
+        return AtletaService.paginar_atletas(page, page_size, activos_solo, criterios, cursor=cursor)
     
     @swagger_auto_schema(
         operation_description="Crear un nuevo atleta",
@@ -87,29 +211,32 @@ class AtletaViewSet(viewsets.ViewSet):
     
     @swagger_auto_schema(
         operation_description="Obtener un atleta por ID",
-        responses={200: AtletaSerializer, 404: "Atleta no encontrado"}
+        manual_parameters=[IF_NONE_MATCH_PARAMETER],
+        responses={200: AtletaSerializer, 304: "Sin cambios", 404: "Atleta no encontrado"}
     )
     def retrieve(self, request, pk=None):
         """Obtener un atleta por ID"""
-        return AtletaService.obtener_atleta(int(pk))
+        return AtletaService.obtener_atleta(int(pk), request)
     
     @swagger_auto_schema(
         operation_description="Actualizar un atleta completamente",
         request_body=AtletaCreateSerializer,
-        responses={200: AtletaSerializer, 404: "Atleta no encontrado"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: AtletaSerializer, 404: "Atleta no encontrado", 412: "El recurso cambió (If-Match)"}
     )
     def update(self, request, pk=None):
         """Actualizar un atleta"""
-        return AtletaService.actualizar_atleta(int(pk), request.data)
+        return AtletaService.actualizar_atleta(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Actualizar parcialmente un atleta",
         request_body=AtletaCreateSerializer,
-        responses={200: AtletaSerializer, 404: "Atleta no encontrado"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: AtletaSerializer, 404: "Atleta no encontrado", 412: "El recurso cambió (If-Match)"}
     )
     def partial_update(self, request, pk=None):
         """Actualizar parcialmente un atleta"""
-        return AtletaService.actualizar_atleta(int(pk), request.data)
+        return AtletaService.actualizar_atleta(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Eliminar un atleta (soft delete por defecto)",
@@ -133,6 +260,25 @@ class AtletaViewSet(viewsets.ViewSet):
         """Obtener atleta por DNI"""
         return AtletaService.obtener_atleta_por_dni(dni)
     
+    @swagger_auto_schema(
+        operation_description="Buscar atletas por nombre, apellido o DNI (resultados ordenados por relevancia)",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True,
+                            description="Texto a buscar"),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                            description="Máximo de resultados (default: 20, máximo: API_MAX_PAGE_SIZE)"),
+        ],
+        responses={200: AtletaSerializer(many=True), 400: "Texto de búsqueda vacío"}
+    )
+    @action(detail=False, methods=['get'], url_path='buscar')
+    def buscar(self, request):
+        """Búsqueda de atletas por texto libre"""
+        texto = request.query_params.get('q', '').strip()
+        if not texto:
+            return APIResponse.error(message="Debe indicar el texto a buscar en 'q'")
+        limite = _parse_positive_int(request.query_params.get('limit'), 20)
+        return AtletaService.buscar_por_texto(texto, min(limite, settings.API_MAX_PAGE_SIZE))
+    
     @swagger_auto_schema(
         operation_description="Asignar atleta a un grupo",
         responses={200: AtletaSerializer, 404: "Atleta o grupo no encontrado"}
@@ -141,6 +287,56 @@ class AtletaViewSet(viewsets.ViewSet):
     def asignar_grupo(self, request, pk=None, grupo_id=None):
         """Asignar atleta a un grupo"""
         return AtletaService.asignar_grupo(int(pk), int(grupo_id))
+    
+    @swagger_auto_schema(
+        operation_description=(
+            "Perfil completo de un atleta: datos, grupo, inscripciones, última prueba "
+            "antropométrica y estadísticas físicas (reemplaza cinco llamadas)"
+        ),
+        responses={200: "Perfil del atleta", 404: "Atleta no encontrado"}
+    )
+    @action(detail=True, methods=['get'], url_path='perfil')
+    def perfil(self, request, pk=None):
+        """Perfil completo de un atleta"""
+        return AtletaService.obtener_perfil_atleta(int(pk))
+    
+    @swagger_auto_schema(
+        operation_description="Estadísticas físicas y última prueba antropométrica de varios atletas",
+        manual_parameters=[
+            openapi.Parameter('ids', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="IDs de atletas separados por coma (ej: 1,2,3)"),
+            openapi.Parameter('grupo_id', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                            description="Usar los atletas activos de un grupo"),
+        ],
+        responses={200: "Estadísticas por ID de atleta", 400: "Parámetros inválidos"}
+    )
+    @action(detail=False, methods=['get'], url_path='estadisticas')
+    def estadisticas(self, request):
+        """Obtener estadísticas de varios atletas en una sola petición"""
+        try:
+            parametros = get_estadisticas_params(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return AtletaService.obtener_estadisticas_lote(**parametros)
+    
+    @swagger_auto_schema(
+        operation_description="Exportar atletas activos en CSV o NDJSON (streaming). "
+                              "Acepta los mismos filtros que el listado",
+        manual_parameters=EXPORTACION_PARAMETERS,
+        responses={200: "Archivo CSV o NDJSON", 400: "Formato no soportado"}
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """Exportar atletas fila por fila"""
+        try:
+            formato = get_formato_exportacion(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return AtletaService.exportar_atletas(self._criterios(request), formato)
+    
+    def _criterios(self, request) -> dict:
+        """Criterios de búsqueda presentes en los query params"""
+        return get_criterios_atleta(request)
 
 
 class GrupoAtletaViewSet(viewsets.ViewSet):
@@ -157,17 +353,18 @@ class GrupoAtletaViewSet(viewsets.ViewSet):
                             description="Filtrar solo activos (default: true)"),
             openapi.Parameter('categoria', openapi.IN_QUERY, type=openapi.TYPE_STRING,
                             description="Filtrar por categoría"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: GrupoAtletaSerializer(many=True)}
     )
     def list(self, request):
         """Listar grupos con filtros opcionales"""
         categoria = request.query_params.get('categoria')
-        if categoria:
-            return GrupoAtletaService.buscar_grupos_por_categoria(categoria)
-        
+        page, page_size, cursor = get_pagination_params(request)
         activos_solo = request.query_params.get('activos', 'true').lower() == 'true'
-        return GrupoAtletaService.listar_grupos(activos_solo)
+        return GrupoAtletaService.paginar_grupos(
+            page, page_size, activos_solo, categoria, cursor=cursor, request=request
+        )
     
     @swagger_auto_schema(
         operation_description="Crear un nuevo grupo",
@@ -180,29 +377,32 @@ class GrupoAtletaViewSet(viewsets.ViewSet):
     
     @swagger_auto_schema(
         operation_description="Obtener un grupo por ID",
-        responses={200: GrupoAtletaSerializer, 404: "Grupo no encontrado"}
+        manual_parameters=[IF_NONE_MATCH_PARAMETER],
+        responses={200: GrupoAtletaSerializer, 304: "Sin cambios", 404: "Grupo no encontrado"}
     )
     def retrieve(self, request, pk=None):
         """Obtener un grupo por ID"""
-        return GrupoAtletaService.obtener_grupo(int(pk))
+        return GrupoAtletaService.obtener_grupo(int(pk), request)
     
     @swagger_auto_schema(
         operation_description="Actualizar un grupo completamente",
         request_body=GrupoAtletaSerializer,
-        responses={200: GrupoAtletaSerializer, 404: "Grupo no encontrado"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: GrupoAtletaSerializer, 404: "Grupo no encontrado", 412: "El recurso cambió (If-Match)"}
     )
     def update(self, request, pk=None):
         """Actualizar un grupo"""
-        return GrupoAtletaService.actualizar_grupo(int(pk), request.data)
+        return GrupoAtletaService.actualizar_grupo(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Actualizar parcialmente un grupo",
         request_body=GrupoAtletaSerializer,
-        responses={200: GrupoAtletaSerializer, 404: "Grupo no encontrado"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: GrupoAtletaSerializer, 404: "Grupo no encontrado", 412: "El recurso cambió (If-Match)"}
     )
     def partial_update(self, request, pk=None):
         """Actualizar parcialmente un grupo"""
-        return GrupoAtletaService.actualizar_grupo(int(pk), request.data)
+        return GrupoAtletaService.actualizar_grupo(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Eliminar un grupo",
@@ -263,32 +463,16 @@ class InscripcionViewSet(viewsets.ViewSet):
                             description="Fecha desde (YYYY-MM-DD)"),
             openapi.Parameter('fecha_hasta', openapi.IN_QUERY, type=openapi.TYPE_STRING,
                             description="Fecha hasta (YYYY-MM-DD)"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: InscripcionSerializer(many=True)}
     )
     def list(self, request):
         """Listar inscripciones con filtros opcionales"""
-        # Verificar filtros específicos
-        habilitada = request.query_params.get('habilitada')
-        if habilitada is not None:
-            if habilitada.lower() == 'true':
-                return InscripcionService.listar_inscripciones_habilitadas()
-            elif habilitada.lower() == 'false':
-                return InscripcionService.listar_inscripciones_pendientes()
-        
-        # Buscar por criterios si hay parámetros
-        criterios = {
-            'tipo_inscripcion': request.query_params.get('tipo'),
-            'fecha_desde': request.query_params.get('fecha_desde'),
-            'fecha_hasta': request.query_params.get('fecha_hasta'),
-            'atleta_id': request.query_params.get('atleta_id'),
-        }
-        criterios = {k: v for k, v in criterios.items() if v is not None}
-        
-        if criterios:
-            return InscripcionService.buscar_inscripciones(criterios)
-        
-        return InscripcionService.listar_inscripciones()
+        page, page_size, cursor = get_pagination_params(request)
+        return InscripcionService.paginar_inscripciones(
+            page, page_size, self._criterios(request), cursor=cursor
+        )
     
     @swagger_auto_schema(
         operation_description="Crear una nueva inscripción",
@@ -301,29 +485,32 @@ class InscripcionViewSet(viewsets.ViewSet):
     
     @swagger_auto_schema(
         operation_description="Obtener una inscripción por ID",
-        responses={200: InscripcionSerializer, 404: "Inscripción no encontrada"}
+        manual_parameters=[IF_NONE_MATCH_PARAMETER],
+        responses={200: InscripcionSerializer, 304: "Sin cambios", 404: "Inscripción no encontrada"}
     )
     def retrieve(self, request, pk=None):
         """Obtener una inscripción por ID"""
-        return InscripcionService.obtener_inscripcion(int(pk))
+        return InscripcionService.obtener_inscripcion(int(pk), request)
     
     @swagger_auto_schema(
         operation_description="Actualizar una inscripción",
         request_body=InscripcionSerializer,
-        responses={200: InscripcionSerializer, 404: "Inscripción no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: InscripcionSerializer, 404: "Inscripción no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def update(self, request, pk=None):
         """Actualizar una inscripción"""
-        return InscripcionService.actualizar_inscripcion(int(pk), request.data)
+        return InscripcionService.actualizar_inscripcion(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Actualizar parcialmente una inscripción",
         request_body=InscripcionSerializer,
-        responses={200: InscripcionSerializer, 404: "Inscripción no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: InscripcionSerializer, 404: "Inscripción no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def partial_update(self, request, pk=None):
         """Actualizar parcialmente una inscripción"""
-        return InscripcionService.actualizar_inscripcion(int(pk), request.data)
+        return InscripcionService.actualizar_inscripcion(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Eliminar una inscripción",
@@ -359,6 +546,37 @@ class InscripcionViewSet(viewsets.ViewSet):
     def por_atleta(self, request, atleta_id=None):
         """Obtener inscripciones de un atleta"""
         return InscripcionService.obtener_inscripciones_atleta(int(atleta_id))
+    
+    @swagger_auto_schema(
+        operation_description="Exportar inscripciones en CSV o NDJSON (streaming). "
+                              "Acepta los mismos filtros que el listado",
+        manual_parameters=EXPORTACION_PARAMETERS,
+        responses={200: "Archivo CSV o NDJSON", 400: "Formato no soportado"}
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """Exportar inscripciones fila por fila"""
+        try:
+            formato = get_formato_exportacion(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return InscripcionService.exportar_inscripciones(self._criterios(request), formato)
+    
+    def _criterios(self, request) -> dict:
+        """Criterios de búsqueda presentes en los query params"""
+        criterios = {
+            'tipo_inscripcion': request.query_params.get('tipo'),
+            'fecha_desde': request.query_params.get('fecha_desde'),
+            'fecha_hasta': request.query_params.get('fecha_hasta'),
+            'atleta_id': request.query_params.get('atleta_id'),
+        }
+        criterios = {k: v for k, v in criterios.items() if v is not None}
+        
+        # Filtro por estado habilitada/pendiente
+        habilitada = request.query_params.get('habilitada')
+        if habilitada is not None and habilitada.lower() in ('true', 'false'):
+            criterios['habilitada'] = habilitada.lower() == 'true'
+        return criterios
 
 
 class PruebaAntropometricaViewSet(viewsets.ViewSet):
@@ -381,25 +599,18 @@ class PruebaAntropometricaViewSet(viewsets.ViewSet):
                             description="IMC mínimo"),
             openapi.Parameter('imc_max', openapi.IN_QUERY, type=openapi.TYPE_NUMBER,
                             description="IMC máximo"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: PruebaAntropometricaSerializer(many=True)}
     )
     def list(self, request):
         """Listar pruebas antropométricas con filtros opcionales"""
-        criterios = {
-            'atleta_id': request.query_params.get('atleta_id'),
-            'fecha_desde': request.query_params.get('fecha_desde'),
-            'fecha_hasta': request.query_params.get('fecha_hasta'),
-            'imc_min': request.query_params.get('imc_min'),
-            'imc_max': request.query_params.get('imc_max'),
-        }
-        criterios = {k: v for k, v in criterios.items() if v is not None}
-        
-        if criterios:
-            return PruebaAntropometricaService.buscar_pruebas(criterios)
-        
+        criterios = self._criterios(request)
+        page, page_size, cursor = get_pagination_params(request)
         activas_solo = request.query_params.get('activas', 'true').lower() == 'true'
-        return PruebaAntropometricaService.listar_pruebas(activas_solo)
+        return PruebaAntropometricaService.paginar_pruebas(
+            page, page_size, activas_solo, criterios, cursor=cursor
+        )
     
     @swagger_auto_schema(
         operation_description="Crear una nueva prueba antropométrica",
@@ -412,29 +623,32 @@ class PruebaAntropometricaViewSet(viewsets.ViewSet):
     
     @swagger_auto_schema(
         operation_description="Obtener una prueba antropométrica por ID",
-        responses={200: PruebaAntropometricaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_NONE_MATCH_PARAMETER],
+        responses={200: PruebaAntropometricaSerializer, 304: "Sin cambios", 404: "Prueba no encontrada"}
     )
     def retrieve(self, request, pk=None):
         """Obtener una prueba por ID"""
-        return PruebaAntropometricaService.obtener_prueba(int(pk))
+        return PruebaAntropometricaService.obtener_prueba(int(pk), request)
     
     @swagger_auto_schema(
         operation_description="Actualizar una prueba antropométrica",
         request_body=PruebaAntropometricaSerializer,
-        responses={200: PruebaAntropometricaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: PruebaAntropometricaSerializer, 404: "Prueba no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def update(self, request, pk=None):
         """Actualizar una prueba"""
-        return PruebaAntropometricaService.actualizar_prueba(int(pk), request.data)
+        return PruebaAntropometricaService.actualizar_prueba(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Actualizar parcialmente una prueba antropométrica",
         request_body=PruebaAntropometricaSerializer,
-        responses={200: PruebaAntropometricaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: PruebaAntropometricaSerializer, 404: "Prueba no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def partial_update(self, request, pk=None):
         """Actualizar parcialmente una prueba"""
-        return PruebaAntropometricaService.actualizar_prueba(int(pk), request.data)
+        return PruebaAntropometricaService.actualizar_prueba(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Eliminar una prueba antropométrica",
@@ -475,6 +689,47 @@ class PruebaAntropometricaViewSet(viewsets.ViewSet):
     def comparar(self, request, prueba_id_1=None, prueba_id_2=None):
         """Comparar dos pruebas"""
         return PruebaAntropometricaService.comparar_pruebas(int(prueba_id_1), int(prueba_id_2))
+    
+    @swagger_auto_schema(
+        operation_description="Cargar pruebas antropométricas en lote desde un CSV/XLSX o un arreglo JSON",
+        request_body=CARGA_MASIVA_BODY,
+        responses={201: "Reporte de la carga por fila", 400: "Archivo inválido o ninguna fila válida"}
+    )
+    @action(detail=False, methods=['post'], url_path='carga-masiva',
+            parser_classes=[MultiPartParser, FastJSONParser])
+    def carga_masiva(self, request):
+        """Cargar varias pruebas en una sola petición"""
+        try:
+            filas = get_filas_carga(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return PruebaAntropometricaService.cargar_pruebas(filas)
+    
+    @swagger_auto_schema(
+        operation_description="Exportar pruebas antropométricas activas en CSV o NDJSON (streaming). "
+                              "Acepta los mismos filtros que el listado",
+        manual_parameters=EXPORTACION_PARAMETERS,
+        responses={200: "Archivo CSV o NDJSON", 400: "Formato no soportado"}
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """Exportar pruebas fila por fila"""
+        try:
+            formato = get_formato_exportacion(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return PruebaAntropometricaService.exportar_pruebas(self._criterios(request), formato)
+    
+    def _criterios(self, request) -> dict:
+        """Criterios de búsqueda presentes en los query params"""
+        criterios = {
+            'atleta_id': request.query_params.get('atleta_id'),
+            'fecha_desde': request.query_params.get('fecha_desde'),
+            'fecha_hasta': request.query_params.get('fecha_hasta'),
+            'imc_min': request.query_params.get('imc_min'),
+            'imc_max': request.query_params.get('imc_max'),
+        }
+        return {k: v for k, v in criterios.items() if v is not None}
 
 
 class PruebaFisicaViewSet(viewsets.ViewSet):
@@ -495,26 +750,18 @@ class PruebaFisicaViewSet(viewsets.ViewSet):
                             description="Fecha desde (YYYY-MM-DD)"),
             openapi.Parameter('fecha_hasta', openapi.IN_QUERY, type=openapi.TYPE_STRING,
                             description="Fecha hasta (YYYY-MM-DD)"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: PruebaFisicaSerializer(many=True)}
     )
     def list(self, request):
         """Listar pruebas físicas con filtros opcionales"""
-        criterios = {
-            'atleta_id': request.query_params.get('atleta_id'),
-            'tipo_prueba': request.query_params.get('tipo'),
-            'fecha_desde': request.query_params.get('fecha_desde'),
-            'fecha_hasta': request.query_params.get('fecha_hasta'),
-            'resultado_min': request.query_params.get('resultado_min'),
-            'resultado_max': request.query_params.get('resultado_max'),
-        }
-        criterios = {k: v for k, v in criterios.items() if v is not None}
-        
-        if criterios:
-            return PruebaFisicaService.buscar_pruebas(criterios)
-        
+        criterios = self._criterios(request)
+        page, page_size, cursor = get_pagination_params(request)
         activas_solo = request.query_params.get('activas', 'true').lower() == 'true'
-        return PruebaFisicaService.listar_pruebas(activas_solo)
+        return PruebaFisicaService.paginar_pruebas(
+            page, page_size, activas_solo, criterios, cursor=cursor
+        )
     
     @swagger_auto_schema(
         operation_description="Crear una nueva prueba física",
@@ -527,29 +774,32 @@ class PruebaFisicaViewSet(viewsets.ViewSet):
     
     @swagger_auto_schema(
         operation_description="Obtener una prueba física por ID",
-        responses={200: PruebaFisicaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_NONE_MATCH_PARAMETER],
+        responses={200: PruebaFisicaSerializer, 304: "Sin cambios", 404: "Prueba no encontrada"}
     )
     def retrieve(self, request, pk=None):
         """Obtener una prueba por ID"""
-        return PruebaFisicaService.obtener_prueba(int(pk))
+        return PruebaFisicaService.obtener_prueba(int(pk), request)
     
     @swagger_auto_schema(
         operation_description="Actualizar una prueba física",
         request_body=PruebaFisicaSerializer,
-        responses={200: PruebaFisicaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: PruebaFisicaSerializer, 404: "Prueba no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def update(self, request, pk=None):
         """Actualizar una prueba"""
-        return PruebaFisicaService.actualizar_prueba(int(pk), request.data)
+        return PruebaFisicaService.actualizar_prueba(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Actualizar parcialmente una prueba física",
         request_body=PruebaFisicaSerializer,
-        responses={200: PruebaFisicaSerializer, 404: "Prueba no encontrada"}
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={200: PruebaFisicaSerializer, 404: "Prueba no encontrada", 412: "El recurso cambió (If-Match)"}
     )
     def partial_update(self, request, pk=None):
         """Actualizar parcialmente una prueba"""
-        return PruebaFisicaService.actualizar_prueba(int(pk), request.data)
+        return PruebaFisicaService.actualizar_prueba(int(pk), request.data, request)
     
     @swagger_auto_schema(
         operation_description="Eliminar una prueba física",
@@ -571,7 +821,7 @@ class PruebaFisicaViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'], url_path='tipos')
     def tipos(self, request):
         """Obtener tipos de prueba disponibles"""
-        return PruebaFisicaService.obtener_tipos_prueba()
+        return PruebaFisicaService.obtener_tipos_prueba(request)
     
     @swagger_auto_schema(
         operation_description="Obtener pruebas de un atleta",
@@ -582,6 +832,39 @@ class PruebaFisicaViewSet(viewsets.ViewSet):
         """Obtener pruebas de un atleta"""
         return PruebaFisicaService.obtener_pruebas_atleta(int(atleta_id))
     
+    @swagger_auto_schema(
+        operation_description="Ranking de un tipo de prueba: mejor resultado de cada atleta activo, "
+                              "del mejor al peor (en pruebas de tiempo el menor es el mejor)",
+        manual_parameters=[
+            openapi.Parameter('tipo_prueba', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True,
+                            enum=TipoPrueba.values, description="Tipo de prueba"),
+            openapi.Parameter('grupo_id', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                            description="Filtrar por grupo"),
+            openapi.Parameter('sexo', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="Filtrar por sexo"),
+            openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                            description="Número de página (default: 1)"),
+            openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                            description="Tamaño de página (default: PAGE_SIZE, máximo: API_MAX_PAGE_SIZE)"),
+        ],
+        responses={200: RankingPruebaSerializer(many=True), 400: "Tipo de prueba o grupo inválido"}
+    )
+    @action(detail=False, methods=['get'], url_path='ranking')
+    def ranking(self, request):
+        """Ranking precalculado por tipo de prueba, grupo y sexo"""
+        tipo_prueba = request.query_params.get('tipo_prueba', '').upper()
+        if not tipo_prueba:
+            return APIResponse.error(message="Debe indicar el tipo de prueba en 'tipo_prueba'")
+        grupo_id = request.query_params.get('grupo_id')
+        try:
+            grupo_id = int(grupo_id) if grupo_id else None
+        except ValueError:
+            return APIResponse.error(message="grupo_id debe ser un número entero")
+        page, page_size, _ = get_pagination_params(request)
+        return PruebaFisicaService.obtener_ranking(
+            tipo_prueba, grupo_id, request.query_params.get('sexo'), page, page_size, request
+        )
+    
     @swagger_auto_schema(
         operation_description="Obtener pruebas de un atleta filtradas por tipo",
         responses={200: PruebaFisicaSerializer(many=True)}
@@ -608,6 +891,48 @@ class PruebaFisicaViewSet(viewsets.ViewSet):
     def comparar(self, request, prueba_id_1=None, prueba_id_2=None):
         """Comparar dos pruebas"""
         return PruebaFisicaService.comparar_pruebas(int(prueba_id_1), int(prueba_id_2))
+    
+    @swagger_auto_schema(
+        operation_description="Cargar pruebas físicas en lote desde un CSV/XLSX o un arreglo JSON",
+        request_body=CARGA_MASIVA_BODY,
+        responses={201: "Reporte de la carga por fila", 400: "Archivo inválido o ninguna fila válida"}
+    )
+    @action(detail=False, methods=['post'], url_path='carga-masiva',
+            parser_classes=[MultiPartParser, FastJSONParser])
+    def carga_masiva(self, request):
+        """Cargar varias pruebas en una sola petición"""
+        try:
+            filas = get_filas_carga(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return PruebaFisicaService.cargar_pruebas(filas)
+    
+    @swagger_auto_schema(
+        operation_description="Exportar pruebas físicas activas en CSV o NDJSON (streaming). "
+                              "Acepta los mismos filtros que el listado",
+        manual_parameters=EXPORTACION_PARAMETERS,
+        responses={200: "Archivo CSV o NDJSON", 400: "Formato no soportado"}
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """Exportar pruebas fila por fila"""
+        try:
+            formato = get_formato_exportacion(request)
+        except ValueError as e:
+            return APIResponse.error(message=str(e))
+        return PruebaFisicaService.exportar_pruebas(self._criterios(request), formato)
+    
+    def _criterios(self, request) -> dict:
+        """Criterios de búsqueda presentes en los query params"""
+        criterios = {
+            'atleta_id': request.query_params.get('atleta_id'),
+            'tipo_prueba': request.query_params.get('tipo'),
+            'fecha_desde': request.query_params.get('fecha_desde'),
+            'fecha_hasta': request.query_params.get('fecha_hasta'),
+            'resultado_min': request.query_params.get('resultado_min'),
+            'resultado_max': request.query_params.get('resultado_max'),
+        }
+        return {k: v for k, v in criterios.items() if v is not None}
 
 
 class EntrenadorViewSet(viewsets.ViewSet):
@@ -626,6 +951,7 @@ class EntrenadorViewSet(viewsets.ViewSet):
                             description="Filtrar por nombre"),
             openapi.Parameter('usuario_id', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
                             description="Buscar por ID de usuario"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: EntrenadorSerializer(many=True)}
     )
@@ -643,10 +969,8 @@ class EntrenadorViewSet(viewsets.ViewSet):
         }
         criterios = {k: v for k, v in criterios.items() if v is not None}
         
-        if criterios:
-            return EntrenadorService.buscar_entrenadores(criterios)
-        
-        return EntrenadorService.listar_entrenadores()
+        page, page_size, cursor = get_pagination_params(request)
+        return EntrenadorService.paginar_entrenadores(page, page_size, criterios, cursor=cursor)
     
     @swagger_auto_schema(
         operation_description="Crear un nuevo entrenador",
@@ -735,6 +1059,7 @@ class EstudianteVinculacionViewSet(viewsets.ViewSet):
                             description="Filtrar por nombre"),
             openapi.Parameter('usuario_id', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
                             description="Buscar por ID de usuario"),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: EstudianteVinculacionSerializer(many=True)}
     )
@@ -752,10 +1077,8 @@ class EstudianteVinculacionViewSet(viewsets.ViewSet):
         }
         criterios = {k: v for k, v in criterios.items() if v is not None}
         
-        if criterios:
-            return EstudianteVinculacionService.buscar_estudiantes(criterios)
-        
-        return EstudianteVinculacionService.listar_estudiantes()
+        page, page_size, cursor = get_pagination_params(request)
+        return EstudianteVinculacionService.paginar_estudiantes(page, page_size, criterios, cursor=cursor)
     
     @swagger_auto_schema(
         operation_description="Crear un nuevo estudiante de vinculación",
@@ -799,3 +1122,50 @@ class EstudianteVinculacionViewSet(viewsets.ViewSet):
     def destroy(self, request, pk=None):
         """Eliminar un estudiante"""
         return EstudianteVinculacionService.eliminar_estudiante(int(pk))
+
+
+# ==================== VISTAS ASÍNCRONAS ====================
+#
+# DRF no ejecuta vistas asíncronas: estas son vistas de Django con las mismas
+# respuestas que los endpoints de lectura de atletas. Bajo ASGI no ocupan un
+# hilo por petición; con WSGI Django las ejecuta de forma síncrona.
+
+METODOS_LECTURA = ('GET', 'HEAD')
+
+
+def _respuesta_django(response: Response) -> Response:
+    """Preparar una Response de DRF para devolverla fuera de un APIView"""
+    renderer = FastJSONRenderer()
+    response.accepted_renderer = renderer
+    response.accepted_media_type = renderer.media_type
+    response.renderer_context = {}
+    return response
+
+
+async def atletas_async(request):
+    """Listado paginado de atletas (mismos parámetros que GET /atletas/)"""
+    if request.method not in METODOS_LECTURA:
+        return HttpResponseNotAllowed(METODOS_LECTURA)
+    page, page_size, cursor = get_pagination_params(request)
+    activos_solo = request.GET.get('activos', 'true').lower() == 'true'
+    return _respuesta_django(await AtletaService.apaginar_atletas(
+        page, page_size, activos_solo, get_criterios_atleta(request), cursor=cursor
+    ))
+
+
+async def atleta_async(request, pk: int):
+    """Detalle de un atleta, con ETag (mismas cabeceras que GET /atletas/{id}/)"""
+    if request.method not in METODOS_LECTURA:
+        return HttpResponseNotAllowed(METODOS_LECTURA)
+    return _respuesta_django(await AtletaService.aobtener_atleta(pk, request))
+
+
+async def atletas_estadisticas_async(request):
+    """Estadísticas de varios atletas (mismos parámetros que GET /atletas/estadisticas/)"""
+    if request.method not in METODOS_LECTURA:
+        return HttpResponseNotAllowed(METODOS_LECTURA)
+    try:
+        parametros = get_estadisticas_params(request)
+    except ValueError as e:
+        return _respuesta_django(APIResponse.error(message=str(e)))
+    return _respuesta_django(await AtletaService.aobtener_estadisticas_lote(**parametros))
@@ -0,0 +1,4 @@
+"""
+Backend PostgreSQL con pool de conexiones
+Uso: DATABASES[alias]['ENGINE'] = 'basketball_project.db_pool'
+"""
@@ -0,0 +1,68 @@
+"""
+Backend PostgreSQL que toma las conexiones de un ConnectionPool.
+
+Se configura como el backend nativo de Django 5.1, con
+``OPTIONS['pool'] = {'min_size': ..., 'max_size': ..., ...}`` y
+``CONN_MAX_AGE = 0``: al terminar cada petición la conexión vuelve al pool en
+lugar de cerrarse.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base as postgresql
+from django.utils.asyncio import async_unsafe
+
+from basketball.controllers.connection import ConnectionPool, get_pool
+
+
+def _check(conn) -> bool:
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    if not conn.autocommit:
+        conn.rollback()
+    return True
+
+
+def _reset(conn) -> None:
+    # Descarta una transacción que haya quedado abierta (no-op en autocommit)
+    conn.rollback()
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """DatabaseWrapper de PostgreSQL con pool de conexiones por proceso"""
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    @property
+    def pool(self):
+        opciones = self.settings_dict['OPTIONS'].get('pool')
+        if not opciones:
+            return None
+        if self.settings_dict['CONN_MAX_AGE'] != 0:
+            raise ImproperlyConfigured('El pool de conexiones requiere CONN_MAX_AGE = 0')
+        if opciones is True:
+            opciones = {}
+
+        conn_params = self.get_connection_params()
+        conectar = postgresql.DatabaseWrapper.get_new_connection
+        config = (repr(sorted(conn_params.items())), repr(sorted(opciones.items())))
+        return get_pool(self.alias, lambda: ConnectionPool(
+            lambda: conectar(self, conn_params), check=_check, reset=_reset, **opciones
+        ), config=config)
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        return pool.getconn()
+
+    @async_unsafe
+    def _close(self):
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+        descartar = self.errors_occurred and not self.is_usable()
+        pool.putconn(self.connection, discard=descartar)
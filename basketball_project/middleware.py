@@ -0,0 +1,156 @@
+"""
+Middleware de instrumentación de consultas SQL y de enrutamiento a réplicas por petición
+"""
+
+import json
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from basketball.dao.routing import request_scope
+
+logger = logging.getLogger(__name__)
+
+# Longitud máxima de cada sentencia SQL incluida en el log
+MAX_SQL_LENGTH = 500
+
+
+class QueryRecorder:
+    """Wrapper para connection.execute_wrapper que acumula conteo y tiempo de las consultas"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            self.statements.append((elapsed, sql))
+
+    def slowest(self, limit: int) -> list:
+        """Las sentencias más lentas, de mayor a menor duración"""
+        statements = sorted(self.statements, key=lambda item: item[0], reverse=True)
+        return [
+            {'ms': round(elapsed * 1000, 2), 'sql': sql[:MAX_SQL_LENGTH]}
+            for elapsed, sql in statements[:limit]
+        ]
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Mide las consultas SQL de cada petición.
+
+    Con QUERY_INSTRUMENTATION_ENABLED activo agrega la cabecera Server-Timing
+    (tiempo en base de datos y total) y escribe una línea de log JSON por
+    petición con el conteo, el tiempo SQL y las sentencias más lentas. Si
+    QUERY_BUDGET es mayor que cero, las peticiones que lo superan se registran
+    como warning y se marcan con la cabecera X-Query-Budget-Exceeded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', False):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with self.recording(recorder):
+            response = self.get_response(request)
+        return self.finish(request, response, recorder, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', False):
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        # Las conexiones son locales al hilo: el ORM asíncrono consulta desde el
+        # hilo de sync_to_async de la petición, así que los wrappers se instalan ahí
+        stack = await sync_to_async(self.recording)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, recorder, time.perf_counter() - start)
+
+    def recording(self, recorder: QueryRecorder) -> ExitStack:
+        """Registrar las consultas de todas las conexiones mientras dure el bloque"""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def finish(self, request, response, recorder: QueryRecorder, total: float):
+        """Agregar las cabeceras de tiempos y escribir la línea de log de la petición"""
+        response['Server-Timing'] = (
+            f'db;dur={recorder.duration * 1000:.2f};desc="{recorder.count} queries", '
+            f'total;dur={total * 1000:.2f}'
+        )
+
+        budget = getattr(settings, 'QUERY_BUDGET', 0)
+        over_budget = bool(budget) and recorder.count > budget
+        if over_budget:
+            response['X-Query-Budget-Exceeded'] = f'{recorder.count}/{budget}'
+
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': recorder.count,
+            'sql_ms': round(recorder.duration * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+            'slowest': recorder.slowest(getattr(settings, 'QUERY_SLOWEST_COUNT', 3)),
+        }
+        if over_budget:
+            record['query_budget'] = budget
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Ámbito de enrutamiento a réplicas de cada petición.
+
+    Las lecturas de la petición van a las réplicas (si ReplicaRouter está
+    activo) hasta su primera escritura; desde ahí van al primario para que la
+    petición lea lo que acaba de escribir.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with request_scope():
+            return await self.get_response(request)
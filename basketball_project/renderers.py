@@ -0,0 +1,101 @@
+"""
+Renderer y parser JSON de alto rendimiento para la API
+"""
+
+import datetime
+import decimal
+import json
+
+from django.conf import settings
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa el módulo json estándar
+    orjson = None
+
+# U+2028 y U+2029 se escapan, como en JSONRenderer, para que la salida sea JavaScript válido
+_SEPARADORES_LINEA = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+def _default(obj):
+    """Tipos que orjson no serializa de forma nativa, con la misma salida que el encoder de DRF"""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError
+
+
+def dumps(data, sort_keys: bool = False) -> bytes:
+    """
+    Serializar a JSON compacto en UTF-8 con orjson, o con json si no está instalado.
+
+    Fechas, Decimals y TextChoices se representan igual que con el
+    JSONRenderer de DRF.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, default=_default, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            # Casos límite (enteros de más de 64 bits, claves no soportadas)
+            pass
+    return json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False,
+        separators=(',', ':'), sort_keys=sort_keys
+    ).encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer basado en orjson.
+
+    Produce el mismo JSON compacto que el renderer de DRF. Las peticiones con
+    indentación (``Accept: application/json; indent=4``) usan el renderer
+    estándar.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = dumps(data)
+        if b'\xe2\x80' in ret:
+            for separador, escapado in _SEPARADORES_LINEA:
+                ret = ret.replace(separador, escapado)
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser basado en orjson (mismas reglas: NaN e Infinity no son válidos)"""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
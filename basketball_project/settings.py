@@ -36,6 +36,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'basketball_project.middleware.QueryInstrumentationMiddleware',
+    'basketball_project.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -75,9 +77,55 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='postgres'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        # Conexiones persistentes: segundos que se reutiliza cada conexión (0 = una por petición)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        # Verificar la conexión persistente al reutilizarla en una nueva petición
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
     }
 }
 
+# Pool de conexiones por proceso (reemplaza las conexiones persistentes)
+if config('DB_POOL', default=False, cast=bool):
+    DATABASES['default'].update({
+        'ENGINE': 'basketball_project.db_pool',
+        'CONN_MAX_AGE': 0,
+        'OPTIONS': {
+            'pool': {
+                'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+                'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                # Segundos de espera por una conexión libre antes de fallar
+                'timeout': config('DB_POOL_TIMEOUT', default=30.0, cast=float),
+                # Segundos que una conexión puede estar ociosa antes de cerrarse
+                'max_idle': config('DB_POOL_MAX_IDLE', default=300.0, cast=float),
+                'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=3600.0, cast=float),
+            },
+        },
+    })
+
+# Réplicas de lectura: un alias replica1, replica2... por host, con la misma
+# configuración que 'default'. En los tests usan la base de 'default'
+DATABASE_REPLICAS = []
+for numero, host in enumerate(config('DB_REPLICA_HOSTS', default='', cast=Csv()), start=1):
+    alias = f'replica{numero}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'OPTIONS': dict(DATABASES['default'].get('OPTIONS', {})),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['basketball.dao.routing.ReplicaRouter'] if DATABASE_REPLICAS else []
+
+# Segundos de retraso a partir de los que una réplica deja de recibir lecturas
+REPLICA_MAX_LAG = config('DB_REPLICA_MAX_LAG', default=5.0, cast=float)
+
+# Segundos entre mediciones del retraso de cada réplica
+REPLICA_LAG_CHECK_INTERVAL = config('DB_REPLICA_LAG_CHECK_INTERVAL', default=5.0, cast=float)
+
+# Hilos para ejecutar a la vez las consultas independientes de un endpoint (1 = en serie)
+PARALLEL_QUERY_WORKERS = config('DB_PARALLEL_QUERY_WORKERS', default=4, cast=int)
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -119,19 +167,73 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
+    # JSON con orjson (o json estándar si no está instalado), ver basketball_project/renderers.py
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'basketball_project.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'basketball_project.renderers.FastJSONParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
 }
 
+# Tamaño máximo de página permitido en los endpoints de listado
+API_MAX_PAGE_SIZE = config('API_MAX_PAGE_SIZE', default=100, cast=int)
+
+# Máximo de filas por petición en las cargas masivas de pruebas
+BULK_UPLOAD_MAX_ROWS = config('BULK_UPLOAD_MAX_ROWS', default=5000, cast=int)
+# Filas leídas por bloque del cursor en las exportaciones en streaming
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+# Caché de lectura de los DAOs: 'none' (desactivada), 'lru' (memoria del proceso) o
+# 'django' (CACHES). 'lru' solo sirve con un único proceso: con varios workers cada
+# uno guarda su copia y las escrituras de otro no la invalidan. En despliegues con
+# varios procesos use 'django' con una caché compartida (por ejemplo Redis)
+DAO_CACHE_BACKEND = config('DAO_CACHE_BACKEND', default='none')
+# Segundos que vive cada entrada de la caché de DAOs
+DAO_CACHE_TTL = config('DAO_CACHE_TTL', default=60, cast=int)
+# Máximo de entradas de la caché LRU local
+DAO_CACHE_MAX_SIZE = config('DAO_CACHE_MAX_SIZE', default=10000, cast=int)
+# Alias de CACHES usado por el backend 'django' (por ejemplo un RedisCache)
+DAO_CACHE_ALIAS = config('DAO_CACHE_ALIAS', default='default')
+# Segundos que se guarda en el servidor cada respuesta cacheada (0 = solo ETag, sin almacenar).
+# Requiere que RESPONSE_CACHE_ALIAS sea una caché compartida entre procesos (por ejemplo
+# Redis): con la LocMemCache por defecto cada proceso tendría sus propias versiones de
+# los modelos y serviría datos viejos, así que no se almacena nada ni se envía Last-Modified
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=0, cast=int)
+# Max-age de Cache-Control para las respuestas cacheadas que no definen uno (0 = revalidar siempre)
+RESPONSE_CACHE_MAX_AGE = config('RESPONSE_CACHE_MAX_AGE', default=0, cast=int)
+# Alias de CACHES (compartida entre procesos) donde se guardan las respuestas y las
+# versiones de los modelos
+RESPONSE_CACHE_ALIAS = config('RESPONSE_CACHE_ALIAS', default='default')
+
 # CORS Configuration
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
 ]
+
+# Instrumentación de consultas SQL por petición (cabecera Server-Timing + log JSON)
+QUERY_INSTRUMENTATION_ENABLED = config('QUERY_INSTRUMENTATION_ENABLED', default=DEBUG, cast=bool)
+# Máximo de consultas por petición antes de registrar un warning (0 = sin límite)
+QUERY_BUDGET = config('QUERY_BUDGET', default=0, cast=int)
+# Cantidad de sentencias más lentas incluidas en el log
+QUERY_SLOWEST_COUNT = config('QUERY_SLOWEST_COUNT', default=3, cast=int)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'basketball_project.middleware': {
+            'handlers': ['console'],
+            'level': config('QUERY_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
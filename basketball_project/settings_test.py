@@ -9,9 +9,19 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'test_db.sqlite3',
-    }
+    },
+    # Réplica de lectura sobre la misma base, para los tests de enrutamiento
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test_db.sqlite3',
+        'TEST': {'MIRROR': 'default'},
+    },
 }
 
+# Router de réplicas desactivado salvo en los tests que lo activan
+DATABASE_REPLICAS = ['replica']
+DATABASE_ROUTERS = []
+
 # Disable password hashing for faster tests
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
@@ -19,3 +29,12 @@ PASSWORD_HASHERS = [
 
 # Use simpler email backend
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# Instrumentación de consultas desactivada salvo en los tests que la activan
+QUERY_INSTRUMENTATION_ENABLED = False
+
+# Caché de DAOs desactivada salvo en los tests que la activan
+DAO_CACHE_BACKEND = 'none'
+
+# Respuestas sin almacenamiento en el servidor salvo en los tests que lo activan
+RESPONSE_CACHE_TIMEOUT = 0
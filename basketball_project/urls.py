@@ -3,12 +3,18 @@ URL configuration for basketball_project project.
 """
 from django.contrib import admin
 from django.urls import path, include, re_path
+from django.utils.cache import patch_cache_control
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework import status, permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from basketball.controllers.connection import ConnectionManager, DatabaseConnection
+from basketball.dao.routing import monitor as replica_monitor
+from basketball.services.api_response import APIResponse
+from basketball.services.cache_respuestas import MAX_AGE_ESTATICO
+
 
 # Configuración de Swagger/OpenAPI
 schema_view = get_schema_view(
@@ -28,7 +34,7 @@ schema_view = get_schema_view(
 @api_view(['GET'])
 def api_root(request):
     """Vista raíz de la API"""
-    return Response({
+    return APIResponse.cached(request, lambda: Response({
         "status": "success",
         "message": "Bienvenido a la API del Módulo de Basketball",
         "version": "1.0.0",
@@ -41,17 +47,25 @@ def api_root(request):
             "entrenadores": "/api/v1/entrenadores/",
             "estudiantes_vinculacion": "/api/v1/estudiantes-vinculacion/",
         }
-    }, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK), max_age=MAX_AGE_ESTATICO)
 
 
 @api_view(['GET'])
 def health_check(request):
-    """Vista para verificar el estado del servicio"""
-    return Response({
-        "status": "healthy",
+    """Vista para verificar el estado del servicio y de las conexiones a la base de datos"""
+    conectado = DatabaseConnection.check_connection()['status'] == 'connected'
+    response = Response({
+        "status": "healthy" if conectado else "unhealthy",
         "service": "Basketball Module API",
-        "version": "1.0.0"
-    }, status=status.HTTP_200_OK)
+        "version": "1.0.0",
+        "database": {
+            "status": "connected" if conectado else "disconnected",
+            "connections": ConnectionManager.pool_stats(),
+            "replicas": replica_monitor.stats(),
+        },
+    }, status=status.HTTP_200_OK if conectado else status.HTTP_503_SERVICE_UNAVAILABLE)
+    patch_cache_control(response, no_store=True)
+    return response
 
 
 urlpatterns = [